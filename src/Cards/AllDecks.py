@@ -3,7 +3,8 @@ from Cards.MagicMissive import MagicMissive
 from Cards.ThanosSnapCard import ThanosSnapCard
 from Cards.CollapseBarrier import CollapseBarrier
 from SpriteUtil.SpriteUtil import SpriteUtil
-import random
+from Utils.RandomService import RandomService
+from Utils.FontRegistry import FontRegistry
 import pygame
 from abc import ABC, abstractmethod
 
@@ -34,7 +35,8 @@ class AllDecks(ABC):
         for _ in range(0, self.max_cards):
             all_cards = list(self.POSSIBLE_CARDS.keys())
             weights = list(self.POSSIBLE_CARDS.values())
-            card_class = random.choice(random.choices(all_cards, weights=weights, k=1))
+            rng = RandomService.get_instance().stream('deck')
+            card_class = rng.choice(rng.choices(all_cards, weights=weights, k=1))
             self.add_card(card_class(self.screen))
 
     def add_card(self, card):
@@ -56,8 +58,7 @@ class AllDecks(ABC):
         
         # Display card count on top of the deck
         card_count = len(self.cards_in_deck)
-        font = pygame.font.SysFont('Arial', 18, bold=True)
-        count_text = font.render(f"{card_count}", True, (255, 255, 255))
+        count_text = FontRegistry.get_instance().render(f"{card_count}", 18, (255, 255, 255), bold=True)
         
         # Create a small background for the text
         text_bg = pygame.Surface((count_text.get_width() + 10, count_text.get_height() + 6), pygame.SRCALPHA)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from SpriteUtil.SpriteUtil import SpriteUtil
+from QuantumMechanics.CollapseWorker import CollapseWorker
 import pygame   
 from pygame.sprite import Sprite
 
@@ -11,6 +12,7 @@ class CardBlueprint(Sprite):
         self.dimensions = (145, 200)  # Adjusted card size to match actual rendering
         self.rect = None  # For collision detection
         self.card_played = False
+        self.collapse_future = None  # In-flight collapse on the worker thread
 
     @abstractmethod
     def get_sprite_coords(self):
@@ -27,6 +29,26 @@ class CardBlueprint(Sprite):
     def enable_card_played(self):
         self.card_played = True
 
+    def poll_collapse(self, collapse, *args):
+        """Run a collapse on the worker thread without blocking the frame
+
+        The first call submits the collapse, later calls check whether it
+        has finished.
+
+        Returns:
+            The collapse result once it has arrived, None while it is in flight
+        """
+        if self.collapse_future is None:
+            self.collapse_future = CollapseWorker.get_instance().submit(collapse, *args)
+        if not self.collapse_future.done():
+            return None
+        future, self.collapse_future = self.collapse_future, None
+        return future.result()
+
+    def is_collapsing(self):
+        """Return True while a collapse is waiting on the worker thread"""
+        return self.collapse_future is not None
+
     def get_card_image(self):
         """Return the card image for display purposes
         
@@ -4,7 +4,7 @@ from Spells.Lightning import Lightning
 from Spells.Heal import Heal
 from QuantumMechanics.QuantumStates import QuantumState
 from QuantumMechanics.Superposition import Superposition
-from qiskit import QuantumCircuit
+from QuantumMechanics.SuperpositionSpec import SuperpositionSpec
 
 class DuelistParadox(CardBlueprint):
     # Define sprite coordinates for the card
@@ -22,8 +22,7 @@ class DuelistParadox(CardBlueprint):
         self.heal = Heal(self.screen)
         self.activated_card = False
         self.stateType = QuantumState.SUPERPOSITION
-        self.qubit = QuantumCircuit(1, 1)
-        Superposition.apply_superposition_to_qubit(self.qubit, total_states=2)
+        self.qubit_spec = SuperpositionSpec(total_states=2)
         self.collapsedState = None
         
         # Phase bias properties
@@ -40,28 +39,28 @@ class DuelistParadox(CardBlueprint):
         self.favored_state = favored_state
         self.bias_strength = bias_strength
         
-        # Recreate the quantum circuit with bias
-        self.qubit = QuantumCircuit(1, 1)
-        if self.has_phase_bias:
-            Superposition.apply_superposition_with_bias(
-                self.qubit, 
-                total_states=2, 
-                favored_state=self.favored_state, 
-                bias_strength=self.bias_strength
-            )
-        else:
-            Superposition.apply_superposition_to_qubit(self.qubit, total_states=2)
+        # The circuit itself is only built when the card collapses
+        self.qubit_spec = SuperpositionSpec(
+            total_states=2, 
+            favored_state=self.favored_state, 
+            bias_strength=self.bias_strength
+        )
     
     def activate_card(self, caster, target):
         if self.stateType == QuantumState.SUPERPOSITION:
             if self.has_phase_bias:
-                self.collapsedState = Superposition.collapse_qubit_with_bias(
-                    self.qubit, 
+                collapsed = self.poll_collapse(
+                    Superposition.collapse_qubit_with_bias,
+                    self.qubit_spec, 
                     self.favored_state, 
                     self.bias_strength
                 )
             else:
-                self.collapsedState = Superposition.collapse_qubit(self.qubit)
+                collapsed = self.poll_collapse(Superposition.collapse_qubit, self.qubit_spec)
+            if collapsed is None:
+                # Still collapsing on the worker thread
+                return True, None
+            self.collapsedState = collapsed
             self.stateType = QuantumState.COLLAPSED
         
         if (self.collapsedState != None):
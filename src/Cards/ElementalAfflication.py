@@ -14,7 +14,6 @@ from Spells.ElementalWeather.Rain import Rain
 from Spells.ElementalWeather.Earthquake import Earthquake
 from Spells.ElementalWeather.Heatwave import HeatWave
 from Spells.ElementalWeather.WindTornado import WindTornado
-from qiskit import QuantumCircuit
 from QuantumMechanics.Entanglement import QuantumEntanglement
 from Cards.WeatherCards.Nature import Nature
 from Cards.WeatherCards.RainWeather import RainWeather
@@ -45,7 +44,11 @@ class ElementalAfflication(CardBlueprint):
     
     def activate_card(self, caster, target):
         if self.stateType == QuantumState.ENTANGLED:
-            self.collapsedState, self.weatherState = QuantumEntanglement.simulate_entanglement()
+            collapsed = self.poll_collapse(QuantumEntanglement.simulate_entanglement)
+            if collapsed is None:
+                # Still collapsing on the worker thread
+                return True, None
+            self.collapsedState, self.weatherState = collapsed
             self.stateType = QuantumState.COLLAPSED
             if (self.collapsedState == '00'):
                 self.spell = EarthSpike(self.screen)
@@ -14,7 +14,6 @@ from Spells.ElementalWeather.Rain import Rain
 from Spells.ElementalWeather.Earthquake import Earthquake
 from Spells.ElementalWeather.Heatwave import HeatWave
 from Spells.ElementalWeather.WindTornado import WindTornado
-from qiskit import QuantumCircuit
 from QuantumMechanics.Entanglement import QuantumEntanglement
 from Cards.WeatherCards.Nature import Nature
 from Cards.WeatherCards.RainWeather import RainWeather
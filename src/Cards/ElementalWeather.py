@@ -11,7 +11,6 @@ from Spells.ElementalWeather.Earthquake import Earthquake
 from Spells.ElementalWeather.Heatwave import HeatWave
 from Spells.ElementalWeather.WindTornado import WindTornado
 from Spells.ElementalWeather.WeatherSpells import WeatherSpells
-from qiskit import QuantumCircuit
 from QuantumMechanics.Entanglement import QuantumEntanglement
 from Cards.ElementalAttacksCards.EarthSpikeCard import EarthSpikeCard
 from Cards.ElementalAttacksCards.WaterGeyserCard import WaterGeyserCard
@@ -42,7 +41,11 @@ class ElementalWeather(CardBlueprint):
     
     def activate_card(self, caster, target):
         if self.stateType == QuantumState.ENTANGLED:
-            self.afflicationState, self.collapsedState = QuantumEntanglement.simulate_entanglement()
+            collapsed = self.poll_collapse(QuantumEntanglement.simulate_entanglement)
+            if collapsed is None:
+                # Still collapsing on the worker thread
+                return True, None
+            self.afflicationState, self.collapsedState = collapsed
             
             self.stateType = QuantumState.COLLAPSED
             if self.collapsedState == '00':
@@ -8,6 +8,7 @@ class PhaseBias(CardBlueprint):
     name = "Phase Bias"
     description = "Apply phase bias to a superposition card to favor a specific collapse state."
     damage = 0
+    BIAS_STRENGTH = 0.7  # Probability of favored state (70% vs 30%)
     
     def __init__(self, screen):
         super().__init__(screen)
@@ -17,7 +18,7 @@ class PhaseBias(CardBlueprint):
         self.stateType = QuantumState.COLLAPSED  # Phase Bias is not a quantum card itself
         self.target_card = None  # The card this bias will be applied to
         self.favored_state = None  # The state to favor ('0' or '1' for 2-state, '00', '01', '10', '11' for 4-state)
-        self.bias_strength = 0.7  # Probability of favored state (70% vs 30%)
+        self.bias_strength = self.BIAS_STRENGTH
 
     def get_sprite_coords(self):
         return self.CARD_COORDS
@@ -9,6 +9,7 @@ class QuantumTunneling(CardBlueprint):
     name = "Quantum Tunneling"
     description = "Next offensive attack has a 70% chance to bypass shields."
     damage = 0
+    TUNNELING_PROBABILITY = 0.7
     
     def __init__(self, screen):
         super().__init__(screen)
@@ -18,7 +19,7 @@ class QuantumTunneling(CardBlueprint):
         self.activated_card = False
         
         # Quantum tunneling probability (70% chance to bypass shields)
-        self.tunneling_probability = 0.7
+        self.tunneling_probability = self.TUNNELING_PROBABILITY
 
     def get_sprite_coords(self):
         return self.CARD_COORDS
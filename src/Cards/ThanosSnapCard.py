@@ -4,7 +4,7 @@ from Spells.MagicMissile import MagicMissile
 from Spells.MagicMissileV2 import MagicMissileV2
 from QuantumMechanics.QuantumStates import QuantumState
 from QuantumMechanics.Superposition import Superposition
-from qiskit import QuantumCircuit
+from QuantumMechanics.SuperpositionSpec import SuperpositionSpec
 from Spells.ThanosSnap import ThanosSnap
 
 class ThanosSnapCard(CardBlueprint):
@@ -19,8 +19,7 @@ class ThanosSnapCard(CardBlueprint):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/ThanosSnap.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
-        self.qubit = QuantumCircuit(1, 1)
-        Superposition.apply_superposition_to_qubit(self.qubit, total_states=2)
+        self.qubit_spec = SuperpositionSpec(total_states=2)
         self.stateType = QuantumState.SUPERPOSITION
         self.collapsedState = None
         self.thanosSnap = ThanosSnap(self.screen)
@@ -40,28 +39,28 @@ class ThanosSnapCard(CardBlueprint):
         self.favored_state = favored_state
         self.bias_strength = bias_strength
         
-        # Recreate the quantum circuit with bias
-        self.qubit = QuantumCircuit(1, 1)
-        if self.has_phase_bias:
-            Superposition.apply_superposition_with_bias(
-                self.qubit, 
-                total_states=2, 
-                favored_state=self.favored_state, 
-                bias_strength=self.bias_strength
-            )
-        else:
-            Superposition.apply_superposition_to_qubit(self.qubit, total_states=2)
+        # The circuit itself is only built when the card collapses
+        self.qubit_spec = SuperpositionSpec(
+            total_states=2, 
+            favored_state=self.favored_state, 
+            bias_strength=self.bias_strength
+        )
     
     def activate_card(self, caster, target):
         if self.stateType == QuantumState.SUPERPOSITION:
             if self.has_phase_bias:
-                self.collapsedState = Superposition.collapse_qubit_with_bias(
-                    self.qubit, 
+                collapsed = self.poll_collapse(
+                    Superposition.collapse_qubit_with_bias,
+                    self.qubit_spec, 
                     self.favored_state, 
                     self.bias_strength
                 )
             else:
-                self.collapsedState = Superposition.collapse_qubit(self.qubit)
+                collapsed = self.poll_collapse(Superposition.collapse_qubit, self.qubit_spec)
+            if collapsed is None:
+                # Still collapsing on the worker thread
+                return True, None
+            self.collapsedState = collapsed
             self.stateType = QuantumState.COLLAPSED
         
         if (self.collapsedState != None):
@@ -4,7 +4,6 @@ from Spells.Lightning import Lightning
 from Spells.Heal import Heal
 from QuantumMechanics.QuantumStates import QuantumState
 from QuantumMechanics.Superposition import Superposition
-from qiskit import QuantumCircuit
 from Spells.ElementalWeather.Earthquake import Earthquake
 
 class Nature(CardBlueprint):
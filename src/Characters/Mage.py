@@ -52,6 +52,7 @@ class Mage(CharacterBlueprint):
         super().__init__()
         self.SPRITE_PATH = "./Assets/mage_sprite.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.sprite_states)
         self.current_state = 0
         self.animation_tracker = 0
         self.health = HealthBar(100, 100, screen)
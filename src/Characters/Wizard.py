@@ -51,6 +51,7 @@ class Wizard(CharacterBlueprint):
         super().__init__()
         self.SPRITE_PATH = "./Assets/wizard_sprite.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.sprite_states)
         self.current_state = 0
         self.animation_tracker = 0
         self.health = HealthBar(100, 100, screen)
@@ -97,7 +98,8 @@ class Wizard(CharacterBlueprint):
             self.current_state = 0
 
         animation_to_render = sprite_image[self.animation_tracker]
-        sprite_standing_image = self.sprite.get_sprite(animation_to_render)
+        # The wizard faces left, so its frames are drawn mirrored
+        sprite_standing_image = self.sprite.get_transformed(animation_to_render, flip=(True, False))
         
         # Apply damage flash effect if active
         if self.damage_flash:
@@ -109,7 +111,7 @@ class Wizard(CharacterBlueprint):
             self.position_to_draw)  
 
         self.animation_tracker = self.animation_tracker + 1
-        self.screen.blit(pygame.transform.flip(sprite_standing_image, True, False), sprite_standing_image_position)
+        self.screen.blit(sprite_standing_image, sprite_standing_image_position)
 
     def animate(self, deck_position, target, turn, weather_manager):
         self.motion_animation()
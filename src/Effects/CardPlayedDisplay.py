@@ -1,5 +1,6 @@
 import pygame
 import math
+from Utils.FontRegistry import FontRegistry
 
 class CardPlayedDisplay:
     """Displays a card in the center of the screen when played"""
@@ -25,6 +26,9 @@ class CardPlayedDisplay:
         self.pulse_amount = 0.05  # Amount to pulse size
         self.pulse_speed = 3  # Speed of pulse
         self.max_alpha = 180  # Maximum alpha (transparency) to keep it in background
+        self.shimmer_speed = 0.4  # Pixels per millisecond for the collapsing shimmer
+        self.shimmer_width = 60  # Width of the shimmer band
+        self.shimmer_surface = None  # Reused for every shimmer frame, grown to the largest card size
         
         # Position properties
         self.position = (0, 0)
@@ -58,8 +62,10 @@ class CardPlayedDisplay:
         if not self.is_active or not self.card:
             return
         
-        # Update remaining time
+        # Update remaining time, holding the steady phase while the card is still collapsing
         self.time_remaining -= dt
+        if self.card.is_collapsing():
+            self.time_remaining = max(self.time_remaining, self.fade_out_time)
         if self.time_remaining <= 0:
             self.is_active = False
             return
@@ -134,14 +140,17 @@ class CardPlayedDisplay:
         
         # Draw the image
         self.screen.blit(scaled_image, image_rect)
+
+        # Shimmer over the card until its collapse result arrives
+        if self.card.is_collapsing():
+            self.render_collapsing_shimmer(image_rect)
         
         # Draw card name with reduced visibility for background effect
         if hasattr(self.card, 'card_name') and self.alpha > 50:
-            font = pygame.font.SysFont('Arial', 28, bold=True)
             text_alpha = min(200, int(self.alpha * 1.2))  # Slightly more visible than card
             
             # Create transparent surface for text
-            name_text = font.render(self.card.card_name, True, (255, 255, 255))
+            name_text = FontRegistry.get_instance().render(self.card.card_name, 28, (255, 255, 255), bold=True)
             text_surface = pygame.Surface(name_text.get_size(), pygame.SRCALPHA)
             text_surface.fill((0, 0, 0, 0))  # Transparent background
             text_surface.blit(name_text, (0, 0))
@@ -149,4 +158,40 @@ class CardPlayedDisplay:
             
             # Position and render
             text_rect = name_text.get_rect(center=(self.position[0], self.position[1] + scaled_height//2 + 30))
-            self.screen.blit(text_surface, text_rect) 
\ No newline at end of file
+            self.screen.blit(text_surface, text_rect)
+
+    def render_collapsing_shimmer(self, image_rect):
+        """Sweep a light band across the card while its collapse is in flight
+
+        Args:
+            image_rect: The screen rect of the displayed card
+        """
+        width, height = image_rect.size
+        # The pulsing card changes size every frame, so one surface is kept
+        # large enough for all of them and only the card's area is redrawn
+        shimmer = self.shimmer_surface
+        if shimmer is None or shimmer.get_width() < width or shimmer.get_height() < height:
+            size = (width, height) if shimmer is None else (max(width, shimmer.get_width()),
+                                                            max(height, shimmer.get_height()))
+            shimmer = self.shimmer_surface = pygame.Surface(size, pygame.SRCALPHA)
+        area = pygame.Rect(0, 0, width, height)
+        shimmer.fill((0, 0, 0, 0), area)
+        sweep = self.shimmer_width + width + height
+        offset = (pygame.time.get_ticks() * self.shimmer_speed) % sweep - self.shimmer_width - height
+
+        # Diagonal band from bottom-left to top-right
+        band = [
+            (offset, height),
+            (offset + self.shimmer_width, height),
+            (offset + self.shimmer_width + height, 0),
+            (offset + height, 0)
+        ]
+        shimmer.set_clip(area)
+        pygame.draw.polygon(shimmer, (180, 220, 255, 90), band)
+
+        # Pulsing outline
+        pulse = int(120 + 80 * math.sin(pygame.time.get_ticks() * 0.01))
+        pygame.draw.rect(shimmer, (120, 200, 255, pulse), area, 3)
+        shimmer.set_clip(None)
+
+        self.screen.blit(shimmer, image_rect, area)
@@ -48,8 +48,9 @@ class DamageFlash:
         if character_id not in self.active_flashes:
             return sprite_surface
             
-        # Get a copy of the sprite to modify
-        flash_surface = sprite_surface.copy()
+        # Get a copy of the sprite to modify, with per-pixel alpha so the
+        # overlay cannot recolor the transparent pixels of a colorkeyed sprite
+        flash_surface = sprite_surface.convert_alpha()
         
         # Get flash intensity
         intensity = self.active_flashes[character_id]['intensity']
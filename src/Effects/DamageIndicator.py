@@ -1,5 +1,5 @@
 import pygame
-import random
+from Utils.RandomService import RandomService
 import math
 
 class DamageIndicator:
@@ -11,6 +11,7 @@ class DamageIndicator:
         Args:
             screen: The pygame screen to render on
         """
+        self.rng = RandomService.get_instance().stream('particles')
         self.screen = screen
         
         # Animation properties
@@ -37,10 +38,10 @@ class DamageIndicator:
             'color': self.heal_color if is_heal else self.damage_color,
             'lifetime': 0,
             'max_lifetime': 60,  # Frames the indicator will last
-            'offset_x': random.randint(-20, 20),  # Random horizontal drift
+            'offset_x': self.rng.randint(-20, 20),  # Random horizontal drift
             'offset_y': -5,  # Initial upward movement
             'font': self.font if amount >= 10 else self.small_font,  # Bigger font for bigger numbers
-            'is_critical': random.random() < 0.2,  # 20% chance of critical hit effect
+            'is_critical': self.rng.random() < 0.2,  # 20% chance of critical hit effect
             'is_heal': is_heal  # Store whether this is healing or damage
         }
         
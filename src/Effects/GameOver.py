@@ -118,13 +118,13 @@ class GameOver:
             )
             
             # Draw restart button
-            pygame.draw.rect(self.screen, (50, 150, 50), self.restart_button_rect, border_radius=10)
+            self.screen.mark_dirty(pygame.draw.rect(self.screen, (50, 150, 50), self.restart_button_rect, border_radius=10))
             restart_text = self.detail_font.render("Play Again", True, (255, 255, 255))
             restart_text_rect = restart_text.get_rect(center=self.restart_button_rect.center)
             self.screen.blit(restart_text, restart_text_rect)
             
             # Draw quit button
-            pygame.draw.rect(self.screen, (150, 50, 50), self.quit_button_rect, border_radius=10)
+            self.screen.mark_dirty(pygame.draw.rect(self.screen, (150, 50, 50), self.quit_button_rect, border_radius=10))
             quit_text = self.detail_font.render("Quit Game", True, (255, 255, 255))
             quit_text_rect = quit_text.get_rect(center=self.quit_button_rect.center)
             self.screen.blit(quit_text, quit_text_rect)
@@ -0,0 +1,103 @@
+import threading
+import pygame
+from SpriteUtil.SurfaceFormat import SurfaceFormat
+
+
+class GlowCache:
+    """
+    Pre-rendered radial glows at a few intensity levels.
+
+    A glow is a stack of concentric translucent circles in one color, given
+    as (radius, alpha) rings in drawing order, with alpha at full intensity.
+    Drawing one used to allocate a surface per ring every frame just to
+    scale the alphas by a flicker. The cache composites every ring of a
+    glow into one surface for each of LEVELS intensities spread over the
+    flicker range, and rendering blits the level nearest to the requested
+    intensity. Rings of one color stack to the same pixels composited as
+    they do blitted one by one, so only the flicker is quantized.
+    """
+
+    LEVELS = 8
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, levels=LEVELS):
+        self.levels = levels
+        self._glows = {}  # (color, rings, low, high) -> [surface per level]
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared glow cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def glow(self, color, rings, intensity=1.0, low=0.0, high=1.0):
+        """Return the glow surface for the level nearest to an intensity
+
+        Args:
+            color: RGB color of every ring
+            rings: (radius, alpha) pairs in drawing order, alpha at full intensity
+            intensity: Multiplier on the ring alphas
+            low: Lowest intensity the glow is drawn at
+            high: Highest intensity the glow is drawn at
+
+        Returns:
+            pygame.Surface: The shared glow surface, centred on its middle
+        """
+        key = (tuple(color[:3]), tuple((radius, alpha) for radius, alpha in rings), low, high)
+        with self._lock:
+            levels = self._glows.get(key)
+            if levels is None:
+                self.misses += 1
+                levels = [self._build(key[0], key[1], self._level_intensity(index, low, high))
+                          for index in range(self.levels)]
+                self._glows[key] = levels
+            else:
+                self.hits += 1
+        return levels[self._level_index(intensity, low, high)]
+
+    def render(self, surface, center, color, rings, intensity=1.0, low=0.0, high=1.0):
+        """Blit a glow centred on a point, returning the rect it covered"""
+        glow = self.glow(color, rings, intensity, low, high)
+        return surface.blit(glow, glow.get_rect(center=(int(center[0]), int(center[1]))))
+
+    def _level_index(self, intensity, low, high):
+        if high <= low or self.levels == 1:
+            return self.levels - 1
+        index = round((intensity - low) / (high - low) * (self.levels - 1))
+        return min(self.levels - 1, max(0, index))
+
+    def _level_intensity(self, index, low, high):
+        if self.levels == 1:
+            return high
+        return low + (high - low) * index / (self.levels - 1)
+
+    @staticmethod
+    def _build(color, rings, intensity):
+        half = max(radius for radius, _ in rings)
+        # Transparent pixels already carry the ring color, so blending keeps it exact
+        glow = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        glow.fill((*color, 0))
+        for radius, alpha in rings:
+            ring = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(ring, (*color, int(alpha * intensity)), (radius, radius), radius)
+            glow.blit(ring, (half - radius, half - radius))
+        return SurfaceFormat.get_instance().normalize(glow, SurfaceFormat.ALPHA)
+
+    def stats(self):
+        """Return how often a glow was already rendered"""
+        return {
+            'glows': len(self._glows),
+            'levels': self.levels,
+            'hits': self.hits,
+            'misses': self.misses
+        }
@@ -0,0 +1,328 @@
+import math
+from collections import OrderedDict
+import numpy as np
+import pygame
+from Utils.RandomService import RandomService
+from SpriteUtil.SurfaceFormat import SurfaceFormat
+
+
+class ParticleSystem:
+    """
+    Struct-of-arrays particle engine shared by the weather and spell effects.
+
+    Every particle field lives in a NumPy array indexed by slot, so moving,
+    aging and expiring a whole system is a handful of vectorized operations
+    instead of a Python loop over dicts. Effects own one system per kind of
+    particle and steer it by writing the public arrays directly (drift,
+    turbulence, spirals) between draw() and update().
+
+    Particles are drawn in one Surface.blits call from small pre-rendered
+    stamps. A stamp is keyed by palette color, integer size, quantized
+    alpha, rotation bucket and length, so colors come from a small palette
+    (see random_palette) and stamps are shared across particles and frames.
+    Stamps are kept in an LRU bounded by MAX_STAMP_BYTES of pixel data, so
+    systems whose sizes or alphas keep changing do not collect stamps for
+    the whole session.
+    Shapes:
+        circle  - filled circle of radius size
+        polygon - regular polygon with `sides` corners on a circle of radius
+                  size, turned by rotation (degrees)
+        streak  - bar `length` pixels long and size pixels thick, starting at
+                  the particle and running along x, or along y when vertical
+
+    A handful of particles is recorded one dirty rect each. Past
+    CELL_MARKING_MIN, draw() marks the CELL_SIZE grid cells the particles
+    landed in instead, so thousands of particles cost the render pipeline a
+    few rects per row.
+    """
+
+    CIRCLE = 'circle'
+    POLYGON = 'polygon'
+    STREAK = 'streak'
+
+    PALETTE_SIZE = 16
+    ALPHA_LEVELS = 16
+    ROTATION_STEPS = 12  # Stamps per turn of rotational symmetry
+    CELL_SIZE = 64
+    CELL_MARKING_MIN = 64  # Fewer drawn particles are recorded one rect each
+    MAX_STAMP_BYTES = 4 * 1024 * 1024
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'gravity', 'age', 'lifetime', 'size',
+              'length', 'rotation', 'spin', 'alpha', 'fade')
+    DEFAULTS = {'lifetime': np.inf, 'alpha': 255.0}
+
+    def __init__(self, palette, shape=CIRCLE, capacity=64, sides=4, vertical=False,
+                 growth=0.0, scale=1.0, bounds=None, rng=None):
+        """Create an empty particle system
+
+        Args:
+            palette: RGB colors particles pick from by index
+            shape: CIRCLE, POLYGON or STREAK
+            capacity: Initial number of slots; emit() grows the arrays as needed
+            sides: Corners of POLYGON particles
+            vertical: Whether STREAK particles run along y instead of x
+            growth: Added to every particle's size each update
+            scale: Multiplies every particle's size each update
+            bounds: pygame.Rect particles expire outside of, or None
+            rng: numpy Generator, defaults to the 'particles' stream
+        """
+        self.palette = [tuple(int(channel) for channel in color[:3]) for color in palette]
+        self.shape = shape
+        self.sides = sides
+        self.vertical = vertical
+        self.growth = growth
+        self.scale = scale
+        self.bounds = None if bounds is None else (bounds.left, bounds.top, bounds.right, bounds.bottom)
+        self.rng = rng if rng is not None else RandomService.get_instance().numpy_stream('particles')
+
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.color = np.zeros(capacity, dtype=np.int64)
+        for field in self.FIELDS:
+            setattr(self, field, np.full(capacity, self.DEFAULTS.get(field, 0.0)))
+
+        self._stamps = OrderedDict()  # key -> (surface, offset_x, offset_y, width, height)
+        self._stamp_bytes = 0
+
+        # Counters
+        self.drawn = 0
+        self.stamp_evictions = 0
+
+    @staticmethod
+    def random_palette(rng, ranges, count=PALETTE_SIZE):
+        """Return count colors with each channel drawn from an inclusive (low, high) range"""
+        channels = [rng.integers(low, high, size=count, endpoint=True) for low, high in ranges]
+        return [tuple(int(value) for value in color) for color in zip(*channels)]
+
+    @property
+    def capacity(self):
+        return self.alive.size
+
+    def count(self):
+        """Return the number of live particles"""
+        return int(np.count_nonzero(self.alive))
+
+    def indices(self):
+        """Return the slots of the live particles"""
+        return np.flatnonzero(self.alive)
+
+    def emit(self, count, **fields):
+        """Spawn count particles in free slots
+
+        Fields not given take their defaults: zero, an infinite lifetime,
+        full alpha and a random palette color.
+
+        Returns:
+            numpy.ndarray: Slots of the new particles
+        """
+        free = np.flatnonzero(~self.alive)
+        if free.size < count:
+            self._grow(self.capacity + count - free.size)
+            free = np.flatnonzero(~self.alive)
+        slots = free[:count]
+        for field in self.FIELDS:
+            getattr(self, field)[slots] = self.DEFAULTS.get(field, 0.0)
+        if 'color' not in fields:
+            fields['color'] = self.rng.integers(0, len(self.palette), size=count)
+        self.respawn(slots, **fields)
+        return slots
+
+    def respawn(self, slots, **fields):
+        """Bring particles in slots back to life with their age reset
+
+        Fields given as scalars or per-slot arrays are overwritten; every
+        other field keeps its current value.
+        """
+        if 'color' in fields:
+            self.color[slots] = fields.pop('color')
+        for field, value in fields.items():
+            getattr(self, field)[slots] = value
+        self.age[slots] = 0.0
+        self.alive[slots] = True
+
+    def kill(self, slots):
+        """Remove the particles in slots"""
+        self.alive[slots] = False
+
+    def clear(self):
+        """Remove every particle"""
+        self.alive[:] = False
+
+    def _grow(self, needed):
+        capacity = max(needed, 2 * self.capacity)
+        extra = capacity - self.capacity
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        self.color = np.concatenate([self.color, np.zeros(extra, dtype=np.int64)])
+        for field in self.FIELDS:
+            padding = np.full(extra, self.DEFAULTS.get(field, 0.0))
+            setattr(self, field, np.concatenate([getattr(self, field), padding]))
+
+    def update(self):
+        """Advance every live particle by one tick
+
+        Moves particles by their velocity, applies gravity, spin, fade and
+        size change, then expires particles that outlived their lifetime,
+        faded out or left the bounds.
+
+        Returns:
+            numpy.ndarray: Slots that expired this tick, free to respawn
+        """
+        alive = self.alive
+        np.add(self.x, self.vx, out=self.x, where=alive)
+        np.add(self.y, self.vy, out=self.y, where=alive)
+        np.add(self.vy, self.gravity, out=self.vy, where=alive)
+        np.add(self.rotation, self.spin, out=self.rotation, where=alive)
+        np.subtract(self.alpha, self.fade, out=self.alpha, where=alive)
+        np.add(self.age, 1.0, out=self.age, where=alive)
+        if self.scale != 1.0 or self.growth:
+            sized = self.size * self.scale + self.growth
+            np.maximum(sized, 0.0, out=self.size, where=alive)
+
+        expired = (self.age >= self.lifetime) | (self.alpha <= 0.0)
+        if self.bounds is not None:
+            left, top, right, bottom = self.bounds
+            expired |= (self.x < left) | (self.x >= right) | (self.y < top) | (self.y >= bottom)
+        expired &= alive
+        self.alive[expired] = False
+        return np.flatnonzero(expired)
+
+    def draw(self, surface):
+        """Draw every visible particle onto a surface with a single blits call"""
+        slots = np.flatnonzero(self.alive)
+        sizes = self.size[slots].astype(np.int64)
+        levels = (np.minimum(self.alpha[slots], 255.0) * ((self.ALPHA_LEVELS - 1) / 255.0) + 0.5).astype(np.int64)
+        lengths = self.length[slots].astype(np.int64) if self.shape == self.STREAK else np.zeros_like(sizes)
+        visible = (sizes >= 1) & (levels > 0)
+        if self.shape == self.STREAK:
+            visible &= lengths >= 1
+        slots, sizes, levels, lengths = slots[visible], sizes[visible], levels[visible], lengths[visible]
+        self.drawn = 0
+        if not slots.size:
+            return
+
+        if self.shape == self.POLYGON:
+            period = 360.0 / self.sides
+            turns = np.mod(self.rotation[slots], period) * (self.ROTATION_STEPS / period)
+            buckets = turns.astype(np.int64) % self.ROTATION_STEPS
+        else:
+            buckets = np.zeros_like(sizes)
+        keys = ((((self.color[slots] * 256 + np.minimum(sizes, 255)) * 2048 + np.minimum(lengths, 2047))
+                 * self.ALPHA_LEVELS + levels) * self.ROTATION_STEPS + buckets)
+
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        entries = []
+        for position, key in enumerate(unique.tolist()):
+            entry = self._stamps.get(key)
+            if entry is None:
+                at = first[position]
+                entry = self._render_stamp(surface, int(self.color[slots[at]]), int(sizes[at]),
+                                           int(lengths[at]), int(levels[at]), int(buckets[at]))
+                self._stamps[key] = entry
+                self._stamp_bytes += self._entry_bytes(entry)
+            else:
+                self._stamps.move_to_end(key)
+            entries.append(entry)
+        # Stamps used this frame are already in entries, so evicting them is safe
+        while self._stamp_bytes > self.MAX_STAMP_BYTES and len(self._stamps) > 1:
+            _, evicted = self._stamps.popitem(last=False)
+            self._stamp_bytes -= self._entry_bytes(evicted)
+            self.stamp_evictions += 1
+        images = [entry[0] for entry in entries]
+        placed = np.array([entry[1:] for entry in entries], dtype=np.int64)[inverse]
+
+        left = self.x[slots].astype(np.int64) - placed[:, 0]
+        top = self.y[slots].astype(np.int64) - placed[:, 1]
+        width, height = surface.get_size()
+        onscreen = (left < width) & (top < height) & (left + placed[:, 2] > 0) & (top + placed[:, 3] > 0)
+        if not onscreen.all():
+            inverse, left, top, placed = inverse[onscreen], left[onscreen], top[onscreen], placed[onscreen]
+        self.drawn = int(inverse.size)
+        if not self.drawn:
+            return
+
+        sequence = zip(map(images.__getitem__, inverse.tolist()), zip(left.tolist(), top.tolist()))
+        if self.drawn <= self.CELL_MARKING_MIN or not hasattr(surface, 'mark_dirty'):
+            surface.blits(sequence, False)
+            return
+        # Blit past the tracking wrapper; the touched cells are marked instead
+        pygame.Surface.blits(surface, sequence, False)
+        self._mark_cells(surface, left, top, left + placed[:, 2], top + placed[:, 3])
+
+    @staticmethod
+    def _entry_bytes(entry):
+        return entry[3] * entry[4] * entry[0].get_bytesize()
+
+    def _render_stamp(self, surface, color_index, size, length, level, bucket):
+        """Draw one particle image keyed on a color it does not use"""
+        color = self.palette[color_index]
+        if self.shape == self.CIRCLE:
+            dimensions = (2 * size, 2 * size)
+            offset = (size, size)
+        elif self.shape == self.POLYGON:
+            dimensions = (2 * size + 2, 2 * size + 2)
+            offset = (size + 1, size + 1)
+        elif self.vertical:
+            dimensions = (size, length)
+            offset = (size // 2, 0)
+        else:
+            dimensions = (length, size)
+            offset = (0, size // 2)
+
+        key = next(key for key in SurfaceFormat.COLORKEYS if key != color)
+        image = pygame.Surface(dimensions, 0, surface)
+        image.fill(key)
+        if self.shape == self.CIRCLE:
+            pygame.draw.circle(image, color, offset, size)
+        elif self.shape == self.POLYGON:
+            period = 360.0 / self.sides
+            turn = bucket * period / self.ROTATION_STEPS
+            points = []
+            for corner in range(self.sides):
+                angle = math.radians(turn + corner * period)
+                points.append((offset[0] + size * math.cos(angle), offset[1] + size * math.sin(angle)))
+            pygame.draw.polygon(image, color, points)
+        else:
+            image.fill(color)
+        image.set_colorkey(key, pygame.RLEACCEL)
+        if level < self.ALPHA_LEVELS - 1:
+            image.set_alpha(round(level * 255 / (self.ALPHA_LEVELS - 1)))
+        return image, offset[0], offset[1], dimensions[0], dimensions[1]
+
+    def _mark_cells(self, surface, left, top, right, bottom):
+        """Mark the grid cells covered by the drawn particles as dirty, one rect per run"""
+        width, height = surface.get_size()
+        cell = self.CELL_SIZE
+        columns = -(-width // cell)
+        rows = -(-height // cell)
+        # Everything passed in overlaps the surface, so only the far edges need clamping
+        first_column = np.maximum(left, 0) // cell
+        last_column = np.minimum(right - 1, width - 1) // cell
+        first_row = np.maximum(top, 0) // cell
+        last_row = np.minimum(bottom - 1, height - 1) // cell
+
+        grid = np.zeros((rows, columns), dtype=bool)
+        for row_step in range(int((last_row - first_row).max()) + 1):
+            row = np.minimum(first_row + row_step, last_row)
+            for column_step in range(int((last_column - first_column).max()) + 1):
+                grid[row, np.minimum(first_column + column_step, last_column)] = True
+
+        # Runs of marked cells start at +1 and end at -1 steps along each padded row
+        padded = np.zeros((rows, columns + 2), dtype=np.int8)
+        padded[:, 1:-1] = grid
+        steps = np.diff(padded, axis=1)
+        starts = np.argwhere(steps == 1).tolist()
+        ends = np.argwhere(steps == -1)[:, 1].tolist()
+        screen_rect = surface.get_rect()
+        for (row, start), end in zip(starts, ends):
+            run = pygame.Rect(start * cell, row * cell, (end - start) * cell, cell)
+            surface.mark_dirty(run.clip(screen_rect))
+
+    def stats(self):
+        """Return the live, drawn and cached stamp counts"""
+        return {
+            'alive': self.count(),
+            'capacity': self.capacity,
+            'drawn': self.drawn,
+            'stamps': len(self._stamps),
+            'stamp_bytes': self._stamp_bytes,
+            'stamp_evictions': self.stamp_evictions
+        }
@@ -1,9 +1,16 @@
 import pygame
 import math
-import random
+import numpy as np
+from Utils.RandomService import RandomService
+from Effects.StatusOverlays import StatusOverlays
+from Effects.ParticleSystem import ParticleSystem
 
 class QuantumTunnelingIndicator:
     """Visual indicator for quantum tunneling effects"""
+
+    # Particle palette indices
+    ACTIVATION_COLOR = 0
+    SUCCESS_COLOR = 1
     
     def __init__(self, screen):
         """Initialize the quantum tunneling indicator
@@ -11,6 +18,7 @@ class QuantumTunnelingIndicator:
         Args:
             screen: The pygame screen to render on
         """
+        self.rng = RandomService.get_instance().numpy_stream('particles')
         self.screen = screen
         
         # Animation properties
@@ -23,8 +31,8 @@ class QuantumTunnelingIndicator:
         self.success_color = (0, 255, 100)      # Green for successful tunneling
         self.failure_color = (255, 100, 100)    # Red for failed tunneling
         
-        # Particle effects
-        self.particles = []
+        # Particle effects, colored by palette index
+        self.particles = ParticleSystem([self.tunneling_color, self.success_color])
         
     def add_tunneling_activated(self, position):
         """Add indicator when quantum tunneling is activated
@@ -97,37 +105,33 @@ class QuantumTunnelingIndicator:
         
     def _create_activation_particles(self, position):
         """Create particles for tunneling activation"""
-        for _ in range(20):
-            particle = {
-                'x': position[0] + random.randint(-30, 30),
-                'y': position[1] + random.randint(-30, 30),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-3, -1),
-                'size': random.uniform(2, 5),
-                'color': self.tunneling_color,
-                'lifetime': 0,
-                'max_lifetime': 60,
-                'type': 'activation'
-            }
-            self.particles.append(particle)
+        self.particles.emit(
+            20,
+            x=position[0] + self.rng.integers(-30, 30, 20, endpoint=True),
+            y=position[1] + self.rng.integers(-30, 30, 20, endpoint=True),
+            vx=self.rng.uniform(-2, 2, 20),
+            vy=self.rng.uniform(-3, -1, 20),
+            gravity=0.1,
+            size=self.rng.uniform(2, 5, 20),
+            color=self.ACTIVATION_COLOR,
+            lifetime=60
+        )
             
     def _create_success_particles(self, position):
         """Create particles for successful tunneling"""
-        for _ in range(30):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            particle = {
-                'x': position[0],
-                'y': position[1],
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': random.uniform(3, 8),
-                'color': self.success_color,
-                'lifetime': 0,
-                'max_lifetime': 90,
-                'type': 'success'
-            }
-            self.particles.append(particle)
+        angle = self.rng.uniform(0, 2 * math.pi, 30)
+        speed = self.rng.uniform(2, 6, 30)
+        self.particles.emit(
+            30,
+            x=position[0],
+            y=position[1],
+            vx=np.cos(angle) * speed,
+            vy=np.sin(angle) * speed,
+            gravity=0.1,
+            size=self.rng.uniform(3, 8, 30),
+            color=self.SUCCESS_COLOR,
+            lifetime=90
+        )
         
     def update(self):
         """Update all active indicators and particles"""
@@ -154,45 +158,24 @@ class QuantumTunnelingIndicator:
             if indicator['lifetime'] >= indicator['max_lifetime']:
                 self.indicators.remove(indicator)
         
-        # Update particles
-        for particle in self.particles[:]:
-            particle['lifetime'] += 1
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Apply gravity to particles
-            particle['vy'] += 0.1
-            
-            # Fade out particles
-            progress = particle['lifetime'] / particle['max_lifetime']
-            if progress > 0.5:
-                fade_progress = (progress - 0.5) / 0.5
-                particle['size'] *= 0.98
-            
-            # Remove if expired
-            if particle['lifetime'] >= particle['max_lifetime'] or particle['size'] < 0.5:
-                self.particles.remove(particle)
+        # Update particles (move, apply gravity, expire)
+        particles = self.particles
+        particles.update()
+
+        # Shrink particles over the second half of their life
+        progress = particles.age / particles.lifetime
+        particles.size[particles.alive & (progress > 0.5)] *= 0.98
+
+        # Remove particles that shrank away
+        particles.kill(particles.alive & (particles.size < 0.5))
                 
     def render(self):
         """Render all active indicators and particles"""
-        # Render particles first (behind text)
-        for particle in self.particles:
-            if particle['size'] > 0.5:
-                # Calculate alpha based on lifetime
-                progress = particle['lifetime'] / particle['max_lifetime']
-                alpha = 255 if progress < 0.5 else int(255 * (1 - (progress - 0.5) / 0.5))
-                
-                # Create a surface for the particle with alpha
-                particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)), pygame.SRCALPHA)
-                color_with_alpha = (*particle['color'], alpha)
-                pygame.draw.circle(
-                    particle_surface, 
-                    color_with_alpha, 
-                    (int(particle['size']), int(particle['size'])), 
-                    int(particle['size'])
-                )
-                
-                self.screen.blit(particle_surface, (particle['x'] - particle['size'], particle['y'] - particle['size']))
+        # Render particles first (behind text), fading over the second half of their life
+        particles = self.particles
+        progress = particles.age / particles.lifetime
+        particles.alpha[:] = np.where(progress < 0.5, 255, 255 * (1 - (progress - 0.5) / 0.5))
+        particles.draw(self.screen)
         
         # Render text indicators
         for indicator in self.indicators:
@@ -233,55 +216,5 @@ class QuantumTunnelingIndicator:
         """Render static quantum tunneling indicator for a character that has tunneling active"""
         if not hasattr(character, 'quantum_tunneling_active') or not character.quantum_tunneling_active:
             return
-            
-        # Character center position
-        center = (character.position_to_draw[0], character.position_to_draw[1])
-        
-        # Draw cyan quantum aura with pulsing effect
-        time_factor = pygame.time.get_ticks() * 0.003
-        pulse = 0.8 + 0.2 * math.sin(time_factor)
-        radius = int(85 * pulse)
-        
-        # Draw outer quantum field
-        pygame.draw.circle(
-            screen,
-            (100, 255, 255, 100),  # Cyan with transparency
-            center,
-            radius,
-            3
-        )
-        
-        # Draw inner quantum field
-        pygame.draw.circle(
-            screen,
-            (150, 255, 255, 150),  # Brighter cyan
-            center,
-            radius - 10,
-            2
-        )
-        
-        # Draw "Q" text indicator
-        font = pygame.font.SysFont('Arial', 18, bold=True)
-        text = font.render("Q", True, (100, 255, 255))
-        text_rect = text.get_rect(center=(center[0], center[1] - radius - 15))
-        
-        # Add shadow for readability
-        shadow = font.render("Q", True, (0, 0, 0))
-        shadow_rect = shadow.get_rect(center=(center[0] + 1, center[1] - radius - 14))
-        screen.blit(shadow, shadow_rect)
-        screen.blit(text, text_rect)
-        
-        # Draw quantum particles around character
-        for i in range(6):
-            angle = time_factor + i * math.pi / 3
-            particle_x = center[0] + (radius + 5) * math.cos(angle)
-            particle_y = center[1] + (radius + 5) * math.sin(angle)
-            
-            # Small quantum particles
-            particle_size = 3 + int(2 * math.sin(time_factor * 2 + i))
-            pygame.draw.circle(
-                screen,
-                (100, 255, 255),
-                (int(particle_x), int(particle_y)),
-                particle_size
-            ) 
\ No newline at end of file
+
+        StatusOverlays.get_instance().render(screen, 'tunneling', character.position_to_draw)
@@ -0,0 +1,155 @@
+import math
+import threading
+import pygame
+from SpriteUtil.SpriteUtil import SpriteUtil
+from Utils.FontRegistry import FontRegistry
+from SpriteUtil.SurfaceFormat import SurfaceFormat
+
+
+class StatusOverlays:
+    """
+    Pre-rendered auras drawn around characters with a status effect.
+
+    Each aura is drawn once into a short loop of transparent frames that
+    covers its whole animation, and rendering a status only blits the frame
+    for the current time. The loops are built on first use, or up front
+    with preload().
+
+    Auras:
+        'shield'     - the barrier shield, a single frame
+        'vulnerable' - the red 3x ring with three rotating bolts
+        'tunneling'  - the pulsing cyan Q field with orbiting particles
+    """
+
+    SHIELD_SPRITE_PATH = "./Assets/Cards/Shield.png"
+    SHIELD_FRAME = (996, 1010, 402, 406)
+    SHIELD_SIZE = (130, 130)
+
+    # The bolts turn at 0.001 rad/ms and repeat every third of a turn, the
+    # tunneling pulse runs at 0.003 rad/ms, so both loops last 2*pi/3 seconds
+    LOOP_PERIOD_MS = 2000 * math.pi / 3
+    FRAMES_PER_LOOP = 48
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._builders = {
+            'shield': self._build_shield,
+            'vulnerable': self._build_vulnerable,
+            'tunneling': self._build_tunneling
+        }
+        self._overlays = {}  # aura name -> (frames, anchor offset)
+        self._shield_sprite = None
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared overlays, creating them on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def preload(self):
+        """Pre-render every aura"""
+        for name in self._builders:
+            self._get(name)
+
+    def render(self, screen, name, center, ticks=None):
+        """Blit the current frame of an aura centred on a character
+
+        Args:
+            screen: Surface to draw on
+            name: Aura name
+            center: Character center position
+            ticks: Time in ms used to pick the frame, defaults to pygame's clock
+        """
+        frames, (offset_x, offset_y) = self._get(name)
+        if len(frames) > 1:
+            if ticks is None:
+                ticks = pygame.time.get_ticks()
+            phase = (ticks % self.LOOP_PERIOD_MS) / self.LOOP_PERIOD_MS
+            frame = frames[int(phase * len(frames)) % len(frames)]
+        else:
+            frame = frames[0]
+        screen.blit(frame, (center[0] - offset_x, center[1] - offset_y))
+
+    def _get(self, name):
+        overlay = self._overlays.get(name)
+        if overlay is None:
+            overlay = self._builders[name]()
+            self._overlays[name] = overlay
+        return overlay
+
+    def _loop_ticks(self):
+        """Clock times in ms at which the loop frames are sampled"""
+        return [index * self.LOOP_PERIOD_MS / self.FRAMES_PER_LOOP for index in range(self.FRAMES_PER_LOOP)]
+
+    def _build_shield(self):
+        self._shield_sprite = SpriteUtil(self.SHIELD_SPRITE_PATH)
+        shield_image = self._shield_sprite.get_transformed(self.SHIELD_FRAME, self.SHIELD_SIZE)
+        return [shield_image], (shield_image.get_width() // 2, shield_image.get_height() // 2)
+
+    def _build_vulnerable(self):
+        # Colors are drawn opaque, as they were when drawn straight onto the screen
+        half = 110
+        text = FontRegistry.get_instance().render("3x", 20, (255, 50, 50), bold=True)
+        frames = []
+        for ticks in self._loop_ticks():
+            surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            center = (half, half)
+
+            # Red aura
+            pygame.draw.circle(surface, (180, 50, 50), center, 75, 2)
+
+            # "3x" text
+            surface.blit(text, text.get_rect(center=(center[0], center[1] - 90)))
+
+            # Small lightning bolts
+            angle = ticks * 0.001
+            for i in range(3):
+                bolt_angle = angle + i * 2*math.pi/3
+                x = center[0] + 75 * math.cos(bolt_angle)
+                y = center[1] + 75 * math.sin(bolt_angle)
+                points = [
+                    (x, y - 10),
+                    (x - 4, y - 3),
+                    (x + 4, y + 3),
+                    (x - 4, y + 10)
+                ]
+                pygame.draw.lines(surface, (255, 100, 50), False, points, 2)
+            frames.append(SurfaceFormat.get_instance().normalize(surface))
+        return frames, (half, half)
+
+    def _build_tunneling(self):
+        # Colors are drawn opaque, as they were when drawn straight onto the screen
+        half = 120
+        fonts = FontRegistry.get_instance()
+        text = fonts.render("Q", 18, (100, 255, 255), bold=True)
+        shadow = fonts.render("Q", 18, (0, 0, 0), bold=True)
+        frames = []
+        for ticks in self._loop_ticks():
+            surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            center = (half, half)
+
+            # Pulsing quantum field
+            time_factor = ticks * 0.003
+            pulse = 0.8 + 0.2 * math.sin(time_factor)
+            radius = int(85 * pulse)
+            pygame.draw.circle(surface, (100, 255, 255), center, radius, 3)
+            pygame.draw.circle(surface, (150, 255, 255), center, radius - 10, 2)
+
+            # "Q" text with a shadow for readability
+            surface.blit(shadow, shadow.get_rect(center=(center[0] + 1, center[1] - radius - 14)))
+            surface.blit(text, text.get_rect(center=(center[0], center[1] - radius - 15)))
+
+            # Quantum particles around the character
+            for i in range(6):
+                angle = time_factor + i * math.pi / 3
+                particle_x = center[0] + (radius + 5) * math.cos(angle)
+                particle_y = center[1] + (radius + 5) * math.sin(angle)
+                particle_size = 3 + int(2 * math.sin(time_factor * 2 + i))
+                pygame.draw.circle(surface, (100, 255, 255), (int(particle_x), int(particle_y)), particle_size)
+            frames.append(SurfaceFormat.get_instance().normalize(surface))
+        return frames, (half, half)
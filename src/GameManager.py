@@ -3,14 +3,15 @@ import sys
 from Characters.Mage import Mage
 from Characters.Wizard import Wizard
 from Utils.HealthBar import HealthBar
-from pygame.sprite import LayeredUpdates
-import random
+from Utils.RandomService import RandomService
+from SpriteUtil.SpriteUtil import SpriteUtil
 from TurnIndicator import TurnIndicator
 from Effects.DamageIndicator import DamageIndicator
 from Effects.DamageFlash import DamageFlash
 from Effects.GameOver import GameOver
 from Effects.CardPlayedDisplay import CardPlayedDisplay
 from Effects.QuantumTunnelingIndicator import QuantumTunnelingIndicator
+from Effects.StatusOverlays import StatusOverlays
 from Spells.ElementalWeather.Rain import Rain
 from Spells.ElementalWeather.WindTornado import WindTornado
 from Spells.ElementalWeather.Heatwave import HeatWave
@@ -21,16 +22,33 @@ from Cards.PhaseBias import PhaseBias
 from Spells.ElementalWeather.WeatherSpells import WeatherSpells
 from WeatherManager import WeatherManager
 from Utils.PhaseBiasManager import PhaseBiasManager
+from Utils.FontRegistry import FontRegistry
+from Utils.RenderPipeline import RenderPipeline
+from SpriteUtil.SurfaceFormat import SurfaceFormat
+from QuantumMechanics.MeasurementReservoir import MeasurementReservoir
+from QuantumMechanics.CollapseWorker import CollapseWorker
 import os
+import time
 class GameManager:
     def __init__(self):
         # Initialize Pygame
         pygame.init()
 
+        # Fonts and rendered HUD text are shared by everything drawn below
+        self.fonts = FontRegistry.get_instance()
+
         # Set up the display
         self.SCREEN_WIDTH = 1100
         self.SCREEN_HEIGHT = 700
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.display = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+
+        # Everything draws on the pipeline's back buffer, which pushes only what changed
+        self.render_pipeline = RenderPipeline(self.display)
+        self.screen = self.render_pipeline.surface
+        
+        # Pre-sample every card circuit in one batched job so collapses are served from a buffer.
+        # This runs on the collapse worker, which also pulls in qiskit off the main thread.
+        CollapseWorker.get_instance().submit(MeasurementReservoir.get_instance().prime)
         
         # Initialize effects
         self.turn_indicator = TurnIndicator(self.screen)
@@ -40,6 +58,7 @@ class GameManager:
         self.card_display = CardPlayedDisplay(self.screen)
         self.phase_bias_manager = PhaseBiasManager(self.screen)
         self.quantum_tunneling_indicator = QuantumTunnelingIndicator(self.screen)
+        StatusOverlays.get_instance().preload()
         
         # Initialize characters
         self.wizard = Wizard(self.screen, (180,320))
@@ -73,12 +92,18 @@ class GameManager:
         self.clock = pygame.time.Clock()
         self.dt = 0  # Time delta between frames
 
+        # Click-to-first-frame latency (seconds)
+        self.click_time = None
+        self.click_latency_count = 0
+        self.last_click_latency = 0.0
+        self.max_click_latency = 0.0
+
     def setup_display(self):
         dir_path = os.path.dirname(os.path.realpath(__file__))
         parent1 = os.path.dirname(dir_path)
         path = "./Assets/image.png"
         total_path = os.path.join(parent1, path)
-        background = pygame.image.load(total_path)
+        background = SurfaceFormat.get_instance().normalize(pygame.image.load(total_path))
         background = pygame.transform.scale(background, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         return background
     
@@ -113,12 +138,16 @@ class GameManager:
         
         # Reset turn counter
         self.turn_counter = 1
+
+        # Unload sprite sheets only the previous characters were using
+        SpriteUtil.purge_unused()
+        self.render_pipeline.invalidate()
     
     def start_game(self):
         clock = pygame.time.Clock()
-        game_assets = self.setup_display()
+        self.render_pipeline.set_background(self.setup_display())
         running = True
-        initiative = random.randint(0,1)
+        initiative = RandomService.get_instance().stream('game').randint(0,1)
         mage_turn = False
         wizard_turn = True
         
@@ -160,9 +189,10 @@ class GameManager:
                     else:
                         running = False
             
-            # Draw background
-            self.screen.blit(game_assets, (0, 0))
-            self.weather_manager.animate_weather()
+            # Restore the background under what was drawn last frame
+            self.render_pipeline.begin_frame()
+            with self.render_pipeline.layer('weather'):
+                self.weather_manager.animate_weather()
             # wind.animate_spell()
             # Update effects
             self.damage_indicator.update()
@@ -171,24 +201,26 @@ class GameManager:
             self.quantum_tunneling_indicator.update()
             
             # Render card display (in background, before characters)
-            self.card_display.render()
+            with self.render_pipeline.layer('cards'):
+                self.card_display.render()
             
-            # Draw turn counter
-            font = pygame.font.SysFont('Arial', 24)
-            turn_text = font.render(f"Turn {self.turn_counter}", True, (255, 255, 255))
-            self.screen.blit(turn_text, (20, 20))
-            
-            # Draw current player indicator if game not over
-            if not self.game_over.is_game_over:
-                current_player = "Wizard's Turn" if wizard_turn else "Mage's Turn"
-                player_text = font.render(current_player, True, (255, 255, 255))
-                self.screen.blit(player_text, (20, 50))
+            with self.render_pipeline.layer('indicators'):
+                # Draw turn counter
+                turn_text = self.fonts.render(f"Turn {self.turn_counter}", 24, (255, 255, 255))
+                self.screen.blit(turn_text, (20, 20))
+                
+                # Draw current player indicator if game not over
+                if not self.game_over.is_game_over:
+                    current_player = "Wizard's Turn" if wizard_turn else "Mage's Turn"
+                    player_text = self.fonts.render(current_player, 24, (255, 255, 255))
+                    self.screen.blit(player_text, (20, 50))
             
-            # Animate characters
+            # Animate characters (with their health bars, hands and spells)
             mage_card_x = self.SCREEN_WIDTH // 2 - 350
             mage_card_y = self.SCREEN_HEIGHT - 50
-            mage_turn_result = self.mage.animate(deck_position=(mage_card_x,mage_card_y), target=self.wizard, turn=mage_turn and not self.game_over.is_game_over, weather_manager=self.weather_manager)  
-            wizard_turn_result = self.wizard.animate(deck_position=(mage_card_x,mage_card_y), target=self.mage, turn=wizard_turn and not self.game_over.is_game_over, weather_manager=self.weather_manager)
+            with self.render_pipeline.layer('characters'):
+                mage_turn_result = self.mage.animate(deck_position=(mage_card_x,mage_card_y), target=self.wizard, turn=mage_turn and not self.game_over.is_game_over, weather_manager=self.weather_manager)  
+                wizard_turn_result = self.wizard.animate(deck_position=(mage_card_x,mage_card_y), target=self.mage, turn=wizard_turn and not self.game_over.is_game_over, weather_manager=self.weather_manager)
             
             # Check for game over conditions
             if not self.game_over.is_game_over:
@@ -219,29 +251,56 @@ class GameManager:
                         self.turn_counter += 1  # Increment turn counter after full round
                         self.turn_indicator.start_transition(self.mage)
             
-            # Render damage indicators (after characters but before turn indicator)
-            self.damage_indicator.render()
+            with self.render_pipeline.layer('indicators'):
+                # Render damage indicators (after characters but before turn indicator)
+                self.damage_indicator.render()
 
-            # Render quantum tunneling indicators
-            self.quantum_tunneling_indicator.render()
+                # Render quantum tunneling indicators
+                self.quantum_tunneling_indicator.render()
 
-            # Update and render turn indicator if game not over
-            if not self.game_over.is_game_over:
-                self.turn_indicator.update()
-                self.turn_indicator.render()
-            
-            # Update and render game over screen
-            self.game_over.update()
-            self.game_over.render()
-            
-            # Render Phase Bias Manager (on top of everything)
-            self.phase_bias_manager.render()
+            with self.render_pipeline.layer('overlays'):
+                # Update and render turn indicator if game not over
+                if not self.game_over.is_game_over:
+                    self.turn_indicator.update()
+                    self.turn_indicator.render()
+                
+                # Update and render game over screen
+                self.game_over.update()
+                self.game_over.render()
+                
+                # Render Phase Bias Manager (on top of everything)
+                self.phase_bias_manager.render()
+
+            self.render_pipeline.present()
+
+            # Time from the last card click to the first frame presented after it
+            if self.click_time is not None:
+                self.record_click_latency(time.perf_counter() - self.click_time)
+                self.click_time = None
 
-            pygame.display.flip()
             clock.tick(20)
+        CollapseWorker.get_instance().shutdown()
         pygame.quit()
         sys.exit()
 
+    def record_click_latency(self, elapsed):
+        """Add one click-to-first-frame measurement"""
+        self.click_latency_count += 1
+        self.last_click_latency = elapsed
+        self.max_click_latency = max(self.max_click_latency, elapsed)
+
+    def get_click_latency_stats(self):
+        """Return click-to-first-frame latency in milliseconds"""
+        return {
+            'clicks': self.click_latency_count,
+            'last_ms': self.last_click_latency * 1000,
+            'max_ms': self.max_click_latency * 1000
+        }
+
+    def get_render_stats(self):
+        """Return the share of the screen pushed to the display each frame"""
+        return self.render_pipeline.stats()
+
     def handle_events(self, event, mage_turn, wizard_turn):
         if event.type == pygame.QUIT:
             return False
@@ -254,6 +313,7 @@ class GameManager:
         elif event.type == pygame.MOUSEBUTTONDOWN:
             card = None
             # Handle card clicks
+            self.click_time = time.perf_counter()
             mouse_pos = pygame.mouse.get_pos()
             if mage_turn == True:
                 self.mage.handle_card_click(mouse_pos)
@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from QuantumMechanics.QuantumBackend import QuantumBackend
+from QuantumMechanics.MeasurementReservoir import MeasurementReservoir
+
+
+class CircuitTemplates:
+    """
+    Shared cache of the circuit shapes used in a game.
+
+    Every distinct superposition, tunneling angle and entanglement width is
+    built once, prepared by the active engine (transpiled, on Aer) and stored
+    under a hashable key. All cards collapsing the same shape receive the
+    same circuit instance, which must be treated as read-only. Entanglement
+    templates are sampled by the stabilizer tableau rather than the engine,
+    so they skip the engine preparation (Aer cannot transpile a whole deck
+    of pairs past its qubit limit).
+
+    Tunneling angles are continuous, so the cache is bounded and evicts the
+    least recently used template, together with the engines' cached copies, its
+    reservoir buffer and its compiled stabilizer program.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, backend=None, max_templates=64):
+        self.backend = backend if backend is not None else QuantumBackend.get_instance()
+        self.max_templates = max_templates
+        self._templates = OrderedDict()  # template key -> circuit
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared template cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def superposition(self, spec):
+        """Return the shared circuit for a SuperpositionSpec"""
+        from QuantumMechanics.Superposition import Superposition
+        return self._get(('superposition',) + spec.key(),
+                         lambda: Superposition.build_circuit(spec, name=self._superposition_name(spec)))
+
+    def tunneling(self, probability):
+        """Return the shared tunneling circuit for a tunneling probability"""
+        from QuantumMechanics.QuantumTunneling import QuantumTunneling
+        probability = round(float(probability), 6)
+        return self._get(('tunneling', probability),
+                         lambda: QuantumTunneling.build_tunneling_circuit(probability))
+
+    def entanglement(self, num_pairs=2):
+        """Return the shared entanglement circuit for a number of pairs"""
+        from QuantumMechanics.Entanglement import QuantumEntanglement
+        return self._get(('entanglement', num_pairs),
+                         lambda: QuantumEntanglement.build_entanglement_circuit(num_pairs),
+                         prepare=False)
+
+    def stats(self):
+        """Return the cache counters"""
+        with self._lock:
+            return {
+                'templates': len(self._templates),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    @staticmethod
+    def _superposition_name(spec):
+        if not spec.is_biased():
+            return 'superposition' if spec.total_states == 2 else f'superposition_{spec.total_states}'
+        if spec.total_states == 2:
+            return f'superposition_bias_{spec.favored_state}'
+        return f'superposition_{spec.total_states}_bias_{spec.favored_state}'
+
+    def _get(self, key, build, prepare=True):
+        """Return the template stored under key, building it on a miss
+
+        Args:
+            key: Hashable template key
+            build: Callable building the circuit
+            prepare: Let the active engine prepare the circuit ahead of sampling
+        """
+        with self._lock:
+            circuit = self._templates.get(key)
+            if circuit is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return circuit
+            self.misses += 1
+
+        circuit = build()
+        if prepare:
+            self.backend.prepare(circuit)
+
+        evicted = []
+        with self._lock:
+            # Another thread may have built the same template meanwhile
+            existing = self._templates.get(key)
+            if existing is not None:
+                self._templates.move_to_end(key)
+                return existing
+            self._templates[key] = circuit
+            while len(self._templates) > self.max_templates:
+                evicted.append(self._templates.popitem(last=False)[1])
+                self.evictions += 1
+
+        if evicted:
+            from QuantumMechanics.Entanglement import QuantumEntanglement
+        for old_circuit in evicted:
+            self.backend.forget_circuit(old_circuit)
+            MeasurementReservoir.get_instance().unregister(old_circuit)
+            QuantumEntanglement.forget_circuit(old_circuit)
+        return circuit
@@ -0,0 +1,203 @@
+import threading
+import numpy as np
+
+
+class ClosedFormSampler:
+    """
+    Exact NumPy sampler for the small circuits used by the cards.
+
+    The card circuits only apply a handful of single-qubit rotations (and the
+    CX gates of the entanglement pairing) before a terminal measurement, so
+    their outcome distribution can be computed directly from the statevector
+    and sampled with a numpy Generator. This skips the Aer job submission
+    entirely, which is useful for headless simulations and low-end machines.
+    """
+
+    MAX_QUBITS = 4
+
+    def __init__(self, rng=None, distribution=None):
+        """Create a sampler
+
+        Args:
+            rng: numpy Generator used when sample() is not given one
+            distribution: Function returning a circuit's (outcomes, probabilities),
+                          defaults to the closed-form distribution()
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._compute = distribution if distribution is not None else self.distribution
+        self._distributions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _single_qubit_matrix(name, params):
+        """Return the 2x2 unitary for a supported single-qubit gate"""
+        if name == 'h':
+            return np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+        if name == 'x':
+            return np.array([[0, 1], [1, 0]], dtype=complex)
+        if name == 'y':
+            return np.array([[0, -1j], [1j, 0]], dtype=complex)
+        if name == 'z':
+            return np.array([[1, 0], [0, -1]], dtype=complex)
+        if name == 's':
+            return np.array([[1, 0], [0, 1j]], dtype=complex)
+        if name == 'sdg':
+            return np.array([[1, 0], [0, -1j]], dtype=complex)
+        theta = float(params[0]) if params else 0.0
+        if name == 'rx':
+            return np.array([[np.cos(theta / 2), -1j * np.sin(theta / 2)],
+                             [-1j * np.sin(theta / 2), np.cos(theta / 2)]], dtype=complex)
+        if name == 'ry':
+            return np.array([[np.cos(theta / 2), -np.sin(theta / 2)],
+                             [np.sin(theta / 2), np.cos(theta / 2)]], dtype=complex)
+        if name == 'rz':
+            return np.array([[np.exp(-0.5j * theta), 0],
+                             [0, np.exp(0.5j * theta)]], dtype=complex)
+        return None
+
+    @staticmethod
+    def _apply_single(state, matrix, qubit, num_qubits):
+        """Apply a 2x2 unitary to one qubit of a little-endian statevector"""
+        tensor = state.reshape([2] * num_qubits)
+        axis = num_qubits - 1 - qubit
+        tensor = np.tensordot(matrix, tensor, axes=([1], [axis]))
+        tensor = np.moveaxis(tensor, 0, axis)
+        return tensor.reshape(-1)
+
+    @staticmethod
+    def _apply_cx(state, control, target):
+        """Apply a CX gate to a little-endian statevector"""
+        indices = np.arange(state.shape[0])
+        control_set = ((indices >> control) & 1) == 1
+        new_state = state.copy()
+        new_state[control_set] = state[indices[control_set] ^ (1 << target)]
+        return new_state
+
+    @staticmethod
+    def distribution(circuit):
+        """Compute the exact distribution of a circuit's measured bitstrings
+
+        Returns:
+            tuple: (outcomes, probabilities) where outcomes are qiskit-style
+                   bitstrings (classical bit 0 rightmost)
+
+        Raises:
+            ValueError: If the circuit uses an unsupported gate, is too wide,
+                        or acts on a qubit after measuring it
+        """
+        num_qubits = circuit.num_qubits
+        if num_qubits > ClosedFormSampler.MAX_QUBITS:
+            raise ValueError(f"Closed-form sampling supports at most {ClosedFormSampler.MAX_QUBITS} qubits")
+
+        state = np.zeros(2 ** num_qubits, dtype=complex)
+        state[0] = 1.0
+        measured = {}  # qubit -> classical bit
+
+        for instruction in circuit.data:
+            name = instruction.operation.name
+            qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+            if name == 'barrier':
+                continue
+            if any(qubit in measured for qubit in qubits):
+                raise ValueError("Closed-form sampling requires measurements at the end of the circuit")
+            if name == 'measure':
+                clbit = circuit.find_bit(instruction.clbits[0]).index
+                measured[qubits[0]] = clbit
+                continue
+            if name == 'cx':
+                state = ClosedFormSampler._apply_cx(state, qubits[0], qubits[1])
+                continue
+            matrix = ClosedFormSampler._single_qubit_matrix(name, instruction.operation.params)
+            if matrix is None:
+                raise ValueError(f"Closed-form sampling does not support the '{name}' gate")
+            state = ClosedFormSampler._apply_single(state, matrix, qubits[0], num_qubits)
+
+        return ClosedFormSampler.measured_outcomes(np.abs(state) ** 2, measured, circuit.num_clbits)
+
+    @staticmethod
+    def measured_outcomes(probabilities, measured, num_clbits):
+        """Map basis-state probabilities onto the measured classical bitstrings
+
+        Args:
+            probabilities: Probability of each little-endian basis state
+            measured: Qubit -> classical bit it is measured into
+            num_clbits: Width of the classical register
+
+        Returns:
+            tuple: (outcomes, probabilities) with qiskit-style bitstrings
+                   (classical bit 0 rightmost), sorted
+        """
+        outcome_probabilities = {}
+        for index, probability in enumerate(probabilities):
+            if probability < 1e-15:
+                continue
+            value = 0
+            for qubit, clbit in measured.items():
+                value |= ((index >> qubit) & 1) << clbit
+            outcome = format(value, f'0{num_clbits}b')
+            outcome_probabilities[outcome] = outcome_probabilities.get(outcome, 0.0) + probability
+
+        outcomes = sorted(outcome_probabilities)
+        weights = np.array([outcome_probabilities[outcome] for outcome in outcomes])
+        return outcomes, weights / weights.sum()
+
+    def _cached_distribution(self, circuit):
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        key = QuantumBackend.circuit_key(circuit)
+        with self._lock:
+            cached = self._distributions.get(key)
+        if cached is None:
+            cached = self._compute(circuit)
+            with self._lock:
+                self._distributions[key] = cached
+        return cached
+
+    def prepare(self, circuit):
+        """Compute and cache the distribution of a circuit shape ahead of sampling"""
+        self._cached_distribution(circuit)
+
+    def forget(self, circuit):
+        """Drop the cached distribution of a circuit shape"""
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        with self._lock:
+            self._distributions.pop(QuantumBackend.circuit_key(circuit), None)
+
+    def sample(self, circuit, shots=1, rng=None):
+        """Sample measured bitstrings for a circuit
+
+        Args:
+            circuit: Circuit to sample
+            shots: Number of shots
+            rng: numpy Generator for this batch, defaults to the sampler's own
+
+        Returns:
+            list: One bitstring per shot
+        """
+        outcomes, probabilities = self._cached_distribution(circuit)
+        rng = rng if rng is not None else self.rng
+        picks = rng.choice(len(outcomes), size=shots, p=probabilities)
+        return [outcomes[pick] for pick in picks]
+
+    @staticmethod
+    def chi_square_statistic(counts, outcomes, probabilities, shots):
+        """Pearson chi-square statistic of observed counts against expected probabilities"""
+        statistic = 0.0
+        for outcome, probability in zip(outcomes, probabilities):
+            expected = probability * shots
+            if expected > 0:
+                statistic += (counts.get(outcome, 0) - expected) ** 2 / expected
+        # Any outcome that should be impossible is an immediate mismatch
+        if any(outcome not in outcomes for outcome in counts):
+            statistic = float('inf')
+        return statistic
+
+    @staticmethod
+    def chi_square_critical_value(degrees_of_freedom, z_score=3.09):
+        """Critical chi-square value (Wilson-Hilferty approximation)
+
+        The default z-score corresponds to a 0.1% significance level.
+        """
+        if degrees_of_freedom <= 0:
+            return 0.0
+        k = float(degrees_of_freedom)
+        return k * (1 - 2 / (9 * k) + z_score * np.sqrt(2 / (9 * k))) ** 3
@@ -0,0 +1,38 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CollapseWorker:
+    """
+    Thread pool that runs card collapses off the render loop.
+
+    Cards submit their collapse and poll the returned future once per frame,
+    so a slow simulator job never stalls the frame loop.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collapse')
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared worker, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def submit(self, collapse, *args):
+        """Run a collapse function on the pool
+
+        Returns:
+            concurrent.futures.Future: Future holding the collapsed state
+        """
+        return self.executor.submit(collapse, *args)
+
+    def shutdown(self):
+        """Stop the pool without waiting for in-flight collapses"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,165 @@
+import argparse
+import json
+import time
+from QuantumMechanics.QuantumBackend import QuantumBackend
+from QuantumMechanics.ClosedFormSampler import ClosedFormSampler
+from QuantumMechanics.CircuitTemplates import CircuitTemplates
+from QuantumMechanics.SuperpositionSpec import SuperpositionSpec
+
+
+class DistributionAudit:
+    """
+    Checks that every card circuit produces the odds the game declares.
+
+    Every variant (unbiased and phase-biased superposition cards, the 4-state
+    superpositions, quantum tunneling and the afflication/weather
+    entanglement) is built, de-duplicated by shape and run in a single
+    multi-circuit Aer job. The empirical counts are compared against the
+    declared odds with a chi-square test.
+
+    Run from src/ with:
+        python -m QuantumMechanics.DistributionAudit [--shots N] [--json]
+    """
+
+    def __init__(self, shots=20000, backend=None):
+        self.shots = shots
+        self.backend = backend if backend is not None else QuantumBackend.get_instance()
+        self.templates = CircuitTemplates.get_instance()
+
+    @staticmethod
+    def biased_odds(states, favored_state, bias_strength):
+        """Declared odds of a phase-biased collapse: the favored state gets
+        bias_strength and the rest is split evenly"""
+        other = (1 - bias_strength) / (len(states) - 1)
+        return {state: (bias_strength if state == favored_state else other) for state in states}
+
+    @staticmethod
+    def uniform_odds(states):
+        return {state: 1 / len(states) for state in states}
+
+    def build_cases(self):
+        """Build every audited circuit with the odds the game declares for it
+
+        Returns:
+            list: One dict per case with 'name', 'circuit' and 'declared'
+        """
+        from Cards.DuelistParadox import DuelistParadox
+        from Cards.CollapseBarrier import CollapseBarrier
+        from Cards.MagicMissive import MagicMissive
+        from Cards.ThanosSnapCard import ThanosSnapCard
+        from Cards.PhaseBias import PhaseBias
+        from Cards.QuantumTunneling import QuantumTunneling
+        from QuantumMechanics.Entanglement import QuantumEntanglement
+
+        cases = []
+        bias_strength = PhaseBias.BIAS_STRENGTH
+
+        # Superposition cards, declared states come from get_possible_states
+        for card_class in (DuelistParadox, CollapseBarrier, MagicMissive, ThanosSnapCard):
+            states = sorted(card_class.get_possible_states(None))
+            spec = SuperpositionSpec(total_states=len(states))
+            cases.append({
+                'name': f'{card_class.__name__}',
+                'circuit': self.templates.superposition(spec),
+                'declared': self.uniform_odds(states)
+            })
+            for favored_state in states:
+                spec = SuperpositionSpec(len(states), favored_state, bias_strength)
+                cases.append({
+                    'name': f'{card_class.__name__} bias->{favored_state}',
+                    'circuit': self.templates.superposition(spec),
+                    'declared': self.biased_odds(states, favored_state, bias_strength)
+                })
+
+        # 4-state superposition, unbiased and biased to each state
+        states = ['00', '01', '10', '11']
+        cases.append({
+            'name': '4-state',
+            'circuit': self.templates.superposition(SuperpositionSpec(total_states=4)),
+            'declared': self.uniform_odds(states)
+        })
+        for favored_state in states:
+            cases.append({
+                'name': f'4-state bias->{favored_state}',
+                'circuit': self.templates.superposition(SuperpositionSpec(4, favored_state, bias_strength)),
+                'declared': self.biased_odds(states, favored_state, bias_strength)
+            })
+
+        # Quantum tunneling, '1' means the attack tunnels through
+        probability = QuantumTunneling.TUNNELING_PROBABILITY
+        cases.append({
+            'name': f'tunneling p={probability}',
+            'circuit': self.templates.tunneling(probability),
+            'declared': {'1': probability, '0': 1 - probability}
+        })
+
+        # Entanglement, the pairing declared by QuantumEntanglement's collapse handlers
+        entanglement = QuantumEntanglement(None, None)
+        declared = {}
+        for weather_state in states:
+            afflication_state = entanglement.handle_weather_collapse(weather_state)
+            declared[afflication_state + weather_state] = 1 / len(states)
+        cases.append({
+            'name': 'afflication/weather entanglement',
+            'circuit': self.templates.entanglement(),
+            'declared': declared
+        })
+        return cases
+
+    def run(self):
+        """Run every case in one Aer job and test it against its declared odds
+
+        Returns:
+            list: One dict per case with the empirical and declared
+                  distributions, the chi-square statistic, the critical value
+                  and whether the case passed
+        """
+        cases = self.build_cases()
+
+        # Identical shapes share one circuit in the job
+        unique = {}
+        for case in cases:
+            unique.setdefault(QuantumBackend.circuit_key(case['circuit']), case['circuit'])
+        keys = list(unique)
+        result = self.backend.run([unique[key] for key in keys], shots=self.shots)
+        counts_by_key = {key: result.get_counts(index) for index, key in enumerate(keys)}
+
+        report = []
+        for case in cases:
+            counts = counts_by_key[QuantumBackend.circuit_key(case['circuit'])]
+            outcomes = sorted(case['declared'])
+            probabilities = [case['declared'][outcome] for outcome in outcomes]
+            statistic = ClosedFormSampler.chi_square_statistic(counts, outcomes, probabilities, self.shots)
+            critical = ClosedFormSampler.chi_square_critical_value(len(outcomes) - 1)
+            report.append({
+                'case': case['name'],
+                'declared': {outcome: round(probability, 4) for outcome, probability in case['declared'].items()},
+                'observed': {outcome: round(count / self.shots, 4) for outcome, count in sorted(counts.items())},
+                'chi_square': statistic,
+                'critical_value': critical,
+                'passed': statistic <= critical
+            })
+        return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Audit card circuit odds against their declared odds")
+    parser.add_argument('--shots', type=int, default=20000, help="Shots per circuit")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = DistributionAudit(shots=args.shots).run()
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        for entry in report:
+            status = "PASS" if entry['passed'] else "FAIL"
+            print(f"{status} {entry['case']}: chi2={entry['chi_square']:.2f} "
+                  f"critical={entry['critical_value']:.2f}")
+            print(f"     declared {entry['declared']}")
+            print(f"     observed {entry['observed']}")
+        failed = sum(1 for entry in report if not entry['passed'])
+        print(f"{len(report) - failed}/{len(report)} cases match their declared odds ({elapsed:.2f}s)")
@@ -0,0 +1,70 @@
+import threading
+from QuantumMechanics.Engines.QuantumEngine import QuantumEngine
+from QuantumMechanics.QiskitLoader import QiskitLoader
+from Utils.RandomService import RandomService
+
+
+class AerEngine(QuantumEngine):
+    """
+    Samples circuits on a single long-lived AerSimulator.
+
+    Circuits are transpiled once per distinct shape and every call submits
+    one job for all the circuits it is given, seeded from RandomService.
+    """
+
+    name = 'aer'
+
+    def __init__(self):
+        self._simulator = None
+        self._transpiled = {}
+        self._lock = threading.Lock()
+
+    @property
+    def simulator(self):
+        """The shared AerSimulator, created on first use"""
+        if self._simulator is None:
+            with self._lock:
+                if self._simulator is None:
+                    self._simulator = QiskitLoader.aer_simulator()
+        return self._simulator
+
+    def get_transpiled(self, circuit):
+        """Return the transpiled version of a circuit, transpiling only once per shape"""
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        key = QuantumBackend.circuit_key(circuit)
+        with self._lock:
+            compiled = self._transpiled.get(key)
+        if compiled is None:
+            compiled = QiskitLoader.transpile(circuit, self.simulator)
+            with self._lock:
+                self._transpiled[key] = compiled
+        return compiled
+
+    def run(self, circuits, shots=1, memory=False):
+        """Run one circuit or a list of circuits as a single simulator job
+
+        Returns:
+            The qiskit Result of the job
+        """
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        if isinstance(circuits, QiskitLoader.quantum_circuit_class()):
+            compiled = self.get_transpiled(circuits)
+            keys = [QuantumBackend.circuit_key(circuits)]
+        else:
+            compiled = [self.get_transpiled(circuit) for circuit in circuits]
+            keys = [QuantumBackend.circuit_key(circuit) for circuit in circuits]
+        seed = RandomService.get_instance().simulator_seed(keys)
+        return self.simulator.run(compiled, shots=shots, memory=memory, seed_simulator=seed).result()
+
+    def sample_memory(self, circuits, shots=1):
+        circuits = list(circuits)
+        result = self.run(circuits, shots=shots, memory=True)
+        return [result.get_memory(index) for index in range(len(circuits))]
+
+    def prepare(self, circuit):
+        self.get_transpiled(circuit)
+
+    def forget(self, circuit):
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        with self._lock:
+            self._transpiled.pop(QuantumBackend.circuit_key(circuit), None)
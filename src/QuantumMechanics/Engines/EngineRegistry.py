@@ -0,0 +1,50 @@
+import os
+from QuantumMechanics.Engines.AerEngine import AerEngine
+from QuantumMechanics.Engines.NumpyEngine import NumpyEngine
+from QuantumMechanics.Engines.StatevectorEngine import StatevectorEngine
+
+
+class EngineRegistry:
+    """
+    Registry of the available quantum engines.
+
+    The default engine is 'aer'. It can be overridden with the
+    DND_QUANTUM_ENGINE environment variable (e.g. DND_QUANTUM_ENGINE=numpy for
+    headless batch runs) or explicitly through QuantumBackend.set_engine().
+    """
+
+    ENV_VAR = 'DND_QUANTUM_ENGINE'
+    DEFAULT_ENGINE = 'aer'
+
+    _engines = {
+        AerEngine.name: AerEngine,
+        StatevectorEngine.name: StatevectorEngine,
+        NumpyEngine.name: NumpyEngine
+    }
+
+    @classmethod
+    def register(cls, name, engine_class):
+        """Register an engine class under a name"""
+        cls._engines[name] = engine_class
+
+    @classmethod
+    def available(cls):
+        """Return the names of all registered engines"""
+        return tuple(cls._engines)
+
+    @classmethod
+    def create(cls, name):
+        """Instantiate the engine registered under a name
+
+        Raises:
+            ValueError: If no engine is registered under the name
+        """
+        engine_class = cls._engines.get(name)
+        if engine_class is None:
+            raise ValueError(f"Unknown quantum engine '{name}', expected one of {cls.available()}")
+        return engine_class()
+
+    @classmethod
+    def default_name(cls):
+        """Return the engine selected by the environment, or the default"""
+        return os.environ.get(cls.ENV_VAR, cls.DEFAULT_ENGINE).strip().lower() or cls.DEFAULT_ENGINE
@@ -0,0 +1,32 @@
+from QuantumMechanics.Engines.QuantumEngine import QuantumEngine
+from QuantumMechanics.ClosedFormSampler import ClosedFormSampler
+from Utils.RandomService import RandomService
+
+
+class NumpyEngine(QuantumEngine):
+    """
+    Samples the exact closed-form distribution with a NumPy generator.
+
+    Needs neither qiskit-aer nor a job submission, which makes it the
+    cheapest engine for headless batch simulations.
+    """
+
+    name = 'numpy'
+
+    def __init__(self, rng=None):
+        # Without an explicit generator every batch is seeded per circuit
+        self.rng = rng
+        self.sampler = ClosedFormSampler(rng)
+
+    def sample_memory(self, circuits, shots=1):
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        memories = []
+        for circuit in circuits:
+            rng = self.rng
+            if rng is None:
+                rng = RandomService.get_instance().batch_generator('collapse.numpy', QuantumBackend.circuit_key(circuit))
+            memories.append(self.sampler.sample(circuit, shots, rng))
+        return memories
+
+    def forget(self, circuit):
+        self.sampler.forget(circuit)
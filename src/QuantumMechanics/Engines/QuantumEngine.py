@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+
+class QuantumEngine(ABC):
+    """
+    Interface for the engines that sample card circuits.
+
+    An engine turns a list of circuits into per-shot measured bitstrings.
+    Engines are registered by name in EngineRegistry and selected through
+    QuantumBackend.
+    """
+
+    name = None
+
+    @abstractmethod
+    def sample_memory(self, circuits, shots=1):
+        """Sample per-shot outcomes for a list of circuits
+
+        Returns:
+            list: For each circuit, the list of measured qiskit-style bitstrings
+                  (classical bit 0 rightmost)
+        """
+        pass
+
+    def prepare(self, circuit):
+        """Do any per-shape work ahead of the first sample (e.g. transpiling)"""
+        pass
+
+    def forget(self, circuit):
+        """Drop anything cached for a circuit shape"""
+        pass
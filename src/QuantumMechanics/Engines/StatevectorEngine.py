@@ -0,0 +1,60 @@
+from QuantumMechanics.Engines.QuantumEngine import QuantumEngine
+from QuantumMechanics.QiskitLoader import QiskitLoader
+from QuantumMechanics.ClosedFormSampler import ClosedFormSampler
+from Utils.RandomService import RandomService
+
+
+class StatevectorEngine(QuantumEngine):
+    """
+    Samples circuits from a qiskit.quantum_info.Statevector.
+
+    The statevector of each circuit (without its final measurements) is
+    computed once, mapped onto the classical bits and then sampled with a
+    NumPy generator. Caching and sampling are shared with the numpy engine
+    through a ClosedFormSampler. Supports any gate qiskit can simulate, but
+    measurements must come at the end of the circuit.
+    """
+
+    name = 'statevector'
+
+    def __init__(self, rng=None):
+        # Without an explicit generator every batch is seeded per circuit
+        self.rng = rng
+        self.sampler = ClosedFormSampler(rng, distribution=self.distribution)
+
+    @staticmethod
+    def distribution(circuit):
+        """Compute the distribution of a circuit's measured bitstrings
+
+        Returns:
+            tuple: (outcomes, probabilities) with qiskit-style bitstrings
+        """
+        measured = {}  # qubit -> classical bit
+        for instruction in circuit.data:
+            if instruction.operation.name == 'measure':
+                qubit = circuit.find_bit(instruction.qubits[0]).index
+                measured[qubit] = circuit.find_bit(instruction.clbits[0]).index
+
+        unitary_part = circuit.remove_final_measurements(inplace=False)
+        if any(instruction.operation.name == 'measure' for instruction in unitary_part.data):
+            raise ValueError("Statevector sampling requires measurements at the end of the circuit")
+
+        statevector = QiskitLoader.load('qiskit.quantum_info').Statevector.from_instruction(unitary_part)
+        return ClosedFormSampler.measured_outcomes(statevector.probabilities(), measured, circuit.num_clbits)
+
+    def sample_memory(self, circuits, shots=1):
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        memories = []
+        for circuit in circuits:
+            rng = self.rng
+            if rng is None:
+                rng = RandomService.get_instance().batch_generator('collapse.statevector',
+                                                                   QuantumBackend.circuit_key(circuit))
+            memories.append(self.sampler.sample(circuit, shots, rng))
+        return memories
+
+    def prepare(self, circuit):
+        self.sampler.prepare(circuit)
+
+    def forget(self, circuit):
+        self.sampler.forget(circuit)
@@ -1,14 +1,20 @@
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
-from qiskit.primitives import BackendSamplerV2
-from qiskit.quantum_info import Statevector
+import time
 from QuantumMechanics.QuantumStates import QuantumState
+from QuantumMechanics.QuantumBackend import QuantumBackend
+from QuantumMechanics.MeasurementReservoir import MeasurementReservoir
+from QuantumMechanics.StabilizerSampler import StabilizerSampler
+from QuantumMechanics.QiskitLoader import QiskitLoader
+from QuantumMechanics.CircuitTemplates import CircuitTemplates
+from Utils.RandomService import RandomService
 
 class QuantumEntanglement:
     """
     Manages quantum entanglement between ElementalAfflication and ElementalWeather
     using Bell states to ensure correlated outcomes.
     """
+
+    # Shared tableau sampler for Clifford-only entanglement circuits, seeded per collapse
+    _stabilizer = StabilizerSampler()
     
     def __init__(self, screen, weather_manager, game_manager=None):
         self.screen = screen
@@ -24,67 +30,88 @@ class QuantumEntanglement:
         self.weather_state = None
         
         # Create the entangled quantum circuit
-        self.entangled_circuit = QuantumCircuit(4, 4)
         self.setup_entanglement()
         
     def setup_entanglement(self):
         """Create the entangled quantum circuit using Bell state"""
-        # Reset the circuit
-        self.entangled_circuit = QuantumCircuit(4, 4)
+        self.entangled_circuit = CircuitTemplates.get_instance().entanglement()
+
+    @staticmethod
+    def build_entanglement_circuit(num_pairs=2):
+        """Build the circuit that pairs afflication and weather states
+
+        Args:
+            num_pairs: Number of entangled 2-qubit pairs. The default of two
+                       gives the 4-qubit afflication/weather circuit; larger
+                       values entangle a whole hand or deck.
+        """
+        num_qubits = 2 * num_pairs
+        name = 'entanglement' if num_pairs == 2 else f'entanglement_{num_pairs}'
+        entangled_circuit = QiskitLoader.quantum_circuit(num_qubits, num_qubits, name=name)
         
         # First pair (qubits 0,1) for ElementalAfflication
         # Second pair (qubits 2,3) for ElementalWeather
         
         # Create superposition on first qubit of each pair
-        self.entangled_circuit.h([0, 2])
+        entangled_circuit.h(list(range(0, num_qubits, 2)))
         
         # Create entanglement within each pair
-        self.entangled_circuit.cx(0, 1)
-        self.entangled_circuit.cx(2, 3)
+        for first in range(0, num_qubits, 2):
+            entangled_circuit.cx(first, first + 1)
         
         # Create entanglement between pairs
-        self.entangled_circuit.cx(0, 2)
+        for first in range(2, num_qubits, 2):
+            entangled_circuit.cx(0, first)
         
         # Add measurements
-        self.entangled_circuit.measure([0, 1, 2, 3], [0, 1, 2, 3])
-        
+        entangled_circuit.measure(list(range(num_qubits)), list(range(num_qubits)))
+        return entangled_circuit
+
+    @staticmethod
+    def sample_outcome(circuit):
+        """Measure an entanglement circuit once and return the bitstring
+
+        Clifford-only circuits are sampled with the stabilizer tableau, which
+        scales polynomially with the number of qubits. Anything else is served
+        from the measurement reservoir.
+        """
+        if not StabilizerSampler.is_clifford(circuit):
+            return MeasurementReservoir.get_instance().draw(circuit)
+        start = time.perf_counter()
+        rng = RandomService.get_instance().batch_generator('collapse.stabilizer', QuantumBackend.circuit_key(circuit))
+        outcome = QuantumEntanglement._stabilizer.sample(circuit, shots=1, rng=rng)[0]
+        QuantumBackend.get_instance().record_latency(time.perf_counter() - start)
+        return outcome
+
+    @staticmethod
+    def forget_circuit(circuit):
+        """Drop the stabilizer program compiled for a circuit shape"""
+        QuantumEntanglement._stabilizer.forget(circuit)
+
     @staticmethod
     def simulate_entanglement():
-        entangled_circuit = QuantumCircuit(4, 4)
-        
-        # First pair (qubits 0,1) for ElementalAfflication
-        # Second pair (qubits 2,3) for ElementalWeather
-        
-        # Create superposition on first qubit of each pair
-        entangled_circuit.h([0, 2])
-        
-        # Create entanglement within each pair
-        entangled_circuit.cx(0, 1)
-        entangled_circuit.cx(2, 3)
-        
-        # Create entanglement between pairs
-        entangled_circuit.cx(0, 2)
-        
-        # Add measurements
-        entangled_circuit.measure([0, 1, 2, 3], [0, 1, 2, 3])
-        sim = AerSimulator()
-        job = sim.run(entangled_circuit, shots=1)        # run 1,024 shots
-        result = job.result()
-        counts = result.get_counts()
-        outcome = max(counts, key=counts.get)
+        entangled_circuit = CircuitTemplates.get_instance().entanglement()
+        outcome = QuantumEntanglement.sample_outcome(entangled_circuit)
         afflication_state = outcome[0:2]  # First two bits
         weather_state = outcome[2:4]      # Last two bits
         return afflication_state, weather_state
 
+    @staticmethod
+    def simulate_pairs(num_pairs):
+        """Collapse a whole hand or deck of entangled pairs at once
+
+        Returns:
+            list: One 2-bit state per pair, in the same order as the
+                  afflication/weather split of simulate_entanglement
+        """
+        entangled_circuit = CircuitTemplates.get_instance().entanglement(num_pairs)
+        outcome = QuantumEntanglement.sample_outcome(entangled_circuit)
+        return [outcome[index:index + 2] for index in range(0, len(outcome), 2)]
+
 
     def collapse_states(self):
         """Collapse both states at once and return the results"""
-        # Use qiskit to simulate the measurement
-        sim = AerSimulator()
-        job = sim.run(self.entangled_circuit, shots=1)        # run 1,024 shots
-        result = job.result()
-        counts = result.get_counts()
-        return max(counts, key=counts.get)
+        return QuantumEntanglement.sample_outcome(self.entangled_circuit)
         
         # Parse the 4-bit outcome into two 2-bit states
         afflication_state = outcome[0:2]  # First two bits
@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import deque
+from QuantumMechanics.QuantumBackend import QuantumBackend
+
+
+class MeasurementReservoir:
+    """
+    Pre-sampled measurement outcomes for the card circuits.
+
+    Each registered circuit is run once with thousands of shots and the
+    individual shot outcomes are kept in a per-circuit buffer. A collapse pops
+    the next outcome from the buffer, so the simulator is only hit once every
+    few thousand plays. When a buffer runs low it is topped up on a background
+    thread, batching every low buffer into a single job.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, backend=None, batch_shots=4096, low_watermark=256):
+        self.backend = backend if backend is not None else QuantumBackend.get_instance()
+        self.batch_shots = batch_shots
+        self.low_watermark = low_watermark
+
+        self._circuits = {}  # circuit key -> circuit
+        self._buffers = {}   # circuit key -> deque of bitstrings
+        self._pending_refills = set()
+        self._refills_in_flight = set()
+        self._refill_thread = None
+        self._lock = threading.Lock()
+
+        # Counters
+        self.draws = 0
+        self.batches_run = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared reservoir, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def register(self, circuit):
+        """Register a circuit without sampling it and return its key"""
+        key = QuantumBackend.circuit_key(circuit)
+        with self._lock:
+            if key not in self._circuits:
+                self._circuits[key] = circuit
+                self._buffers[key] = deque()
+        return key
+
+    def unregister(self, circuit):
+        """Forget a circuit and drop its buffered outcomes"""
+        key = QuantumBackend.circuit_key(circuit)
+        with self._lock:
+            self._circuits.pop(key, None)
+            self._buffers.pop(key, None)
+            self._pending_refills.discard(key)
+
+    def prime(self, circuits=None):
+        """Fill the buffers of the given circuits in one batched job
+
+        Args:
+            circuits: Circuits to sample, defaults to the canonical card circuits
+        """
+        if circuits is None:
+            circuits = QuantumBackend.canonical_circuits()
+        keys = [self.register(circuit) for circuit in circuits]
+        self._fill(keys)
+
+    def draw(self, circuit):
+        """Return the next measured bitstring for a circuit
+
+        Unknown circuits are registered and sampled on the spot; afterwards
+        every draw is served from the buffer.
+        """
+        start = time.perf_counter()
+        key = self.register(circuit)
+        with self._lock:
+            buffer = self._buffers.get(key)
+            outcome = buffer.popleft() if buffer else None
+            if outcome is not None:
+                remaining = len(buffer)
+                self.draws += 1
+
+        if outcome is None:
+            # Buffer exhausted before the background refill landed
+            memory = self.backend.sample_memory([circuit], shots=self.batch_shots)[0]
+            with self._lock:
+                buffer = self._buffers.get(key)
+                if buffer is not None:
+                    buffer.extend(memory)
+                    outcome = buffer.popleft()
+                    remaining = len(buffer)
+                else:
+                    # Unregistered while sampling, serve the fresh shots directly
+                    outcome = memory[0]
+                    remaining = None
+                self.draws += 1
+                self.batches_run += 1
+
+        if remaining is not None and remaining < self.low_watermark:
+            self._schedule_refill(key)
+
+        self.backend.record_latency(time.perf_counter() - start)
+        return outcome
+
+    def buffer_sizes(self):
+        """Return the number of buffered outcomes per registered circuit"""
+        with self._lock:
+            return {key: len(buffer) for key, buffer in self._buffers.items()}
+
+    def _fill(self, keys):
+        """Sample the given circuits in a single job and append the shots"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        with self._lock:
+            keys = [key for key in keys if key in self._circuits]
+            circuits = [self._circuits[key] for key in keys]
+        if not keys:
+            return
+        memories = self.backend.sample_memory(circuits, shots=self.batch_shots)
+        with self._lock:
+            for key, memory in zip(keys, memories):
+                # Skip circuits unregistered while the job was running
+                if key in self._buffers:
+                    self._buffers[key].extend(memory)
+            self.batches_run += 1
+
+    def _schedule_refill(self, key):
+        """Queue a buffer for background refill"""
+        with self._lock:
+            if key in self._pending_refills or key in self._refills_in_flight:
+                return
+            self._pending_refills.add(key)
+            if self._refill_thread is not None and self._refill_thread.is_alive():
+                return
+            self._refill_thread = threading.Thread(target=self._refill_worker, daemon=True)
+            self._refill_thread.start()
+
+    def _refill_worker(self):
+        """Refill every pending buffer, batching them into one job per pass"""
+        while True:
+            with self._lock:
+                keys = list(self._pending_refills)
+                self._pending_refills.clear()
+                if not keys:
+                    self._refill_thread = None
+                    return
+                self._refills_in_flight.update(keys)
+            try:
+                self._fill(keys)
+            finally:
+                with self._lock:
+                    self._refills_in_flight.difference_update(keys)
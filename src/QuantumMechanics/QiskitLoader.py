@@ -0,0 +1,59 @@
+import importlib
+import threading
+
+
+class QiskitLoader:
+    """
+    Deferred access to qiskit and qiskit-aer.
+
+    Importing qiskit and qiskit-aer takes seconds and a noticeable amount of
+    memory, so nothing in the game imports them at module level. The first
+    call that actually needs a circuit or a simulator pulls them in, and
+    preload() lets the game do that on a background thread during startup.
+    """
+
+    _modules = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, module_name):
+        """Import a module on first use and return it"""
+        module = cls._modules.get(module_name)
+        if module is None:
+            with cls._lock:
+                module = cls._modules.get(module_name)
+                if module is None:
+                    module = importlib.import_module(module_name)
+                    cls._modules[module_name] = module
+        return module
+
+    @classmethod
+    def is_loaded(cls):
+        """Return True once qiskit has been imported"""
+        return 'qiskit' in cls._modules
+
+    @classmethod
+    def preload(cls):
+        """Import qiskit and qiskit-aer ahead of the first collapse"""
+        cls.load('qiskit')
+        cls.load('qiskit_aer')
+
+    @classmethod
+    def quantum_circuit_class(cls):
+        """Return the qiskit QuantumCircuit class"""
+        return cls.load('qiskit').QuantumCircuit
+
+    @classmethod
+    def quantum_circuit(cls, *args, **kwargs):
+        """Construct a qiskit QuantumCircuit"""
+        return cls.quantum_circuit_class()(*args, **kwargs)
+
+    @classmethod
+    def transpile(cls, circuits, backend=None, **kwargs):
+        """Transpile circuits with qiskit.transpile"""
+        return cls.load('qiskit').transpile(circuits, backend, **kwargs)
+
+    @classmethod
+    def aer_simulator(cls, **kwargs):
+        """Construct a qiskit-aer AerSimulator"""
+        return cls.load('qiskit_aer').AerSimulator(**kwargs)
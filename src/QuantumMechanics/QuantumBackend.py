@@ -0,0 +1,190 @@
+import threading
+import time
+from QuantumMechanics.Engines.EngineRegistry import EngineRegistry
+
+
+class QuantumBackend:
+    """
+    Process-wide quantum backend session.
+
+    Every card collapse goes through a single long-lived engine instead of
+    constructing a new simulator per measurement, and each collapse is timed
+    so the per-collapse cost can be inspected with get_latency_stats().
+
+    The engine is picked from EngineRegistry: 'aer' (default), 'statevector'
+    or 'numpy'. It can be chosen with the DND_QUANTUM_ENGINE environment
+    variable, the constructor, or switched at runtime with set_engine().
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, engine=None):
+        self._engines = {}  # engine name -> engine instance
+        self._lock = threading.Lock()
+        self.engine = None
+        self.set_engine(engine if engine is not None else EngineRegistry.default_name())
+        self.warmed_up = False
+
+        # Latency counters (seconds)
+        self.collapse_count = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared backend, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def set_engine(self, engine):
+        """Select the collapse engine at runtime
+
+        Args:
+            engine: Name of a registered engine, see EngineRegistry.available()
+        """
+        self.get_engine(engine)
+        self.engine = engine
+
+    def get_engine(self, name=None):
+        """Return the engine instance for a name, defaulting to the active engine"""
+        name = name if name is not None else self.engine
+        with self._lock:
+            engine = self._engines.get(name)
+            if engine is None:
+                engine = EngineRegistry.create(name)
+                self._engines[name] = engine
+        return engine
+
+    @property
+    def active_engine(self):
+        """The engine instance collapses are currently sampled on"""
+        return self.get_engine()
+
+    @property
+    def simulator(self):
+        """The shared AerSimulator, created on first use"""
+        return self.get_engine('aer').simulator
+
+    @staticmethod
+    def circuit_key(circuit):
+        """Return a hashable structural fingerprint of a circuit
+
+        Two circuits with the same gates, parameters and wiring share a key,
+        so they also share a transpiled instance.
+        """
+        key = [circuit.num_qubits, circuit.num_clbits]
+        for instruction in circuit.data:
+            operation = instruction.operation
+            key.append((
+                operation.name,
+                tuple(round(float(param), 12) for param in operation.params),
+                tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits),
+                tuple(circuit.find_bit(clbit).index for clbit in instruction.clbits)
+            ))
+        return tuple(key)
+
+    def get_transpiled(self, circuit):
+        """Return the Aer-transpiled version of a circuit, transpiling only once per shape"""
+        return self.get_engine('aer').get_transpiled(circuit)
+
+    def prepare(self, circuit):
+        """Do the active engine's per-shape work (e.g. transpiling) ahead of sampling"""
+        self.active_engine.prepare(circuit)
+
+    def forget_circuit(self, circuit):
+        """Drop everything the engines cached for a circuit shape"""
+        with self._lock:
+            engines = list(self._engines.values())
+        for engine in engines:
+            engine.forget(circuit)
+
+    def run(self, circuits, shots=1, memory=False):
+        """Run one circuit or a list of circuits as a single Aer job
+
+        Returns:
+            The qiskit Result of the job
+        """
+        return self.get_engine('aer').run(circuits, shots=shots, memory=memory)
+
+    def sample_memory(self, circuits, shots=1):
+        """Sample per-shot outcomes for a list of circuits on the selected engine
+
+        Returns:
+            list: For each circuit, the list of measured bitstrings
+        """
+        return self.active_engine.sample_memory(list(circuits), shots=shots)
+
+    def collapse(self, circuit):
+        """Measure a circuit once and return the observed bitstring"""
+        start = time.perf_counter()
+        outcome = self.sample_memory([circuit], shots=1)[0][0]
+        self.record_latency(time.perf_counter() - start)
+        return outcome
+
+    def warm_up(self):
+        """Transpile and run every canonical card circuit once
+
+        Called at startup so the first card played does not pay for simulator
+        initialisation and transpilation.
+        """
+        if self.warmed_up:
+            return
+        self.sample_memory(self.canonical_circuits(), shots=1)
+        self.warmed_up = True
+
+    @staticmethod
+    def canonical_circuits():
+        """Build the circuit shapes the cards collapse during a game"""
+        from QuantumMechanics.SuperpositionSpec import SuperpositionSpec
+        from QuantumMechanics.CircuitTemplates import CircuitTemplates
+
+        templates = CircuitTemplates.get_instance()
+        circuits = []
+
+        # Two-state superposition cards, unbiased and phase biased
+        circuits.append(templates.superposition(SuperpositionSpec(total_states=2)))
+        for favored_state in ('0', '1'):
+            circuits.append(templates.superposition(
+                SuperpositionSpec(total_states=2, favored_state=favored_state, bias_strength=0.7)))
+
+        # Afflication/weather entanglement
+        circuits.append(templates.entanglement())
+
+        # Quantum tunneling at the default card probability
+        circuits.append(templates.tunneling(0.7))
+
+        return circuits
+
+    def record_latency(self, elapsed):
+        """Add one collapse to the latency counters"""
+        with self._lock:
+            self.collapse_count += 1
+            self.total_latency += elapsed
+            self.last_latency = elapsed
+            self.max_latency = max(self.max_latency, elapsed)
+
+    def get_latency_stats(self):
+        """Return collapse latency counters in milliseconds"""
+        with self._lock:
+            count = self.collapse_count
+            mean = (self.total_latency / count) if count else 0.0
+            return {
+                'collapses': count,
+                'mean_ms': mean * 1000,
+                'max_ms': self.max_latency * 1000,
+                'last_ms': self.last_latency * 1000,
+                'total_ms': self.total_latency * 1000
+            }
+
+    def reset_latency_stats(self):
+        """Clear the latency counters"""
+        with self._lock:
+            self.collapse_count = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+            self.last_latency = 0.0
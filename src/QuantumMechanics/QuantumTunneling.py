@@ -1,10 +1,8 @@
 import numpy as np
 import random
-from qiskit_aer import AerSimulator
-from qiskit import QuantumCircuit
-from qiskit.primitives import BackendSamplerV2
-from qiskit.quantum_info import Statevector
-from qiskit.quantum_info import Statevector
+from QuantumMechanics.MeasurementReservoir import MeasurementReservoir
+from QuantumMechanics.QiskitLoader import QiskitLoader
+from QuantumMechanics.CircuitTemplates import CircuitTemplates
 
 class QuantumTunneling:
     """
@@ -77,8 +75,20 @@ class QuantumTunneling:
         Returns:
             bool: Whether tunneling occurred
         """
+        # Shared template circuit for this probability
+        qc = CircuitTemplates.get_instance().tunneling(probability)
+        
+        # Serve the measurement from the pre-sampled reservoir
+        measurement_result = MeasurementReservoir.get_instance().draw(qc)
+        
+        # Return True if we measured |1⟩ (tunneling occurred)
+        return measurement_result == '1'
+    
+    @staticmethod
+    def build_tunneling_circuit(probability, name='tunneling'):
+        """Build the circuit that measures |1⟩ with the tunneling probability"""
         # Create a quantum circuit with 1 qubit
-        qc = QuantumCircuit(1, 1)
+        qc = QiskitLoader.quantum_circuit(1, 1, name=name)
         
         # Apply rotation to create the desired probability distribution
         # For probability p, we need angle θ such that sin²(θ/2) = p
@@ -88,18 +98,7 @@ class QuantumTunneling:
         
         # Measure the qubit
         qc.measure(0, 0)
-        
-        # Execute the circuit
-        sim = AerSimulator()
-        job = sim.run(qc, shots=1)
-        result = job.result()
-        counts = result.get_counts()
-        
-        # Get the most frequent result (should be only one result with shots=1)
-        measurement_result = max(counts, key=counts.get)
-        
-        # Return True if we measured |1⟩ (tunneling occurred)
-        return measurement_result == '1'
+        return qc
     
     @staticmethod
     def apply_tunneling_damage(caster, target, damage):
@@ -0,0 +1,133 @@
+import argparse
+import sys
+import time
+from QuantumMechanics.QuantumBackend import QuantumBackend
+from QuantumMechanics.ClosedFormSampler import ClosedFormSampler
+
+
+class SamplerChecks:
+    """
+    Statistical checks of the fast samplers against Aer.
+
+    parity              - every canonical card circuit is run on Aer and
+                          sampled by the closed-form sampler; both sets of
+                          counts must pass a chi-square test against the
+                          exact distribution
+    entanglement_pairs  - a whole deck of entangled pairs, wider than Aer's
+                          qubit limit, is collapsed through the default
+                          engine; every sample must keep the pairing
+
+    check() raises AssertionError naming every failed case. Run from src/
+    with:
+        python -m QuantumMechanics.SamplerChecks [--shots N] [--pairs N]
+    which exits with status 1 when any check fails.
+    """
+
+    def __init__(self, shots=20000, backend=None, sampler=None, pairs=50, pair_samples=200):
+        self.shots = shots
+        self.pairs = pairs
+        self.pair_samples = pair_samples
+        self.backend = backend if backend is not None else QuantumBackend.get_instance()
+        self.sampler = sampler if sampler is not None else ClosedFormSampler()
+
+    def parity(self, circuits=None):
+        """Test Aer and the closed-form sampler against the exact distribution
+
+        Returns:
+            list: One dict per circuit with both chi-square statistics, the
+                  critical value and whether both samplers passed
+        """
+        if circuits is None:
+            circuits = QuantumBackend.canonical_circuits()
+
+        aer_result = self.backend.run(circuits, shots=self.shots)
+        report = []
+        for index, circuit in enumerate(circuits):
+            outcomes, probabilities = self.sampler.distribution(circuit)
+            aer_counts = aer_result.get_counts(index)
+            numpy_counts = {}
+            for outcome in self.sampler.sample(circuit, self.shots):
+                numpy_counts[outcome] = numpy_counts.get(outcome, 0) + 1
+
+            critical = ClosedFormSampler.chi_square_critical_value(len(outcomes) - 1)
+            aer_statistic = ClosedFormSampler.chi_square_statistic(aer_counts, outcomes, probabilities, self.shots)
+            numpy_statistic = ClosedFormSampler.chi_square_statistic(numpy_counts, outcomes, probabilities, self.shots)
+            exact = {outcome: round(float(probability), 4) for outcome, probability in zip(outcomes, probabilities)}
+            report.append({
+                'check': f'parity {circuit.name}',
+                'detail': f"aer={aer_statistic:.2f} numpy={numpy_statistic:.2f} critical={critical:.2f} {exact}",
+                'passed': aer_statistic <= critical and numpy_statistic <= critical
+            })
+        return report
+
+    def entanglement_pairs(self):
+        """Collapse a deck of entangled pairs and check the pairing of every sample
+
+        The first pair's two bits are equal, and each other pair's two bits
+        differ exactly when the first pair's bits are 1. The free bit of every
+        pair must take both values across the samples.
+
+        Returns:
+            list: A single report entry
+        """
+        from QuantumMechanics.Entanglement import QuantumEntanglement
+        broken = 0
+        free_bits = [set() for _ in range(self.pairs)]
+        try:
+            for _ in range(self.pair_samples):
+                # Pair 0 is the rightmost state, as classical bit 0 is rightmost
+                states = QuantumEntanglement.simulate_pairs(self.pairs)[::-1]
+                if len(states) != self.pairs or states[0][0] != states[0][1]:
+                    broken += 1
+                    continue
+                first = states[0][0]
+                for pair, state in enumerate(states):
+                    free_bits[pair].add(state[0])
+                    if pair and (state[0] != state[1]) != (first == '1'):
+                        broken += 1
+                        break
+            error = None
+        except Exception as exception:
+            error = f"{type(exception).__name__}: {exception}"
+        stuck = sum(1 for bits in free_bits if len(bits) < 2)
+        detail = (error if error is not None else
+                  f"{self.pair_samples} samples, {broken} broke the pairing, {stuck} pairs never varied")
+        return [{
+            'check': f'entanglement_pairs {self.pairs} pairs on {self.backend.engine}',
+            'detail': detail,
+            'passed': error is None and not broken and not stuck
+        }]
+
+    def run(self):
+        """Run every check and return the combined report"""
+        return self.parity() + self.entanglement_pairs()
+
+    def check(self):
+        """Run every check, raising AssertionError if any of them failed
+
+        Returns:
+            list: The report, when every check passed
+        """
+        report = self.run()
+        failed = [entry['check'] for entry in report if not entry['passed']]
+        if failed:
+            raise AssertionError(f"Sampler checks failed: {', '.join(failed)}")
+        return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the fast samplers against Aer")
+    parser.add_argument('--shots', type=int, default=20000, help="Shots per circuit")
+    parser.add_argument('--pairs', type=int, default=50, help="Entangled pairs collapsed at once")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = SamplerChecks(shots=args.shots, pairs=args.pairs).run()
+    elapsed = time.perf_counter() - start
+
+    for entry in report:
+        status = "PASS" if entry['passed'] else "FAIL"
+        print(f"{status} {entry['check']}: {entry['detail']}")
+    failed = sum(1 for entry in report if not entry['passed'])
+    print(f"{len(report) - failed}/{len(report)} checks passed ({elapsed:.2f}s)")
+    sys.exit(1 if failed else 0)
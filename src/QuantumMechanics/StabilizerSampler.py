@@ -0,0 +1,211 @@
+import threading
+import numpy as np
+
+
+class StabilizerSampler:
+    """
+    Stabilizer-tableau sampler for Clifford-only circuits.
+
+    Uses the Aaronson-Gottesman tableau, so a circuit on n qubits costs
+    polynomial time and memory instead of a 2^n statevector. Measurement
+    outcomes are tracked as affine functions of the random measurement bits,
+    so the tableau is simulated once per circuit and any number of shots is
+    sampled with a single GF(2) matrix product.
+    """
+
+    CLIFFORD_GATES = {'h', 's', 'sdg', 'x', 'y', 'z', 'cx', 'cz', 'swap', 'id', 'barrier', 'measure'}
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._programs = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_clifford(circuit):
+        """Return True if every instruction in the circuit is a supported Clifford gate"""
+        return all(instruction.operation.name in StabilizerSampler.CLIFFORD_GATES
+                   for instruction in circuit.data)
+
+    @staticmethod
+    def compile(circuit):
+        """Simulate the tableau once and return the affine outcome program
+
+        Returns:
+            tuple: (constants, coefficients, num_random_bits) where classical bit
+                   c is constants[c] XOR (random_bits . coefficients[c]) mod 2
+        """
+        if not StabilizerSampler.is_clifford(circuit):
+            raise ValueError("Stabilizer sampling requires a Clifford-only circuit")
+
+        num_qubits = circuit.num_qubits
+        num_measurements = sum(1 for instruction in circuit.data if instruction.operation.name == 'measure')
+        tableau = _Tableau(num_qubits, num_measurements)
+
+        constants = np.zeros(circuit.num_clbits, dtype=np.uint8)
+        coefficients = np.zeros((circuit.num_clbits, num_measurements), dtype=np.uint8)
+
+        for instruction in circuit.data:
+            name = instruction.operation.name
+            qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+            if name == 'measure':
+                clbit = circuit.find_bit(instruction.clbits[0]).index
+                outcome = tableau.measure(qubits[0])
+                constants[clbit] = outcome[0]
+                coefficients[clbit] = outcome[1:]
+            elif name == 'h':
+                tableau.h(qubits[0])
+            elif name == 's':
+                tableau.s(qubits[0])
+            elif name == 'sdg':
+                tableau.s(qubits[0])
+                tableau.s(qubits[0])
+                tableau.s(qubits[0])
+            elif name == 'x':
+                tableau.pauli_x(qubits[0])
+            elif name == 'y':
+                tableau.pauli_x(qubits[0])
+                tableau.pauli_z(qubits[0])
+            elif name == 'z':
+                tableau.pauli_z(qubits[0])
+            elif name == 'cx':
+                tableau.cx(qubits[0], qubits[1])
+            elif name == 'cz':
+                tableau.h(qubits[1])
+                tableau.cx(qubits[0], qubits[1])
+                tableau.h(qubits[1])
+            elif name == 'swap':
+                tableau.cx(qubits[0], qubits[1])
+                tableau.cx(qubits[1], qubits[0])
+                tableau.cx(qubits[0], qubits[1])
+
+        return constants, coefficients, tableau.random_bits
+
+    def _cached_program(self, circuit):
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        key = QuantumBackend.circuit_key(circuit)
+        with self._lock:
+            program = self._programs.get(key)
+        if program is None:
+            program = self.compile(circuit)
+            with self._lock:
+                self._programs[key] = program
+        return program
+
+    def forget(self, circuit):
+        """Drop the compiled program of a circuit shape"""
+        from QuantumMechanics.QuantumBackend import QuantumBackend
+        with self._lock:
+            self._programs.pop(QuantumBackend.circuit_key(circuit), None)
+
+    def sample_bits(self, circuit, shots=1, rng=None):
+        """Sample classical bits for a Clifford circuit
+
+        Args:
+            circuit: Clifford circuit to sample
+            shots: Number of shots
+            rng: numpy Generator for this batch, defaults to the sampler's own
+
+        Returns:
+            numpy.ndarray: (shots, num_clbits) array of 0/1, column c is classical bit c
+        """
+        constants, coefficients, num_random_bits = self._cached_program(circuit)
+        rng = rng if rng is not None else self.rng
+        random_bits = rng.integers(0, 2, size=(shots, num_random_bits), dtype=np.uint8)
+        used = coefficients[:, :num_random_bits].astype(np.int64)
+        return ((random_bits.astype(np.int64) @ used.T) + constants) % 2
+
+    def sample(self, circuit, shots=1, rng=None):
+        """Sample measured bitstrings for a Clifford circuit
+
+        Returns:
+            list: One qiskit-style bitstring (classical bit 0 rightmost) per shot
+        """
+        bits = self.sample_bits(circuit, shots, rng)
+        return [''.join('1' if bit else '0' for bit in row[::-1]) for row in bits]
+
+
+class _Tableau:
+    """Aaronson-Gottesman tableau with affine (symbolic) phase bits"""
+
+    def __init__(self, num_qubits, max_random_bits):
+        n = num_qubits
+        self.n = n
+        # Rows 0..n-1 are destabilizers, n..2n-1 stabilizers, 2n is scratch
+        self.x = np.zeros((2 * n + 1, n), dtype=bool)
+        self.z = np.zeros((2 * n + 1, n), dtype=bool)
+        self.x[np.arange(n), np.arange(n)] = True
+        self.z[np.arange(n) + n, np.arange(n)] = True
+        # Phase of each row as an affine GF(2) function: column 0 is the constant
+        self.r = np.zeros((2 * n + 1, 1 + max_random_bits), dtype=bool)
+        self.random_bits = 0
+
+    def h(self, a):
+        self.r[:, 0] ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def s(self, a):
+        self.r[:, 0] ^= self.x[:, a] & self.z[:, a]
+        self.z[:, a] ^= self.x[:, a]
+
+    def pauli_x(self, a):
+        self.r[:, 0] ^= self.z[:, a]
+
+    def pauli_z(self, a):
+        self.r[:, 0] ^= self.x[:, a]
+
+    def cx(self, a, b):
+        self.r[:, 0] ^= self.x[:, a] & self.z[:, b] & ~(self.x[:, b] ^ self.z[:, a])
+        self.x[:, b] ^= self.x[:, a]
+        self.z[:, a] ^= self.z[:, b]
+
+    def _phase_exponent(self, rows, source):
+        """Sum of the g() phase function for multiplying source into each of rows"""
+        x1 = self.x[source].astype(np.int64)
+        z1 = self.z[source].astype(np.int64)
+        x2 = self.x[rows].astype(np.int64)
+        z2 = self.z[rows].astype(np.int64)
+        g = (x1 * z1) * (z2 - x2) \
+            + (x1 * (1 - z1)) * z2 * (2 * x2 - 1) \
+            + ((1 - x1) * z1) * x2 * (1 - 2 * z2)
+        return g.sum(axis=-1)
+
+    def _rowsum(self, rows, source):
+        """Multiply the Pauli in row source into each row in rows"""
+        exponent = self._phase_exponent(rows, source) % 4
+        self.r[rows] ^= self.r[source]
+        self.r[rows, 0] ^= (exponent // 2).astype(bool)
+        self.x[rows] ^= self.x[source]
+        self.z[rows] ^= self.z[source]
+
+    def measure(self, a):
+        """Measure qubit a in the Z basis
+
+        Returns:
+            numpy.ndarray: The outcome as an affine GF(2) row (constant first)
+        """
+        n = self.n
+        anticommuting = np.flatnonzero(self.x[n:2 * n, a])
+        if anticommuting.size:
+            # Random outcome: introduce a fresh random bit
+            p = anticommuting[0] + n
+            others = np.flatnonzero(self.x[:2 * n, a])
+            others = others[others != p]
+            if others.size:
+                self._rowsum(others, p)
+            self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+            self.x[p] = False
+            self.z[p] = False
+            self.z[p, a] = True
+            self.r[p] = False
+            self.random_bits += 1
+            self.r[p, self.random_bits] = True
+            return self.r[p].astype(np.uint8)
+
+        # Deterministic outcome: accumulate the stabilizers into the scratch row
+        scratch = 2 * n
+        self.x[scratch] = False
+        self.z[scratch] = False
+        self.r[scratch] = False
+        for i in np.flatnonzero(self.x[:n, a]):
+            self._rowsum(np.array([scratch]), i + n)
+        return self.r[scratch].astype(np.uint8)
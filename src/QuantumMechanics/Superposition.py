@@ -1,13 +1,14 @@
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
-from qiskit.primitives import BackendSamplerV2
-from qiskit.quantum_info import Statevector
-import random
 import numpy as np
+from QuantumMechanics.QuantumBackend import QuantumBackend
+from Utils.RandomService import RandomService
+from QuantumMechanics.MeasurementReservoir import MeasurementReservoir
+from QuantumMechanics.QiskitLoader import QiskitLoader
+from QuantumMechanics.SuperpositionSpec import SuperpositionSpec
+from QuantumMechanics.CircuitTemplates import CircuitTemplates
 
 class Superposition:
     def __init__(self):
-        self.backend = AerSimulator()
+        self.backend = QuantumBackend.get_instance()
 
     @staticmethod
     def apply_superposition_to_qubit(qubit, total_states = 2):
@@ -59,13 +60,27 @@ class Superposition:
                 qubit.h([0, 1])
             qubit.measure([0, 1], [0, 1])
     
+    @staticmethod
+    def build_circuit(spec, name=None):
+        """Materialize the circuit described by a SuperpositionSpec"""
+        qubit = QiskitLoader.quantum_circuit(spec.num_qubits, spec.num_qubits, name=name)
+        if spec.is_biased():
+            Superposition.apply_superposition_with_bias(
+                qubit,
+                total_states=spec.total_states,
+                favored_state=spec.favored_state,
+                bias_strength=spec.bias_strength
+            )
+        else:
+            Superposition.apply_superposition_to_qubit(qubit, total_states=spec.total_states)
+        return qubit
+
     @staticmethod
     def collapse_qubit(qubit):
-        sim = AerSimulator()
-        job = sim.run(qubit, shots=1)        # run 1,024 shots
-        result = job.result()
-        counts = result.get_counts()
-        return max(counts, key=counts.get)
+        """Collapse a circuit, or the shared template circuit of a SuperpositionSpec"""
+        if isinstance(qubit, SuperpositionSpec):
+            qubit = CircuitTemplates.get_instance().superposition(qubit)
+        return MeasurementReservoir.get_instance().draw(qubit)
     
     @staticmethod
     def collapse_qubit_with_bias(qubit, favored_state=None, bias_strength=0.7):
@@ -75,19 +90,20 @@ class Superposition:
             return Superposition.collapse_qubit(qubit)
         
         # Use weighted random selection to simulate bias
+        rng = RandomService.get_instance().stream('collapse')
         if len(favored_state) == 1:  # 2-state system
-            if random.random() < bias_strength:
+            if rng.random() < bias_strength:
                 return favored_state
             else:
                 return '1' if favored_state == '0' else '0'
         else:  # 4-state system
             states = ['00', '01', '10', '11']
-            if random.random() < bias_strength:
+            if rng.random() < bias_strength:
                 return favored_state
             else:
                 # Choose randomly from the other states
                 other_states = [s for s in states if s != favored_state]
-                return random.choice(other_states)
+                return rng.choice(other_states)
 
     # def get_statevector(self):
     #     """Return the exact statevector of the current circuit."""
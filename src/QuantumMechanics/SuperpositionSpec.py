@@ -0,0 +1,43 @@
+class SuperpositionSpec:
+    """
+    Compact description of a card's superposition.
+
+    Cards keep this instead of a QuantumCircuit. The circuit is only
+    materialized by Superposition.build_circuit() when the card collapses.
+    """
+
+    __slots__ = ('total_states', 'favored_state', 'bias_strength')
+
+    def __init__(self, total_states=2, favored_state=None, bias_strength=None):
+        """
+        Args:
+            total_states: Number of basis states, 2 (one qubit) or 4 (two qubits)
+            favored_state: State the phase bias favors, None for no bias
+            bias_strength: Probability weight of the favored state
+        """
+        self.total_states = total_states
+        self.favored_state = favored_state
+        self.bias_strength = bias_strength
+
+    @property
+    def num_qubits(self):
+        """Number of qubits (and classical bits) the circuit needs"""
+        return 1 if self.total_states == 2 else 2
+
+    def is_biased(self):
+        """Return True if the superposition carries a phase bias"""
+        return self.favored_state is not None
+
+    def key(self):
+        """Return a hashable key identifying this superposition"""
+        return (self.total_states, self.favored_state, self.bias_strength)
+
+    def __eq__(self, other):
+        return isinstance(other, SuperpositionSpec) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return (f"SuperpositionSpec(total_states={self.total_states}, "
+                f"favored_state={self.favored_state!r}, bias_strength={self.bias_strength})")
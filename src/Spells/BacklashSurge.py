@@ -1,20 +1,26 @@
 import pygame
 import math
-import random
+import numpy as np
+from Utils.RandomService import RandomService
 from SpriteUtil.SpriteUtil import SpriteUtil
+from Effects.StatusOverlays import StatusOverlays
+from Utils.FontRegistry import FontRegistry
 from Spells.SpellBase import SpellBase
 import os
+from Utils.SoundBank import SoundBank
+from Effects.ParticleSystem import ParticleSystem
 class BacklashSurge(SpellBase):
     """Backlash Surge spell that applies vulnerability to a target (3x damage)"""
     
     def __init__(self, screen):
         """Initialize the vulnerability effect"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().numpy_stream('particles')
         # We'll create the vulnerability effect purely through rendering
         self.animation_speed = 0.1  # Seconds between frames
         self.frame_count = 30  # Number of frames in animation
-        self.particles = []  # For particle effect
         self.particle_colors = [(255, 50, 50), (255, 100, 50), (255, 150, 50)]  # Red-orange colors
+        self.particles = ParticleSystem(self.particle_colors, scale=0.95)  # For particle effect
         
         # Sound effect
         self.sound_played = False
@@ -23,28 +29,25 @@ class BacklashSurge(SpellBase):
         parent2 = os.path.dirname(parent1)
         sound_path = "./Assets/Sounds/alarm.mp3"
         total_path = os.path.join(parent2, sound_path)
-        self.surge_sound = pygame.mixer.Sound(total_path)
+        self.surge_sound = SoundBank.get_instance().load(total_path)
         self.surge_sound.set_volume(0.5)
         
     def start(self):
         """Start the vulnerability effect"""
         super().start()
         self.current_frame = 0
-        self.particles = []
+        self.particles.clear()
         self.generate_particles(100)  # Create initial particles
         
     def generate_particles(self, count):
         """Generate particles for the vulnerability effect"""
-        for _ in range(count):
-            # Random position, velocity, size, color, and lifespan
-            particle = {
-                'pos': [0, 0],  # Will be set based on target position
-                'vel': [random.uniform(-2, 2), random.uniform(-2, 2)],
-                'size': random.uniform(2, 6),
-                'color': random.choice(self.particle_colors),
-                'life': random.uniform(0.5, 1.0)  # Percentage of total animation
-            }
-            self.particles.append(particle)
+        # Positions are placed on the target at the first update
+        self.particles.emit(
+            count,
+            vx=self.rng.uniform(-2, 2, count),
+            vy=self.rng.uniform(-2, 2, count),
+            size=self.rng.uniform(2, 6, count)
+        )
             
     def animate_spell(self, caster, target):
         """Animate the vulnerability effect"""
@@ -76,35 +79,25 @@ class BacklashSurge(SpellBase):
     def update_particles(self, target):
         """Update particle positions and properties"""
         target_center = (target.position_to_draw[0] + 65, target.position_to_draw[1] + 65)
-        
-        for particle in self.particles:
-            # Initialize position at target center if not set
-            if particle['pos'] == [0, 0]:
-                particle['pos'] = [target_center[0], target_center[1]]
-                
-            # Update position based on velocity
-            particle['pos'][0] += particle['vel'][0]
-            particle['pos'][1] += particle['vel'][1]
-            
-            # Reduce size slightly each frame
-            particle['size'] *= 0.95
-            
-            # Update velocity to create spiral effect
-            angle = math.atan2(particle['pos'][1] - target_center[1], 
-                             particle['pos'][0] - target_center[0])
-            particle['vel'][0] += 0.1 * math.cos(angle + math.pi/2)
-            particle['vel'][1] += 0.1 * math.sin(angle + math.pi/2)
+        particles = self.particles
+
+        # Initialize position at target center if not set
+        unplaced = particles.alive & (particles.x == 0) & (particles.y == 0)
+        particles.x[unplaced] = target_center[0]
+        particles.y[unplaced] = target_center[1]
+
+        # Move by velocity and shrink slightly each frame
+        particles.update()
+
+        # Turn velocity around the target to create spiral effect
+        angle = np.arctan2(particles.y - target_center[1], particles.x - target_center[0])
+        particles.vx += 0.1 * np.cos(angle + math.pi / 2)
+        particles.vy += 0.1 * np.sin(angle + math.pi / 2)
     
     def draw_particles(self):
         """Draw all particles"""
-        for particle in self.particles:
-            if particle['size'] > 0.5:  # Only draw visible particles
-                pygame.draw.circle(
-                    self.screen, 
-                    particle['color'], 
-                    (int(particle['pos'][0]), int(particle['pos'][1])), 
-                    int(particle['size'])
-                )
+        # Particles shrunk below one pixel are skipped
+        self.particles.draw(self.screen)
     
     def draw_vulnerability_indicators(self, target, intensity):
         """Draw visual indicators that target is vulnerable"""
@@ -112,17 +105,16 @@ class BacklashSurge(SpellBase):
         radius = 80
         
         # Draw pulsing aura
-        pygame.draw.circle(
+        self.screen.mark_dirty(pygame.draw.circle(
             self.screen,
             (intensity, 50, 50, 100),  # Red with some transparency
             target_center,
             radius,
             3  # Width of circle
-        )
+        ))
         
         # Draw vulnerability "3x" text
-        font = pygame.font.SysFont('Arial', 24, bold=True)
-        text = font.render("3x", True, (255, 50, 50))
+        text = FontRegistry.get_instance().render("3x", 24, (255, 50, 50), bold=True)
         text_rect = text.get_rect(center=(target_center[0], target_center[1] - radius - 15))
         self.screen.blit(text, text_rect)
         
@@ -147,7 +139,7 @@ class BacklashSurge(SpellBase):
         
         # Draw lightning bolt
         color = (min(255, intensity + 50), 50, 50)
-        pygame.draw.lines(self.screen, color, False, points, 3)
+        self.screen.mark_dirty(pygame.draw.lines(self.screen, color, False, points, 3))
     
     def apply_effect(self, target):
         """Apply vulnerability effect to target"""
@@ -160,38 +152,4 @@ class StaticVulnerabilityEffect:
     @staticmethod
     def render_static_vulnerable(screen, character):
         """Render vulnerability indicators for a character that has vulnerable status"""
-            
-        # Character center position
-        center = (character.position_to_draw[0], character.position_to_draw[1])
-        
-        # Draw red aura
-        pygame.draw.circle(
-            screen,
-            (180, 50, 50, 150),  # Red with some transparency
-            center,
-            75,  # Radius
-            2    # Width
-        )
-        
-        # Draw "3x" text
-        font = pygame.font.SysFont('Arial', 20, bold=True)
-        text = font.render("3x", True, (255, 50, 50))
-        text_rect = text.get_rect(center=(center[0], center[1] - 90))
-        screen.blit(text, text_rect)
-        
-        # Draw small lightning bolts
-        angle = pygame.time.get_ticks() * 0.001  # Slowly rotating
-        for i in range(3):
-            bolt_angle = angle + i * 2*math.pi/3
-            x = center[0] + 75 * math.cos(bolt_angle)
-            y = center[1] + 75 * math.sin(bolt_angle)
-            
-            # Simple lightning bolt
-            points = [
-                (x, y - 10),
-                (x - 4, y - 3),
-                (x + 4, y + 3),
-                (x - 4, y + 10)
-            ]
-            
-            pygame.draw.lines(screen, (255, 100, 50), False, points, 2) 
\ No newline at end of file
+        StatusOverlays.get_instance().render(screen, 'vulnerable', character.position_to_draw)
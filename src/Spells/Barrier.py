@@ -1,8 +1,10 @@
 import pygame
 from SpriteUtil.SpriteUtil import SpriteUtil
+from Effects.StatusOverlays import StatusOverlays
 from Spells.SpellBase import SpellBase
 import time
 import os
+from Utils.SoundBank import SoundBank
 
 class Barrier(SpellBase):
     """Lightning spell that strikes a target"""
@@ -18,12 +20,16 @@ class Barrier(SpellBase):
         (1477, 530, 402, 406),    # Frame 1
         (996, 1010, 402, 406)    # Frame 1
     ]
+
+    # Every frame is drawn at this size
+    SHIELD_SIZE = (130, 130)
     
     def __init__(self, screen):
         """Initialize the lightning effect"""
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/Shield.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.animation_speed = 0.1  # Seconds between frames
         self.damage = 10  # Damage dealt by the lightning
         self.scale_factor = 4  # Scale the lightning to be twice as large
@@ -36,7 +42,7 @@ class Barrier(SpellBase):
         parent2 = os.path.dirname(parent1)
         sound_path = "./Assets/Sounds/energyshieldsound.mp3"
         total_path = os.path.join(parent2, sound_path)
-        self.heal_sound = pygame.mixer.Sound(total_path)
+        self.heal_sound = SoundBank.get_instance().load(total_path)
         self.heal_sound.set_volume(0.5)
         
     def animate_spell(self, caster, target):
@@ -52,8 +58,7 @@ class Barrier(SpellBase):
             self.sound_played = True
         
         frame_coords = self.animation_frames[self.current_frame]
-        shield_image = self.sprite.get_sprite(frame_coords)
-        shield_image = pygame.transform.scale(shield_image, (130, 130))
+        shield_image = self.sprite.get_transformed(frame_coords, self.SHIELD_SIZE)
 
         position = (caster.position_to_draw[0], 
                     caster.position_to_draw[1])
@@ -80,21 +85,4 @@ class StaticBarrierShield:
 
     @staticmethod
     def render_static_shield(screen, caster):
-        SPRITE_PATH = "./Assets/Cards/Shield.png"
-        sprite = SpriteUtil(SPRITE_PATH)
-
-        shield_image = sprite.get_sprite((996, 1010, 402, 406))
-        
-        original_width = shield_image.get_width()
-        original_height = shield_image.get_height()
-        shield_image = pygame.transform.scale(shield_image, (130, 130))
-
-        position = (caster.position_to_draw[0], 
-                    caster.position_to_draw[1])
- 
-        sprite_standing_image_position = sprite.draw_sprite_image_at(
-            shield_image, 
-            position)  
-         
-        # Draw the lightning
-        screen.blit(shield_image, sprite_standing_image_position)
\ No newline at end of file
+        StatusOverlays.get_instance().render(screen, 'shield', caster.position_to_draw)
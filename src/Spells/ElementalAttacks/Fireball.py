@@ -5,6 +5,7 @@ from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 from Characters.DamageOverTurn import DamageOverTurn
 import os
+from Utils.SoundBank import SoundBank
 class Fireball(SpellBase):
     """Fireball spell that launches a fiery projectile at the target"""
     
@@ -31,6 +32,7 @@ class Fireball(SpellBase):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/Elementals/ElementalAttacks/Fireball.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice([self.animation_frames, self.explosion_frames])
         self.current_frame = 0
         self.damage = 2  # Damage dealt by the fireball
         self.spell_active = False
@@ -52,8 +54,8 @@ class Fireball(SpellBase):
         parent3 = os.path.dirname(parent2)
         soundlaunch = os.path.join(parent3, "./Assets/Sounds/Elementals/fire_launch.mp3")
         soundexplosion = os.path.join(parent3, "./Assets/Sounds/Elementals/fire_explosion.mp3")
-        self.launch_sound = pygame.mixer.Sound(soundlaunch)
-        self.explosion_sound = pygame.mixer.Sound(soundexplosion)
+        self.launch_sound = SoundBank.get_instance().load(soundlaunch)
+        self.explosion_sound = SoundBank.get_instance().load(soundexplosion)
         self.launch_sound.set_volume(0.5)
         self.explosion_sound.set_volume(0.5)
     def animate_spell(self, caster, target):
@@ -131,7 +133,7 @@ class Fireball(SpellBase):
             # Scale explosion
             explosion_width = int(explosion_image.get_width() * self.scale_factor)
             explosion_height = int(explosion_image.get_height() * self.scale_factor)
-            explosion_image = pygame.transform.scale(explosion_image, (explosion_width, explosion_height))
+            explosion_image = self.sprite.get_transformed(frame_coords, (explosion_width, explosion_height))
             
             # Draw at target position
             position = (self.fireball['target_x'] - explosion_width // 2, 
@@ -162,10 +164,9 @@ class Fireball(SpellBase):
             
             # Draw fireball
             frame_coords = self.animation_frames[int(self.fireball['frame'])]
-            fireball_image = self.sprite.get_sprite(frame_coords)
             
             # Scale fireball
-            fireball_image = pygame.transform.scale(fireball_image, self.fireball_size)
+            fireball_image = self.sprite.get_transformed(frame_coords, self.fireball_size)
             
             # Draw fireball
             position = (self.fireball['x'] - fireball_image.get_width() // 2, 
@@ -173,7 +174,7 @@ class Fireball(SpellBase):
             
             if (target.character_id == "Wizard"):
                 ##transform the fireball sprite to be 180 degrees rotated
-                self.screen.blit(pygame.transform.rotate(fireball_image, 180), position)
+                self.screen.blit(self.sprite.get_transformed(frame_coords, self.fireball_size, 180), position)
             else:
                 self.screen.blit(fireball_image, position)
             
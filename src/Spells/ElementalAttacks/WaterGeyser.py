@@ -5,6 +5,7 @@ from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 from Characters.DamageOverTurn import DamageOverTurn
 import os
+from Utils.SoundBank import SoundBank
 class WaterGeyser(SpellBase):
     """WaterGeyser spell that erupts from below the target, lifting them up"""
     
@@ -24,6 +25,7 @@ class WaterGeyser(SpellBase):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/Elementals/ElementalAttacks/watergeyser.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.current_frame = 0
         self.damage = 2  # Damage dealt by the water geyser
         self.spell_active = False
@@ -56,7 +58,7 @@ class WaterGeyser(SpellBase):
         total_path = os.path.join(parent3, "./Assets/Sounds/Elementals/water_geyser.wav")
 
 
-        self.geyser_sound = pygame.mixer.Sound(total_path)
+        self.geyser_sound = SoundBank.get_instance().load(total_path)
         self.geyser_sound.set_volume(0.5)
     def animate_spell(self, caster, target):
         """Animate the water geyser spell
@@ -110,7 +112,7 @@ class WaterGeyser(SpellBase):
             # Scale geyser (larger for more dramatic effect)
             geyser_width = int(geyser_image.get_width() * self.scale_factor)
             geyser_height = int(geyser_image.get_height() * self.scale_factor)
-            geyser_image = pygame.transform.scale(geyser_image, (geyser_width, geyser_height))
+            geyser_image = self.sprite.get_transformed(frame_coords, (geyser_width, geyser_height))
             
             # Position at the target's feet but centered horizontally
             position = (self.geyser['x'] - geyser_width // 2, 
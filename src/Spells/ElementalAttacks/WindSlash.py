@@ -5,6 +5,7 @@ from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 from Characters.DamageOverTurn import DamageOverTurn
 import os
+from Utils.SoundBank import SoundBank
 class WindSlash(SpellBase):
     """WindSlash spell that launches a cutting wind projectile at the target"""
     
@@ -30,8 +31,10 @@ class WindSlash(SpellBase):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/Elementals/ElementalAttacks/WindSlash.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.SPRITE_PATH_SLASH = "./Assets/Cards/Elementals/ElementalAttacks/wind_slash_explosion.png"
         self.sprite_slash = SpriteUtil(self.SPRITE_PATH_SLASH)
+        self.sprite_slash.pre_slice(self.explosion_frames)
         self.current_frame = 0
         self.damage = 2 # Damage dealt by the wind slash
         self.spell_active = False
@@ -55,8 +58,8 @@ class WindSlash(SpellBase):
         soundlaunch = os.path.join(parent3, "./Assets/Sounds/Elementals/wind_launch.wav")
         soundexplosion = os.path.join(parent3, "./Assets/Sounds/Elementals/wind_slash.mp3")
 
-        self.launch_sound = pygame.mixer.Sound(soundlaunch)
-        self.explosion_sound = pygame.mixer.Sound(soundexplosion)
+        self.launch_sound = SoundBank.get_instance().load(soundlaunch)
+        self.explosion_sound = SoundBank.get_instance().load(soundexplosion)
         self.launch_sound.set_volume(0.5)
         self.explosion_sound.set_volume(0.5)
         
@@ -119,7 +122,7 @@ class WindSlash(SpellBase):
             # Scale explosion
             explosion_width = int(explosion_image.get_width() * self.scale_factor)
             explosion_height = int(explosion_image.get_height() * self.scale_factor)
-            explosion_image = pygame.transform.scale(explosion_image, (explosion_width, explosion_height))
+            explosion_image = self.sprite_slash.get_transformed(frame_coords, (explosion_width, explosion_height))
             
             # Draw at target position
             position = (self.wind_slash['target_x'] - explosion_width // 2, 
@@ -163,10 +166,9 @@ class WindSlash(SpellBase):
             
             # Draw wind slash
             frame_coords = self.animation_frames[int(self.wind_slash['frame'])]
-            wind_slash_image = self.sprite.get_sprite(frame_coords)
             
             # Scale wind slash
-            wind_slash_image = pygame.transform.scale(wind_slash_image, self.wind_slash_size)
+            wind_slash_image = self.sprite.get_transformed(frame_coords, self.wind_slash_size)
             
             # Draw wind slash
             position = (self.wind_slash['x'] - wind_slash_image.get_width() // 2, 
@@ -175,7 +177,7 @@ class WindSlash(SpellBase):
                         
             if (target.character_id == "Wizard"):
                 ##transform the fireball sprite to be 180 degrees rotated
-                self.screen.blit(pygame.transform.rotate(wind_slash_image, 180), position)
+                self.screen.blit(self.sprite.get_transformed(frame_coords, self.wind_slash_size, 180), position)
                 if self.wind_slash['x'] <= target.position_to_draw[0]:
                     self.wind_slash['hit'] = True
                     self.spell_active = False
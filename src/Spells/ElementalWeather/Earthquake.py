@@ -1,10 +1,12 @@
 import pygame
-import random
-import math
+from Utils.RandomService import RandomService
+import numpy as np
 from Spells.SpellBase import SpellBase
 from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.ElementalWeather.WeatherSpells import WeatherSpells
 import os
+from Utils.WeatherAmbience import WeatherAmbience
+from Effects.ParticleSystem import ParticleSystem
 class Earthquake(WeatherSpells):
     """Earthquake spell that creates a nature disruption effect with trees falling down"""
     
@@ -18,13 +20,21 @@ class Earthquake(WeatherSpells):
         (0, 272, 69, 46),     # Frame 5 - tree almost down
         (79, 284, 76, 39),    # Frame 6 - fallen tree
     ]
+
+    # Particles per system
+    DIRT_COUNT = 30
+    ROCK_COUNT = 15
+    # Where impact particles spawn relative to the center, per tree index
+    TREE_BASE_OFFSETS = np.array([-300, -250, -200, -100, 0, 100, 200, 250, 300])
     
     def __init__(self, screen):
         """Initialize the tree falling effect"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().stream('particles')
         self.is_active = False
         self.sprite_path = "./Assets/Cards/Elementals/Weathers/nature.png"
         self.sprite = SpriteUtil(self.sprite_path)
+        self.sprite.pre_slice(self.NATURE_FRAMES)
         
         # Animation properties
         self.current_frame = 0
@@ -49,9 +59,23 @@ class Earthquake(WeatherSpells):
         self.max_shake_intensity = 15
         self.shake_decay = 0.95
         
-        # Visual effects for initial impact
-        self.dirt_particles = []
-        self.rock_particles = []
+        # Visual effects for initial impact; particles falling below the
+        # screen go dormant
+        self.np_rng = RandomService.get_instance().numpy_stream('particles')
+        impact_bounds = pygame.Rect(-self.screen_width, -self.screen_height,
+                                    3 * self.screen_width, 2 * self.screen_height + 1)
+        self.dirt_particles = ParticleSystem(
+            ParticleSystem.random_palette(self.np_rng, ((100, 150), (70, 120), (40, 80))),
+            capacity=self.DIRT_COUNT,
+            bounds=impact_bounds
+        )
+        self.rock_particles = ParticleSystem(
+            ParticleSystem.random_palette(self.np_rng, ((80, 120), (80, 120), (80, 120))),
+            shape=ParticleSystem.POLYGON,
+            sides=5,
+            capacity=self.ROCK_COUNT,
+            bounds=impact_bounds
+        )
         self.create_particles()
         
         dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -60,52 +84,33 @@ class Earthquake(WeatherSpells):
         parent3 = os.path.dirname(parent2)
         total_path = os.path.join(parent3, "./Assets/Sounds/Weathers/earthquake.mp3")
 
-        self.crash_sound = pygame.mixer.Sound(total_path)
+        self.crash_sound = WeatherAmbience.get_instance().track(total_path)
         self.sound_played = False
         self.crash_sound.set_volume(0.5)
     
     def create_particles(self):
         """Create particles for the tree falling impact"""
-        # Create dirt particles
-        for _ in range(30):
-            self.dirt_particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(self.screen_height - 50, self.screen_height),
-                'size': random.randint(2, 6),
-                'speed_x': random.uniform(-2, 2),
-                'speed_y': random.uniform(-8, -2),
-                'color': (
-                    random.randint(100, 150),  # R
-                    random.randint(70, 120),   # G
-                    random.randint(40, 80),    # B
-                    random.randint(150, 255)   # Alpha
-                ),
-                'lifetime': random.randint(30, 90),
-                'active': False,
-                'gravity': random.uniform(0.1, 0.4)
-            })
-        
-        # Create rock particles (larger than dirt)
-        for _ in range(15):
-            self.rock_particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': self.screen_height,
-                'size': random.randint(4, 10),
-                'speed_x': random.uniform(-1, 1),
-                'speed_y': random.uniform(-10, -5),
-                'color': (
-                    random.randint(80, 120),   # R
-                    random.randint(80, 120),   # G
-                    random.randint(80, 120),   # B
-                    255                         # Alpha
-                ),
-                'rotation': random.random() * 360,
-                'rotation_speed': random.uniform(-5, 5),
-                'active': False,
-                'lifetime': random.randint(60, 120),
-                'current_life': 0,
-                'gravity': random.uniform(0.2, 0.5)
-            })
+        # Dirt particles
+        self.dirt_particles.emit(
+            self.DIRT_COUNT,
+            size=self.np_rng.integers(2, 6, self.DIRT_COUNT, endpoint=True),
+            gravity=self.np_rng.uniform(0.1, 0.4, self.DIRT_COUNT),
+            lifetime=self.np_rng.integers(30, 90, self.DIRT_COUNT, endpoint=True)
+        )
+
+        # Rock particles (larger than dirt)
+        self.rock_particles.emit(
+            self.ROCK_COUNT,
+            size=self.np_rng.integers(4, 10, self.ROCK_COUNT, endpoint=True),
+            rotation=self.np_rng.random(self.ROCK_COUNT) * 360,
+            spin=self.np_rng.uniform(-5, 5, self.ROCK_COUNT),
+            gravity=self.np_rng.uniform(0.2, 0.5, self.ROCK_COUNT),
+            lifetime=self.np_rng.integers(60, 120, self.ROCK_COUNT, endpoint=True)
+        )
+
+        # Both stay dormant until the trees hit the ground
+        self.dirt_particles.clear()
+        self.rock_particles.clear()
     
     def start(self):
         """Start the tree falling animation"""
@@ -137,8 +142,8 @@ class Earthquake(WeatherSpells):
             self.shake_intensity *= self.shake_decay
             
             # Calculate shake offset
-            shake_offset_x = random.randint(-int(self.shake_intensity), int(self.shake_intensity))
-            shake_offset_y = random.randint(-int(self.shake_intensity), int(self.shake_intensity))
+            shake_offset_x = self.rng.randint(-int(self.shake_intensity), int(self.shake_intensity))
+            shake_offset_y = self.rng.randint(-int(self.shake_intensity), int(self.shake_intensity))
         
         # When the tree hits the ground (frame 5), activate particles
         if int(self.current_frame) == 4 and not self.animation_completed:
@@ -198,103 +203,42 @@ class Earthquake(WeatherSpells):
     
     def _activate_particles(self):
         """Activate particles when the tree hits the ground"""
-        # Activate dirt particles
-        for particle in self.dirt_particles:
-            if random.random() < 0.8:  # 80% chance
-                particle['active'] = True
-                # Position particles near the bases of trees
-                tree_index = random.randint(0, 8)  # 9 trees
-                base_x = self.x + (tree_index - 4) * 50  # -200 to +200 in steps of 50
-                if tree_index >= 5:  # Adjust for wider spacing on the sides
-                    base_x += 50 if tree_index == 5 else 100
-                elif tree_index <= 3:
-                    base_x -= 50 if tree_index == 3 else 100
-                    
-                particle['x'] = random.randint(base_x - 20, base_x + 20)
-                particle['y'] = self.y + 40  # Near the base of the tree
-                particle['lifetime'] = random.randint(30, 90)
-        
-        # Activate rock particles
-        for rock in self.rock_particles:
-            if random.random() < 0.7:  # 70% chance
-                rock['active'] = True
-                # Similar positioning as dirt particles
-                tree_index = random.randint(0, 8)
-                base_x = self.x + (tree_index - 4) * 50
-                if tree_index >= 5:
-                    base_x += 50 if tree_index == 5 else 100
-                elif tree_index <= 3:
-                    base_x -= 50 if tree_index == 3 else 100
-                    
-                rock['x'] = random.randint(base_x - 15, base_x + 15)
-                rock['y'] = self.y + 40
-                rock['current_life'] = 0
+        # Burst dirt from the bases of the trees (80% chance per particle)
+        dirt = self.dirt_particles
+        chosen = np.flatnonzero(self.np_rng.random(dirt.capacity) < 0.8)
+        base_x = self.x + self.TREE_BASE_OFFSETS[self.np_rng.integers(0, 9, chosen.size)]
+        dirt.respawn(
+            chosen,
+            x=self.np_rng.integers(base_x - 20, base_x + 20, endpoint=True),
+            y=self.y + 40,  # Near the base of the tree
+            vx=self.np_rng.uniform(-2, 2, chosen.size),
+            vy=self.np_rng.uniform(-8, -2, chosen.size),
+            lifetime=self.np_rng.integers(30, 90, chosen.size, endpoint=True)
+        )
+
+        # Rocks burst the same way (70% chance per particle)
+        rocks = self.rock_particles
+        chosen = np.flatnonzero(self.np_rng.random(rocks.capacity) < 0.7)
+        base_x = self.x + self.TREE_BASE_OFFSETS[self.np_rng.integers(0, 9, chosen.size)]
+        rocks.respawn(
+            chosen,
+            x=self.np_rng.integers(base_x - 15, base_x + 15, endpoint=True),
+            y=self.y + 40,
+            vx=self.np_rng.uniform(-1, 1, chosen.size),
+            vy=self.np_rng.uniform(-10, -5, chosen.size)
+        )
     
     def _draw_dirt_particles(self):
         """Draw and update dirt particles"""
-        for particle in self.dirt_particles:
-            if not particle['active']:
-                continue
-                
-            # Draw the particle
-            pygame.draw.circle(
-                self.screen,
-                particle['color'],
-                (int(particle['x']), int(particle['y'])),
-                particle['size']
-            )
-            
-            # Move the particle
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            
-            # Apply gravity
-            particle['speed_y'] += particle['gravity']
-            
-            # Reduce lifetime
-            particle['lifetime'] -= 1
-            
-            # Deactivate if lifetime expired or off screen
-            if particle['lifetime'] <= 0 or particle['y'] > self.screen_height:
-                particle['active'] = False
+        self.dirt_particles.draw(self.screen)
+        # Move under gravity; expired or fallen particles go dormant
+        self.dirt_particles.update()
     
     def _draw_rock_particles(self):
         """Draw and update rock particles"""
-        for rock in self.rock_particles:
-            if not rock['active']:
-                continue
-                
-            # Draw the rock (as a polygon to show rotation)
-            # Create a simple polygon for the rock
-            points = []
-            for i in range(5):
-                angle = math.radians(rock['rotation'] + (i * 72))
-                x = rock['x'] + rock['size'] * math.cos(angle)
-                y = rock['y'] + rock['size'] * math.sin(angle)
-                points.append((x, y))
-            
-            pygame.draw.polygon(
-                self.screen,
-                rock['color'],
-                points
-            )
-            
-            # Move the rock
-            rock['x'] += rock['speed_x']
-            rock['y'] += rock['speed_y']
-            
-            # Apply gravity
-            rock['speed_y'] += rock['gravity']
-            
-            # Apply rotation
-            rock['rotation'] += rock['rotation_speed']
-            
-            # Update lifetime
-            rock['current_life'] += 1
-            
-            # Deactivate if lifetime expired or off screen
-            if rock['current_life'] >= rock['lifetime'] or rock['y'] > self.screen_height:
-                rock['active'] = False
+        # Rocks are drawn as turning pentagons
+        self.rock_particles.draw(self.screen)
+        self.rock_particles.update()
     
     def apply_effect(self):
         """Apply the spell's effect"""
@@ -1,10 +1,14 @@
 import pygame
-import random
+from Utils.RandomService import RandomService
 from Spells.SpellBase import SpellBase
 from SpriteUtil.SpriteUtil import SpriteUtil
 import math
+import numpy as np
 from Spells.ElementalWeather.WeatherSpells import WeatherSpells
 import os
+from Utils.WeatherAmbience import WeatherAmbience
+from Effects.ParticleSystem import ParticleSystem
+from Effects.GlowCache import GlowCache
 class HeatWave(WeatherSpells):
     """HeatWave spell that creates a heat/fire effect in the middle of the screen"""
     
@@ -16,13 +20,29 @@ class HeatWave(WeatherSpells):
         (217, 34, 48, 66),     # Frame 1 
         (313, 34, 48, 66),     # Frame 1 
     ]
+
+    # Surface alpha of the fire frames (semi-transparent)
+    FIRE_ALPHA = 200
+
+    # Particles per system
+    HEAT_COUNT = 50
+    EMBER_COUNT = 30
+    SMOKE_COUNT = 25
+
+    # Fire glow: orange-yellow circles with decreasing opacity, flickering between 80% and 100%
+    GLOW_COLOR = (255, 150, 50)
+    GLOW_RINGS = tuple((radius, 50 * radius / 100) for radius in range(100, 20, -20))
+    GLOW_FLICKER = (0.8, 1.0)
     
     def __init__(self, screen):
         """Initialize the heat wave effect"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().stream('particles')
         self.is_active = False
         self.sprite_path = "./Assets/Cards/Elementals/Weathers/fire.png"
         self.sprite = SpriteUtil(self.sprite_path)
+        self.sprite.pre_slice(self.FIRE_FRAMES)
+        self._faded_frames = {}  # frame rect -> scaled frame with the alpha applied
         
         # Animation properties
         self.current_frame = 0
@@ -41,10 +61,23 @@ class HeatWave(WeatherSpells):
         self.fire_width = 350
         self.fire_height = 490
         
-        # Heat visual effects
-        self.heat_particles = []
-        self.embers = []
-        self.smoke_particles = []
+        # Heat visual effects (heat and embers are opaque, smoke fades)
+        self.np_rng = RandomService.get_instance().numpy_stream('particles')
+        self.heat_particles = ParticleSystem(
+            ParticleSystem.random_palette(self.np_rng, ((200, 255), (100, 180), (0, 80))),
+            capacity=self.HEAT_COUNT,
+            bounds=pygame.Rect(-self.screen_width, 0, 3 * self.screen_width, 2 * self.screen_height)
+        )
+        self.embers = ParticleSystem(
+            ParticleSystem.random_palette(self.np_rng, ((220, 255), (120, 220), (0, 50))),
+            capacity=self.EMBER_COUNT,
+            growth=-0.02
+        )
+        self.smoke_particles = ParticleSystem(
+            ParticleSystem.random_palette(self.np_rng, ((50, 80), (50, 80), (50, 80))),
+            capacity=self.SMOKE_COUNT,
+            growth=0.05
+        )
         self.create_heat_effects()
         
         # Heat distortion effect
@@ -56,62 +89,52 @@ class HeatWave(WeatherSpells):
         parent3 = os.path.dirname(parent2)
         total_path = os.path.join(parent3, "./Assets/Sounds/Weathers/Fire.mp3")
 
-        self.fire_sound = pygame.mixer.Sound(total_path)
+        self.fire_sound = WeatherAmbience.get_instance().track(total_path)
         self.fire_sound.set_volume(0.5)
         self.sound_playing = False
     
     def create_heat_effects(self):
         """Create initial heat visual effects"""
-        # Create heat particles (rising)
-        for _ in range(50):
-            self.heat_particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'size': random.randint(4, 10),
-                'speed': random.randint(5, 10),
-                'color': (
-                    random.randint(200, 255),  # Red
-                    random.randint(100, 180),  # Green
-                    random.randint(0, 80),     # Blue
-                    random.randint(20, 120)    # Alpha
-                ),
-                'lifetime': random.randint(50, 150)
-            })
-        
-        # Create embers (sparks)
-        for _ in range(30):
-            self.embers.append({
-                'x': random.randint(self.x - 200, self.x + 200),
-                'y': random.randint(self.y - 100, self.y + 100),
-                'size': random.randint(1, 3),
-                'speed_x': random.uniform(1, 3),
-                'speed_y': random.uniform(-2, 1),
-                'color': (
-                    random.randint(220, 255),  # Red
-                    random.randint(120, 220),  # Green
-                    random.randint(0, 50),     # Blue
-                    255                         # Alpha
-                ),
-                'lifetime': random.randint(20, 60),
-                'current_life': 0
-            })
-            
-        # Create smoke particles
-        for _ in range(25):
-            self.smoke_particles.append({
-                'x': random.randint(self.x - 300, self.x + 300),
-                'y': random.randint(self.y - 50, self.y + 200),
-                'size': random.randint(15, 30),
-                'speed': random.uniform(3, 6),
-                'color': (
-                    random.randint(50, 80),    # Red
-                    random.randint(50, 80),    # Green
-                    random.randint(50, 80),    # Blue
-                    random.randint(20, 80)     # Alpha
-                ),
-                'lifetime': random.randint(60, 120),
-                'current_life': 0
-            })
+        # Heat particles (rising)
+        self.heat_particles.clear()
+        self.heat_particles.emit(
+            self.HEAT_COUNT,
+            x=self.np_rng.integers(0, self.screen_width, self.HEAT_COUNT, endpoint=True),
+            y=self.np_rng.integers(0, self.screen_height, self.HEAT_COUNT, endpoint=True),
+            size=self.np_rng.integers(4, 10, self.HEAT_COUNT, endpoint=True),
+            vy=-self.np_rng.integers(5, 10, self.HEAT_COUNT, endpoint=True),
+            lifetime=self.np_rng.integers(50, 150, self.HEAT_COUNT, endpoint=True)
+        )
+
+        # Embers (sparks)
+        self.embers.clear()
+        self.embers.emit(
+            self.EMBER_COUNT,
+            x=self.np_rng.integers(self.x - 200, self.x + 200, self.EMBER_COUNT, endpoint=True),
+            y=self.np_rng.integers(self.y - 100, self.y + 100, self.EMBER_COUNT, endpoint=True),
+            size=self.np_rng.integers(1, 3, self.EMBER_COUNT, endpoint=True),
+            vx=self.np_rng.uniform(1, 3, self.EMBER_COUNT),
+            vy=self.np_rng.uniform(-2, 1, self.EMBER_COUNT),
+            gravity=0.05,
+            lifetime=self.np_rng.integers(20, 60, self.EMBER_COUNT, endpoint=True)
+        )
+
+        # Smoke particles
+        self.smoke_particles.clear()
+        self.smoke_particles.emit(
+            self.SMOKE_COUNT,
+            x=self.np_rng.integers(self.x - 300, self.x + 300, self.SMOKE_COUNT, endpoint=True),
+            y=self.np_rng.integers(self.y - 50, self.y + 200, self.SMOKE_COUNT, endpoint=True),
+            size=self.np_rng.integers(15, 30, self.SMOKE_COUNT, endpoint=True),
+            vy=-self.np_rng.uniform(3, 6, self.SMOKE_COUNT),
+            alpha=self.np_rng.integers(20, 80, self.SMOKE_COUNT, endpoint=True),
+            lifetime=self.np_rng.integers(60, 120, self.SMOKE_COUNT, endpoint=True)
+        )
+
+    def _fire_bases(self, count):
+        """Pick one of the three fire locations for each respawning particle"""
+        fire_index = self.np_rng.integers(0, 2, count, endpoint=True)
+        return self.x + (fire_index - 1) * 250  # -250, 0, or 250 offset
     
     def start(self):
         """Start the heat wave animation"""
@@ -143,18 +166,14 @@ class HeatWave(WeatherSpells):
         
         # Get the current frame from the sprite sheet
         frame_coords = self.FIRE_FRAMES[int(self.current_frame)]
-        fire_image = self.sprite.get_sprite(frame_coords)
         
-        # Scale the image to desired size
-        fire_image = pygame.transform.scale(fire_image, (self.fire_width, self.fire_height))
+        # Scaled, semi-transparent frame
+        fire_image = self._faded_frame(frame_coords)
         
         # Calculate position to center the fire
         pos_x = self.x - (self.fire_width // 2)
         pos_y = self.y - (self.fire_height // 2)
         
-        # Set alpha for the fire (semi-transparent)
-        fire_image.set_alpha(200)
-        
         # Draw glow beneath each fire (as a circle)
         self._draw_fire_glow(pos_x, pos_y)
         self._draw_fire_glow(pos_x + 250, pos_y)
@@ -178,150 +197,104 @@ class HeatWave(WeatherSpells):
         
         return True
         
+    def _faded_frame(self, frame_coords):
+        """Return a scaled fire frame with FIRE_ALPHA applied
+
+        Scaled variants are shared through the TransformCache, so each
+        animation frame is copied once and the alpha set on the copy.
+        """
+        frame = self._faded_frames.get(frame_coords)
+        if frame is None:
+            frame = self.sprite.get_transformed(frame_coords, (self.fire_width, self.fire_height)).copy()
+            frame.set_alpha(self.FIRE_ALPHA)
+            self._faded_frames[frame_coords] = frame
+        return frame
+
     def _draw_fire_glow(self, pos_x, pos_y):
         """Draw a glowing effect beneath the fire"""
         # Calculate the intensity based on the current frame for flickering
-        flicker = random.uniform(0.8, 1.0)
+        flicker = self.rng.uniform(*self.GLOW_FLICKER)
         
         # Base position (bottom center of the fire)
         glow_x = pos_x + (self.fire_width // 2)
         glow_y = pos_y + (self.fire_height * 0.8)
         
-        # Draw multiple circles with decreasing opacity for a soft glow
-        for radius in range(100, 20, -20):
-            alpha = int(50 * flicker * (radius / 100))
-            glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                glow_surface,
-                (255, 150, 50, alpha),  # Orange-yellow with variable alpha
-                (radius, radius),
-                radius
-            )
-            self.screen.blit(glow_surface, (glow_x - radius, glow_y - radius))
+        # Pre-rendered soft glow at the nearest flicker level
+        GlowCache.get_instance().render(self.screen, (glow_x, glow_y), self.GLOW_COLOR,
+                                        self.GLOW_RINGS, flicker, *self.GLOW_FLICKER)
     
     def _draw_heat_particles(self):
         """Draw and update heat particles (rising hot air)"""
-        for particle in self.heat_particles:
-            # Draw the particle
-            pygame.draw.circle(
-                self.screen,
-                particle['color'],
-                (int(particle['x']), int(particle['y'])),
-                particle['size']
+        particles = self.heat_particles
+        particles.draw(self.screen)
+
+        # Slight horizontal drift, then rise and age
+        particles.x += self.np_rng.uniform(-0.5, 0.5, particles.capacity)
+        expired = particles.update()
+
+        # Reset if off screen or lifetime expired
+        count = expired.size
+        if count:
+            particles.respawn(
+                expired,
+                y=self.np_rng.integers(self.screen_height - 50, self.screen_height, count, endpoint=True),
+                x=self.np_rng.integers(0, self.screen_width, count, endpoint=True),
+                size=self.np_rng.integers(2, 8, count, endpoint=True),
+                vy=-self.np_rng.integers(3, 8, count, endpoint=True),
+                color=self.np_rng.integers(0, len(particles.palette), count),
+                lifetime=self.np_rng.integers(50, 150, count, endpoint=True)
             )
-            
-            # Move the particle upward
-            particle['y'] -= particle['speed']
-            particle['x'] += random.uniform(-0.5, 0.5)  # Slight horizontal drift
-            
-            # Reduce lifetime
-            particle['lifetime'] -= 1
-            
-            # Reset if off screen or lifetime expired
-            if particle['y'] < 0 or particle['lifetime'] <= 0:
-                particle['y'] = random.randint(self.screen_height - 50, self.screen_height)
-                particle['x'] = random.randint(0, self.screen_width)
-                particle['size'] = random.randint(2, 8)
-                particle['speed'] = random.randint(3, 8)
-                particle['color'] = (
-                    random.randint(200, 255),  # Red
-                    random.randint(100, 180),  # Green
-                    random.randint(0, 80),     # Blue
-                    random.randint(20, 120)    # Alpha
-                )
-                particle['lifetime'] = random.randint(50, 150)
     
     def _draw_embers(self):
         """Draw and update ember particles (sparks)"""
-        for ember in self.embers:
-            # Draw the ember (small bright dot)
-            pygame.draw.circle(
-                self.screen,
-                ember['color'],
-                (int(ember['x']), int(ember['y'])),
-                ember['size']
+        embers = self.embers
+        embers.draw(self.screen)
+
+        # Move, pull down and shrink the embers as they age
+        expired = embers.update()
+
+        # Spawn new embers from one of the fire locations
+        count = expired.size
+        if count:
+            base_x = self._fire_bases(count)
+            embers.respawn(
+                expired,
+                x=self.np_rng.integers(base_x - 50, base_x + 50, endpoint=True),
+                y=self.np_rng.integers(self.y - 50, self.y + 50, count, endpoint=True),
+                size=self.np_rng.integers(1, 3, count, endpoint=True),
+                vx=self.np_rng.uniform(-1, 1, count),
+                vy=self.np_rng.uniform(-4, -1, count),
+                color=self.np_rng.integers(0, len(embers.palette), count),
+                lifetime=self.np_rng.integers(20, 60, count, endpoint=True)
             )
-            
-            # Move the ember
-            ember['x'] += ember['speed_x']
-            ember['y'] += ember['speed_y']
-            
-            # Add gravity effect
-            ember['speed_y'] += 0.05
-            
-            # Reduce ember size as it ages
-            if ember['size'] > 0.2:
-                ember['size'] -= 0.02
-            
-            # Update lifetime
-            ember['current_life'] += 1
-            
-            # Reset if lifetime expired
-            if ember['current_life'] >= ember['lifetime']:
-                # Spawn new embers from one of the fire locations
-                fire_index = random.randint(0, 2)
-                base_x = self.x + (fire_index - 1) * 250  # -250, 0, or 250 offset
-                
-                ember['x'] = random.randint(base_x - 50, base_x + 50)
-                ember['y'] = random.randint(self.y - 50, self.y + 50)
-                ember['size'] = random.randint(1, 3)
-                ember['speed_x'] = random.uniform(-1, 1)
-                ember['speed_y'] = random.uniform(-4, -1)
-                ember['color'] = (
-                    random.randint(220, 255),  # Red
-                    random.randint(120, 220),  # Green
-                    random.randint(0, 50),     # Blue
-                    255                         # Alpha
-                )
-                ember['lifetime'] = random.randint(20, 60)
-                ember['current_life'] = 0
                 
     def _draw_smoke_particles(self):
         """Draw and update smoke particles"""
-        for smoke in self.smoke_particles:
-            # Draw the smoke particle (larger, transparent circle)
-            pygame.draw.circle(
-                self.screen,
-                smoke['color'],
-                (int(smoke['x']), int(smoke['y'])),
-                smoke['size']
+        smoke = self.smoke_particles
+        smoke.draw(self.screen)
+
+        # Rise with slight drift and grow as the smoke disperses
+        smoke.x += self.np_rng.uniform(-0.3, 0.3, smoke.capacity)
+        expired = smoke.update()
+
+        # Fade out over the second half of each puff's life
+        fading = smoke.alive & (smoke.age > smoke.lifetime // 2) & (smoke.alpha > 5)
+        smoke.alpha[fading] = np.maximum(5, smoke.alpha[fading] - 1)
+
+        # Spawn new smoke from one of the fire locations
+        count = expired.size
+        if count:
+            base_x = self._fire_bases(count)
+            smoke.respawn(
+                expired,
+                x=self.np_rng.integers(base_x - 30, base_x + 30, endpoint=True),
+                y=self.np_rng.integers(self.y - 20, self.y + 100, count, endpoint=True),
+                size=self.np_rng.integers(5, 15, count, endpoint=True),
+                vy=-self.np_rng.uniform(1, 3, count),
+                color=self.np_rng.integers(0, len(smoke.palette), count),
+                alpha=self.np_rng.integers(20, 80, count, endpoint=True),
+                lifetime=self.np_rng.integers(60, 120, count, endpoint=True)
             )
-            
-            # Move the smoke upward and with slight drift
-            smoke['y'] -= smoke['speed']
-            smoke['x'] += random.uniform(-0.3, 0.3)
-            
-            # Increase size as it rises (smoke disperses)
-            smoke['size'] += 0.05
-            
-            # Update lifetime
-            smoke['current_life'] += 1
-            
-            # Fade out as it ages
-            if smoke['current_life'] > smoke['lifetime'] // 2:
-                # Gradually reduce alpha
-                if smoke['color'][3] > 5:
-                    r, g, b, a = smoke['color']
-                    smoke['color'] = (r, g, b, max(5, a - 1))
-            
-            # Reset if lifetime expired
-            if smoke['current_life'] >= smoke['lifetime']:
-                # Spawn new smoke from one of the fire locations
-                fire_index = random.randint(0, 2)
-                base_x = self.x + (fire_index - 1) * 250  # -250, 0, or 250 offset
-                
-                smoke['x'] = random.randint(base_x - 30, base_x + 30)
-                smoke['y'] = random.randint(self.y - 20, self.y + 100)
-                smoke['size'] = random.randint(5, 15)
-                smoke['speed'] = random.uniform(1, 3)
-                smoke['color'] = (
-                    random.randint(50, 80),    # Red
-                    random.randint(50, 80),    # Green
-                    random.randint(50, 80),    # Blue
-                    random.randint(20, 80)     # Alpha
-                )
-                smoke['lifetime'] = random.randint(60, 120)
-                smoke['current_life'] = 0
     
     def _draw_heat_distortion(self):
         """Draw heat distortion effect"""
@@ -332,13 +305,13 @@ class HeatWave(WeatherSpells):
                 offset = int(amplitude * math.sin((x/30) + self.heat_timer))
                 
                 # Draw a small vertical line with distortion
-                pygame.draw.line(
+                self.screen.mark_dirty(pygame.draw.line(
                     self.screen,
                     (255, 255, 255, 10),  # Very transparent white
                     (x, y + offset),
                     (x, y + offset + 3),
                     1
-                )
+                ))
     
     def apply_effect(self):
         """Apply the spell's effect"""
@@ -1,31 +1,64 @@
+import argparse
+import time
 import pygame
-import random
+from Utils.RandomService import RandomService
 from Spells.SpellBase import SpellBase
 from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.ElementalWeather.WeatherSpells import WeatherSpells
 import os
+from Utils.WeatherAmbience import WeatherAmbience
+from Effects.ParticleSystem import ParticleSystem
 class Rain(WeatherSpells):
-    """Rain spell that creates a rain effect in the background"""
+    """Rain spell that creates a rain effect in the background
+
+    Raindrops are streak stamps in a few fixed lengths, so the whole
+    shower draws from a handful of pre-rendered sprites in one blits call.
+    DND_RAIN_DENSITY (or the density argument) scales the number of drops.
+    """
+
+    BASE_COUNT = 300
+    DENSITY_ENV_VAR = 'DND_RAIN_DENSITY'
+    # Streak sprite lengths, spread over rain_height +- 5
+    STREAK_LENGTHS = (15, 18, 22, 25)
     
-    def __init__(self, screen):
-        """Initialize the rain effect"""
+    def __init__(self, screen, density=None):
+        """Initialize the rain effect
+
+        Args:
+            screen: The pygame screen to render on
+            density: Multiplier on BASE_COUNT raindrops, or None to read DND_RAIN_DENSITY
+        """
         super().__init__(screen)
+        self.rng = RandomService.get_instance().numpy_stream('particles')
         self.is_active = False
-        self.raindrops = []
         self.rain_color = (120, 160, 255, 220)  # More visible blue-ish color
         self.rain_width = 3  # Thicker raindrops
         self.rain_height = 20  # Longer raindrops
-        self.rain_count = 300  # More raindrops
+        if density is None:
+            density = float(os.environ.get(self.DENSITY_ENV_VAR, '1'))
+        self.density = density
+        self.rain_count = max(0, int(self.BASE_COUNT * density))
         self.rain_speed = 25  # Faster rain
         self.thunder_timer = 0
         self.thunder_frequency = 5  # Seconds between thunder
         self.thunder_duration = 0.2  # How long the thunder flash lasts
         self.thunder_active = False
         self.thunder_alpha = 0
+        self.flash_overlay = None  # Screen-sized white surface, made on the first flash
         
         # Screen dimensions
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
+
+        # Raindrops are vertical streaks reset once they fall past the bottom
+        self.raindrops = ParticleSystem(
+            [self.rain_color],
+            shape=ParticleSystem.STREAK,
+            vertical=True,
+            capacity=self.rain_count,
+            bounds=pygame.Rect(-self.screen_width, -self.screen_height,
+                               3 * self.screen_width, 2 * self.screen_height + 1)
+        )
         
         # Load the rain sound effect
         dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -34,7 +67,7 @@ class Rain(WeatherSpells):
         parent3 = os.path.dirname(parent2)
         total_path = os.path.join(parent3, "./Assets/Sounds/Weathers/RainThunder.mp3")
 
-        self.thunder_sound = pygame.mixer.Sound(total_path)
+        self.thunder_sound = WeatherAmbience.get_instance().track(total_path)
         self.sound_playing = False
         self.thunder_sound.set_volume(0.5)
         # Create initial raindrops
@@ -42,18 +75,21 @@ class Rain(WeatherSpells):
     
     def _create_raindrops(self):
         """Create the initial set of raindrops"""
-        self.raindrops = []
-        for _ in range(self.rain_count):
-            x = random.randint(0, self.screen_width)
-            y = random.randint(-100, self.screen_height)
-            speed = random.randint(self.rain_speed - 5, self.rain_speed + 5)
-            length = random.randint(self.rain_height - 5, self.rain_height + 6)
-            self.raindrops.append({
-                'x': x,
-                'y': y,
-                'speed': speed,
-                'length': length
-            })
+        self.raindrops.clear()
+        self.raindrops.emit(
+            self.rain_count,
+            x=self.rng.integers(0, self.screen_width, self.rain_count, endpoint=True),
+            y=self.rng.integers(-100, self.screen_height, self.rain_count, endpoint=True),
+            vy=self.rng.integers(self.rain_speed - 5, self.rain_speed + 5, self.rain_count, endpoint=True),
+            size=self.rain_width,
+            length=self.rng.choice(self.STREAK_LENGTHS, self.rain_count)
+        )
+
+    def set_density(self, density):
+        """Change the number of raindrops, recreating the shower"""
+        self.density = density
+        self.rain_count = max(0, int(self.BASE_COUNT * density))
+        self._create_raindrops()
     
     def start(self):
         """Start the rain animation"""
@@ -76,24 +112,18 @@ class Rain(WeatherSpells):
         if not self.is_active:
             return False
         
-        # Draw each raindrop
-        for drop in self.raindrops:
-            # Draw the raindrop as a line
-            pygame.draw.line(
-                self.screen,
-                self.rain_color,
-                (drop['x'], drop['y']),
-                (drop['x'], drop['y'] + drop['length']),
-                self.rain_width
+        # Draw every raindrop, then let them fall
+        self.raindrops.draw(self.screen)
+        expired = self.raindrops.update()
+
+        # Raindrops that went off screen start again above the top
+        count = expired.size
+        if count:
+            self.raindrops.respawn(
+                expired,
+                y=self.rng.integers(-100, -10, count, endpoint=True),
+                x=self.rng.integers(0, self.screen_width, count, endpoint=True)
             )
-            
-            # Update raindrop position
-            drop['y'] += drop['speed']
-            
-            # If raindrop goes off screen, reset it to the top
-            if drop['y'] > self.screen_height:
-                drop['y'] = random.randint(-100, -10)
-                drop['x'] = random.randint(0, self.screen_width)
         
         # Handle occasional thunder flashes
         current_time = pygame.time.get_ticks() / 1000  # Current time in seconds
@@ -105,9 +135,11 @@ class Rain(WeatherSpells):
             if elapsed < self.thunder_duration:
                 # Flash intensity based on time
                 flash_intensity = int(180 * (1 - elapsed / self.thunder_duration))
-                flash_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-                flash_surface.fill((255, 255, 255, flash_intensity))
-                self.screen.blit(flash_surface, (0, 0))
+                if self.flash_overlay is None:
+                    self.flash_overlay = pygame.Surface((self.screen_width, self.screen_height), 0, self.screen)
+                    self.flash_overlay.fill((255, 255, 255))
+                self.flash_overlay.set_alpha(flash_intensity)
+                self.screen.blit(self.flash_overlay, (0, 0))
             else:
                 self.thunder_active = False
         
@@ -116,4 +148,38 @@ class Rain(WeatherSpells):
     def apply_effect(self):
         """Apply the spell's effect"""
         # Rain doesn't have a direct effect on gameplay
-        pass 
\ No newline at end of file
+        pass
+
+
+if __name__ == "__main__":
+    from Utils.RenderPipeline import RenderPipeline
+
+    parser = argparse.ArgumentParser(description="Time the rain weather at a given density")
+    parser.add_argument('--density', type=float, default=10.0, help="Multiplier on the base raindrop count")
+    parser.add_argument('--frames', type=int, default=600, help="Frames to render")
+    args = parser.parse_args()
+
+    # Headless display at the game's resolution
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    display = pygame.display.set_mode((1100, 700))
+    background = pygame.Surface(display.get_size())
+    background.fill((30, 40, 60))
+    pipeline = RenderPipeline(display, background)
+
+    rain = Rain(pipeline.surface, density=args.density)
+    rain.start()
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        pipeline.begin_frame()
+        with pipeline.layer('weather'):
+            rain.animate_spell()
+        pipeline.present()
+    elapsed = time.perf_counter() - start
+    rain.stop()
+
+    frame_ms = elapsed * 1000 / args.frames
+    print(f"{rain.rain_count} raindrops, {args.frames} frames: "
+          f"{frame_ms:.2f} ms per frame ({1000 / frame_ms:.0f} FPS), "
+          f"{rain.raindrops.stats()['stamps']} streak sprites")
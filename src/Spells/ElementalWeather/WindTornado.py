@@ -1,9 +1,12 @@
 import pygame
-import random
+import numpy as np
+from Utils.RandomService import RandomService
 from Spells.SpellBase import SpellBase
 from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.ElementalWeather.WeatherSpells import WeatherSpells
 import os
+from Utils.WeatherAmbience import WeatherAmbience
+from Effects.ParticleSystem import ParticleSystem
 class WindTornado(WeatherSpells):
     """WindTornado spell that creates a tornado effect in the middle of the screen"""
     
@@ -16,13 +19,23 @@ class WindTornado(WeatherSpells):
         (201, 7, 46, 56),    # Frame 1 
         (265, 7, 46, 56)
     ]
+
+    # Surface alpha of the tornado frames (semi-transparent)
+    TORNADO_ALPHA = 200
+
+    # Particles per system
+    STREAK_COUNT = 30
+    DEBRIS_COUNT = 40
     
     def __init__(self, screen):
         """Initialize the tornado effect"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().numpy_stream('particles')
         self.is_active = False
         self.sprite_path = "./Assets/Cards/Elementals/Weathers/Tornado.png"
         self.sprite = SpriteUtil(self.sprite_path)
+        self.sprite.pre_slice(self.TORNADO_FRAMES)
+        self._faded_frames = {}  # frame rect -> scaled frame with the alpha applied
         
         # Animation properties
         self.current_frame = 0
@@ -41,9 +54,20 @@ class WindTornado(WeatherSpells):
         self.tornado_width = 400
         self.tornado_height = 600
         
-        # Wind visual effects
-        self.wind_streaks = []
-        self.debris_particles = []
+        # Wind visual effects; particles past the right edge are reset on the left
+        wind_bounds = pygame.Rect(-self.screen_width, -self.screen_height,
+                                  2 * self.screen_width + 1, 3 * self.screen_height)
+        self.wind_streaks = ParticleSystem(
+            [(200, 200, 255)],
+            shape=ParticleSystem.STREAK,
+            capacity=self.STREAK_COUNT,
+            bounds=wind_bounds
+        )
+        self.debris_particles = ParticleSystem(
+            ParticleSystem.random_palette(self.rng, ((150, 200), (150, 200), (150, 200))),
+            capacity=self.DEBRIS_COUNT,
+            bounds=wind_bounds
+        )
         self.create_wind_effects()
         
         # Wind sound effect (commented out for now)
@@ -54,39 +78,35 @@ class WindTornado(WeatherSpells):
         parent3 = os.path.dirname(parent2)
         total_path = os.path.join(parent3, "./Assets/Sounds/Weathers/tornado.mp3")
 
-        self.wind_sound = pygame.mixer.Sound(total_path)
+        self.wind_sound = WeatherAmbience.get_instance().track(total_path)
         self.wind_sound.set_volume(0.5)
         self.sound_playing = False
     
     def create_wind_effects(self):
         """Create initial wind visual effects"""
-        # Create wind streaks (horizontal lines)
-        for _ in range(30):
-            self.wind_streaks.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'length': random.randint(20, 100),
-                'speed': random.randint(25, 50),
-                'color': (200, 200, 255, random.randint(30, 100)),
-                'thickness': random.randint(1, 3)
-            })
-        
-        # Create debris particles
-        for _ in range(40):
-            self.debris_particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'size': random.randint(2, 6),
-                'speed_x': random.randint(15, 30),
-                'speed_y': random.randint(0, 6),
-                'color': (
-                    random.randint(150, 200),
-                    random.randint(150, 200),
-                    random.randint(150, 200),
-                    random.randint(100, 180)
-                ),
-                'rotation': random.random() * 360
-            })
+        # Wind streaks (horizontal lines)
+        self.wind_streaks.clear()
+        self.wind_streaks.emit(
+            self.STREAK_COUNT,
+            x=self.rng.integers(0, self.screen_width, self.STREAK_COUNT, endpoint=True),
+            y=self.rng.integers(0, self.screen_height, self.STREAK_COUNT, endpoint=True),
+            length=self.rng.integers(20, 100, self.STREAK_COUNT, endpoint=True),
+            vx=self.rng.integers(25, 50, self.STREAK_COUNT, endpoint=True),
+            alpha=self.rng.integers(30, 100, self.STREAK_COUNT, endpoint=True),
+            size=self.rng.integers(1, 3, self.STREAK_COUNT, endpoint=True)
+        )
+
+        # Debris particles
+        self.debris_particles.clear()
+        self.debris_particles.emit(
+            self.DEBRIS_COUNT,
+            x=self.rng.integers(0, self.screen_width, self.DEBRIS_COUNT, endpoint=True),
+            y=self.rng.integers(0, self.screen_height, self.DEBRIS_COUNT, endpoint=True),
+            size=self.rng.integers(2, 6, self.DEBRIS_COUNT, endpoint=True),
+            vx=self.rng.integers(15, 30, self.DEBRIS_COUNT, endpoint=True),
+            vy=self.rng.integers(0, 6, self.DEBRIS_COUNT, endpoint=True),
+            rotation=self.rng.random(self.DEBRIS_COUNT) * 360
+        )
     
     def start(self):
         """Start the tornado animation"""
@@ -118,16 +138,14 @@ class WindTornado(WeatherSpells):
         
         # Get the current frame from the sprite sheet
         frame_coords = self.TORNADO_FRAMES[int(self.current_frame)]
-        tornado_image = self.sprite.get_sprite(frame_coords)
         
-        # Scale the image to desired size
-        tornado_image = pygame.transform.scale(tornado_image, (self.tornado_width, self.tornado_height))
+        # Scaled, semi-transparent frame
+        tornado_image = self._faded_frame(frame_coords)
         
         # Calculate position to center the tornado
         pos_x = self.x - (self.tornado_width // 2)
         pos_y = self.y - (self.tornado_height // 2)
         
-        tornado_image.set_alpha(200)
         # Draw the tornado
         self.screen.blit(tornado_image, (pos_x, pos_y))
         self.screen.blit(tornado_image, (pos_x + 300, pos_y))
@@ -139,58 +157,54 @@ class WindTornado(WeatherSpells):
         
         return True
     
+    def _faded_frame(self, frame_coords):
+        """Return a scaled tornado frame with TORNADO_ALPHA applied, copied on first use"""
+        frame = self._faded_frames.get(frame_coords)
+        if frame is None:
+            frame = self.sprite.get_transformed(frame_coords, (self.tornado_width, self.tornado_height)).copy()
+            frame.set_alpha(self.TORNADO_ALPHA)
+            self._faded_frames[frame_coords] = frame
+        return frame
+
     def _draw_wind_streaks(self):
         """Draw and update wind streak effects"""
-        for streak in self.wind_streaks:
-            # Create a surface for the wind streak with alpha
-            streak_surface = pygame.Surface((streak['length'], streak['thickness']), pygame.SRCALPHA)
-            streak_surface.fill(streak['color'])
-            
-            # Draw the streak
-            self.screen.blit(streak_surface, (streak['x'], streak['y']))
-            
-            # Move the streak
-            streak['x'] += streak['speed']
-            
-            # Reset if off screen
-            if streak['x'] > self.screen_width:
-                streak['x'] = -streak['length']
-                streak['y'] = random.randint(0, self.screen_height)
-                streak['length'] = random.randint(20, 100)
-                streak['color'] = (200, 200, 255, random.randint(30, 100))
+        streaks = self.wind_streaks
+        streaks.draw(self.screen)
+        expired = streaks.update()
+
+        # Reset off-screen streaks just left of the screen
+        count = expired.size
+        if count:
+            length = self.rng.integers(20, 100, count, endpoint=True)
+            streaks.respawn(
+                expired,
+                x=-length,
+                y=self.rng.integers(0, self.screen_height, count, endpoint=True),
+                length=length,
+                alpha=self.rng.integers(30, 100, count, endpoint=True)
+            )
     
     def _draw_debris_particles(self):
         """Draw and update debris particles"""
-        for particle in self.debris_particles:
-            # Draw the particle
-            pygame.draw.circle(
-                self.screen,
-                particle['color'],
-                (int(particle['x']), int(particle['y'])),
-                particle['size']
+        debris = self.debris_particles
+        debris.draw(self.screen)
+        expired = debris.update()
+
+        # Add some randomness to movement to simulate wind turbulence
+        debris.vy += self.rng.uniform(-0.5, 0.5, debris.capacity)
+        np.clip(debris.vy, -3, 3, out=debris.vy)
+
+        # Reset off-screen debris at the left edge
+        count = expired.size
+        if count:
+            debris.respawn(
+                expired,
+                x=0,
+                y=self.rng.integers(0, self.screen_height, count, endpoint=True),
+                size=self.rng.integers(2, 6, count, endpoint=True),
+                vx=self.rng.integers(5, 15, count, endpoint=True),
+                color=self.rng.integers(0, len(debris.palette), count)
             )
-            
-            # Move the particle
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            
-            # Add some randomness to movement to simulate wind turbulence
-            particle['speed_y'] += random.uniform(-0.5, 0.5)
-            if particle['speed_y'] > 3: particle['speed_y'] = 3
-            if particle['speed_y'] < -3: particle['speed_y'] = -3
-            
-            # Reset if off screen
-            if particle['x'] > self.screen_width:
-                particle['x'] = 0
-                particle['y'] = random.randint(0, self.screen_height)
-                particle['size'] = random.randint(2, 6)
-                particle['speed_x'] = random.randint(5, 15)
-                particle['color'] = (
-                    random.randint(150, 200),
-                    random.randint(150, 200),
-                    random.randint(150, 200),
-                    random.randint(100, 180)
-                )
     
     def apply_effect(self):
         """Apply the spell's effect"""
@@ -3,6 +3,7 @@ from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 import time
 import os
+from Utils.SoundBank import SoundBank
 class Heal(SpellBase):
     """Lightning spell that strikes a target"""
     
@@ -29,6 +30,7 @@ class Heal(SpellBase):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/HealEffect.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.animation_speed = 0.1  # Seconds between frames
         self.damage = 10  # Damage dealt by the lightning
         self.scale_factor = 4  # Scale the lightning to be twice as large
@@ -41,7 +43,7 @@ class Heal(SpellBase):
         parent2 = os.path.dirname(parent1)
         sound_path = "./Assets/Sounds/heal.mp3"
         total_path = os.path.join(parent2, sound_path)
-        self.heal_sound = pygame.mixer.Sound(total_path)
+        self.heal_sound = SoundBank.get_instance().load(total_path)
         self.heal_sound.set_volume(0.5)
         
     def animate_spell(self, caster, target):
@@ -64,7 +66,7 @@ class Heal(SpellBase):
         original_height = heal_image.get_height()
         new_width = int(original_width * self.scale_factor)
         new_height = int(original_height * self.scale_factor)
-        heal_image = pygame.transform.scale(heal_image, (new_width, new_height))
+        heal_image = self.sprite.get_transformed(frame_coords, (new_width, new_height))
 
         position = (caster.position_to_draw[0], 
                     caster.position_to_draw[1])
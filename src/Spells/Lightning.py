@@ -4,6 +4,7 @@ from Spells.SpellBase import SpellBase
 from QuantumMechanics.QuantumTunneling import QuantumTunneling
 import time
 import os
+from Utils.SoundBank import SoundBank
 class Lightning(SpellBase):
     """Lightning spell that strikes a target"""
     
@@ -25,6 +26,7 @@ class Lightning(SpellBase):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/lightning.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.animation_speed = 0.1  # Seconds between frames
         self.damage = 5  # Damage dealt by the lightning
         self.scale_factor = 5  # Scale the lightning to be twice as large
@@ -38,7 +40,7 @@ class Lightning(SpellBase):
         sound_path = "./Assets/Sounds/lightning.wav"
         total_path = os.path.join(parent2, sound_path)
         
-        self.lightning_sound = pygame.mixer.Sound(total_path)
+        self.lightning_sound = SoundBank.get_instance().load(total_path)
         self.lightning_sound.set_volume(0.5)
 
     def animate_spell(self, caster, target):
@@ -65,7 +67,7 @@ class Lightning(SpellBase):
         original_height = lightning_image.get_height()
         new_width = int(original_width * self.scale_factor)
         new_height = int(original_height * self.scale_factor)
-        lightning_image = pygame.transform.scale(lightning_image, (new_width, new_height))
+        lightning_image = self.sprite.get_transformed(frame_coords, (new_width, new_height))
 
         position = (target.position_to_draw[0], 
                     target.position_to_draw[1] - 250)
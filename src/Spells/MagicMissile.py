@@ -1,10 +1,11 @@
 import pygame
 import math
-import random
+from Utils.RandomService import RandomService
 from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 from QuantumMechanics.QuantumTunneling import QuantumTunneling
 import os
+from Utils.SoundBank import SoundBank
 class MagicMissile(SpellBase):
     """Magic missile spell that launches multiple missiles at the target"""
     
@@ -24,8 +25,10 @@ class MagicMissile(SpellBase):
     def __init__(self, screen):
         """Initialize the magic missile spell"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().stream('particles')
         self.SPRITE_PATH = "./Assets/Cards/magicmissile2.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.current_frame = 0
         self.damage = 6  # Regular damage amount
         self.spell_active = False
@@ -42,7 +45,7 @@ class MagicMissile(SpellBase):
         parent2 = os.path.dirname(parent1)
         sound_path = "./Assets/Sounds/magicmissile.mp3"
         total_path = os.path.join(parent2, sound_path)
-        self.missile_sound = pygame.mixer.Sound(total_path)
+        self.missile_sound = SoundBank.get_instance().load(total_path)
         self.missile_sound.set_volume(0.5)
         self.sound_played = False
         
@@ -67,16 +70,16 @@ class MagicMissile(SpellBase):
             # Create missiles
             for _ in range(self.max_missiles):
                 # Random starting position near caster
-                start_x = caster.position_to_draw[0] + random.randint(-20, 20)
-                start_y = caster.position_to_draw[1] + random.randint(-20, 20)
+                start_x = caster.position_to_draw[0] + self.rng.randint(-20, 20)
+                start_y = caster.position_to_draw[1] + self.rng.randint(-20, 20)
                 
                 # Calculate path to target with some randomness
-                target_x = target.position_to_draw[0] + random.randint(-30, 30)
-                target_y = target.position_to_draw[1] + random.randint(-30, 30)
+                target_x = target.position_to_draw[0] + self.rng.randint(-30, 30)
+                target_y = target.position_to_draw[1] + self.rng.randint(-30, 30)
                 
                 # Add a control point for curved trajectory
-                control_x = (start_x + target_x) / 2 + random.randint(-40, 40)
-                control_y = (start_y + target_y) / 2 + random.randint(-40, 40)
+                control_x = (start_x + target_x) / 2 + self.rng.randint(-40, 40)
+                control_y = (start_y + target_y) / 2 + self.rng.randint(-40, 40)
                 
                 # Create missile
                 missile = {
@@ -89,8 +92,8 @@ class MagicMissile(SpellBase):
                     'target_x': target_x,
                     'target_y': target_y,
                     'progress': 0.0,
-                    'speed': self.missile_speed * (1.0 + random.random() * 0.4),  # Vary speed slightly
-                    'frame': random.randint(0, len(self.animation_frames) - 1),
+                    'speed': self.missile_speed * (1.0 + self.rng.random() * 0.4),  # Vary speed slightly
+                    'frame': self.rng.randint(0, len(self.animation_frames) - 1),
                     'hit': False
                 }
                 self.missiles.append(missile)
@@ -1,10 +1,11 @@
 import pygame
 import math
-import random
+from Utils.RandomService import RandomService
 from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 from QuantumMechanics.QuantumTunneling import QuantumTunneling
 import os
+from Utils.SoundBank import SoundBank
 class MagicMissileV2(SpellBase):
     """Magic missile spell that reverses direction and hits the caster"""
     
@@ -24,8 +25,10 @@ class MagicMissileV2(SpellBase):
     def __init__(self, screen):
         """Initialize the magic missile spell"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().stream('particles')
         self.SPRITE_PATH = "./Assets/Cards/magicmissile2.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.current_frame = 0
         self.damage = 3  # Self-damage is less than regular damage
         self.spell_active = False
@@ -43,7 +46,7 @@ class MagicMissileV2(SpellBase):
         parent2 = os.path.dirname(parent1)
         sound_path = "./Assets/Sounds/magicmissile.mp3"
         total_path = os.path.join(parent2, sound_path)
-        self.missile_sound = pygame.mixer.Sound(total_path)
+        self.missile_sound = SoundBank.get_instance().load(total_path)
         self.missile_sound.set_volume(0.5)
         self.sound_played = False
 
@@ -67,20 +70,20 @@ class MagicMissileV2(SpellBase):
             # Create missiles
             for _ in range(self.max_missiles):
                 # Random starting position near caster
-                start_x = caster.position_to_draw[0] + random.randint(-20, 20)
-                start_y = caster.position_to_draw[1] + random.randint(-20, 20)
+                start_x = caster.position_to_draw[0] + self.rng.randint(-20, 20)
+                start_y = caster.position_to_draw[1] + self.rng.randint(-20, 20)
                 
                 # Calculate path to target
-                target_x = target.position_to_draw[0] + random.randint(-30, 30)
-                target_y = target.position_to_draw[1] + random.randint(-30, 30)
+                target_x = target.position_to_draw[0] + self.rng.randint(-30, 30)
+                target_y = target.position_to_draw[1] + self.rng.randint(-30, 30)
                 
                 # Calculate midpoint for reversal
                 mid_x = start_x + (target_x - start_x) * self.reversal_point
                 mid_y = start_y + (target_y - start_y) * self.reversal_point
                 
                 # Add random variation to midpoint
-                mid_x += random.randint(-20, 20)
-                mid_y += random.randint(-20, 20)
+                mid_x += self.rng.randint(-20, 20)
+                mid_y += self.rng.randint(-20, 20)
                 
                 # Create missile
                 missile = {
@@ -93,8 +96,8 @@ class MagicMissileV2(SpellBase):
                     'target_x': start_x,  # Return to caster
                     'target_y': start_y,
                     'progress': 0.0,
-                    'speed': self.missile_speed * (1.0 + random.random() * 0.4),  # Vary speed slightly
-                    'frame': random.randint(0, len(self.animation_frames) - 1),
+                    'speed': self.missile_speed * (1.0 + self.rng.random() * 0.4),  # Vary speed slightly
+                    'frame': self.rng.randint(0, len(self.animation_frames) - 1),
                     'hit': False,
                     'reversed': False
                 }
@@ -122,8 +125,8 @@ class MagicMissileV2(SpellBase):
             if not missile['reversed'] and missile['progress'] >= self.reversal_point:
                 missile['reversed'] = True
                 # Add some "confusion" to the missile path when it reverses
-                missile['mid_x'] += random.randint(-30, 30)
-                missile['mid_y'] += random.randint(-30, 30)
+                missile['mid_x'] += self.rng.randint(-30, 30)
+                missile['mid_y'] += self.rng.randint(-30, 30)
             
             # Calculate position based on quadratic Bezier curve
             if not missile['reversed']:
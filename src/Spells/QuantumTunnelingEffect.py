@@ -3,6 +3,7 @@ from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 import math
 import os
+from Utils.SoundBank import SoundBank
 class QuantumTunnelingEffect(SpellBase):
     """Quantum tunneling effect that creates a shimmering aura around the caster"""
     
@@ -23,6 +24,7 @@ class QuantumTunnelingEffect(SpellBase):
         super().__init__(screen)
         self.SPRITE_PATH = "./Assets/Cards/tunnel.png"  # Using the card image for effect
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.animation_speed = 0.1
         self.damage = 0  # No damage, just visual effect
         self.scale_factor = 1.5
@@ -36,7 +38,7 @@ class QuantumTunnelingEffect(SpellBase):
             parent2 = os.path.dirname(parent1)
             sound_path = "./Assets/Sounds/energyshieldsound.mp3"
             total_path = os.path.join(parent2, sound_path)
-            self.tunneling_sound = pygame.mixer.Sound(total_path)
+            self.tunneling_sound = SoundBank.get_instance().load(total_path)
             self.tunneling_sound.set_volume(0.5)
         except:
             self.tunneling_sound = None
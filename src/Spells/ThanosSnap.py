@@ -1,9 +1,11 @@
 import pygame
-import random
+from Utils.RandomService import RandomService
 import math
 from SpriteUtil.SpriteUtil import SpriteUtil
 from Spells.SpellBase import SpellBase
 import os
+from Utils.SoundBank import SoundBank
+from Effects.ParticleSystem import ParticleSystem
 class ThanosSnap(SpellBase):
     """Thanos Snap spell that makes the opponent discard half their cards"""
     
@@ -23,17 +25,21 @@ class ThanosSnap(SpellBase):
         (2912, 144, 58, 77),    # Frame 1
         (3576, 144, 58, 77)
     ]
+
+    SNAP_SIZE = (200, 200)
+    PARTICLE_SIZE = 15
     
     def __init__(self, screen):
         """Initialize the Thanos Snap effect"""
         super().__init__(screen)
+        self.rng = RandomService.get_instance().stream('particles')
         self.SPRITE_PATH = "./Assets/Cards/thanos_snap_sheet.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.current_frame = 0
         self.spell_active = False
         
         # Particle properties
-        self.particles = []
         self.max_particles = 200
         self.particle_colors = [
             (255, 165, 0),    # Orange
@@ -42,6 +48,10 @@ class ThanosSnap(SpellBase):
             (255, 215, 0),    # Gold
             (218, 165, 32)    # Golden Rod
         ]
+        # Fading, turning squares of PARTICLE_SIZE pixels
+        self.np_rng = RandomService.get_instance().numpy_stream('particles')
+        self.particles = ParticleSystem(self.particle_colors, shape=ParticleSystem.POLYGON, sides=4,
+                                        capacity=self.max_particles)
         
         # Sound effect
         self.sound_played = False
@@ -51,7 +61,7 @@ class ThanosSnap(SpellBase):
         sound_path_snap = "./Assets/Sounds/thanossnap.wav"
         
         total_path_snap = os.path.join(parent2, sound_path_snap)
-        self.snap_sound = pygame.mixer.Sound(total_path_snap)
+        self.snap_sound = SoundBank.get_instance().load(total_path_snap)
         self.snap_sound.set_volume(0.5)
     def animate_spell(self, caster, target):
         """Animate the Thanos Snap spell
@@ -66,7 +76,7 @@ class ThanosSnap(SpellBase):
         if not self.spell_active:
             # Initialize effect when spell starts
             self.spell_active = True
-            self.particles = []
+            self.particles.clear()
             self.current_frame = 0
             self.sound_played = False
             
@@ -86,8 +96,7 @@ class ThanosSnap(SpellBase):
         # Draw the snap effect near caster's hand
         position_to_draw = (self.screen.get_width() / 2, self.screen.get_height() / 2)
         snap_pos = (position_to_draw[0] - 120, position_to_draw[1] - 170)
-        snap_sprite = self.sprite.get_sprite(self.animation_frames[frame_index])
-        snap_sprite = pygame.transform.scale(snap_sprite, (200, 200))
+        snap_sprite = self.sprite.get_transformed(self.animation_frames[frame_index], self.SNAP_SIZE)
         self.screen.blit(snap_sprite, snap_pos)
         
         # Update and draw particles
@@ -124,66 +133,25 @@ class ThanosSnap(SpellBase):
     
     def _create_particles_at_position(self, position, count):
         """Create particles at the specified position"""
-        for _ in range(count):
+        self.particles.emit(
+            count,
             # Random offset from center
-            offset_x = random.randint(-60, 60)
-            offset_y = random.randint(-320, 200)
-            
-            # Create particle
-            particle = {
-                'x': position[0] + offset_x,
-                'y': position[1] + offset_y,
-                'size': random.randint(15, 15),
-                'color': random.choice(self.particle_colors),
-                'speed_x': random.uniform(-1.5, 1.5),
-                'speed_y': random.uniform(-1.5, 1.5),
-                'fade_speed': random.uniform(0.01, 0.03),
-                'alpha': 255,
-                'rotation': random.uniform(0, 360),
-                'rotation_speed': random.uniform(-5, 5)
-            }
-            self.particles.append(particle)
+            x=position[0] + self.np_rng.integers(-60, 60, count, endpoint=True),
+            y=position[1] + self.np_rng.integers(-320, 200, count, endpoint=True),
+            # A square PARTICLE_SIZE wide has its corners at this radius
+            size=self.PARTICLE_SIZE / math.sqrt(2),
+            vx=self.np_rng.uniform(-1.5, 1.5, count),
+            vy=self.np_rng.uniform(-1.5, 1.5, count),
+            fade=self.np_rng.uniform(0.01, 0.03, count) * 255,
+            rotation=self.np_rng.uniform(0, 360, count),
+            spin=self.np_rng.uniform(-5, 5, count)
+        )
     
     def _update_particles(self):
         """Update and draw all particles"""
-        for particle in self.particles[:]:
-            # Update position
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            
-            # Update rotation
-            particle['rotation'] += particle['rotation_speed']
-            
-            # Update alpha (fade out)
-            particle['alpha'] -= particle['fade_speed'] * 255
-            
-            # Remove faded particles
-            if particle['alpha'] <= 0:
-                self.particles.remove(particle)
-                continue
-            
-            # Draw particle
-            particle_surface = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-            
-            # Set color with current alpha
-            color = list(particle['color']) + [int(particle['alpha'])]
-            
-            # Draw a small square
-            pygame.draw.rect(
-                particle_surface, 
-                color, 
-                (0, 0, particle['size'], particle['size'])
-            )
-            
-            # Rotate the particle
-            rotated_particle = pygame.transform.rotate(particle_surface, particle['rotation'])
-            
-            # Draw the particle
-            self.screen.blit(
-                rotated_particle, 
-                (particle['x'] - rotated_particle.get_width() // 2, 
-                 particle['y'] - rotated_particle.get_height() // 2)
-            )
+        # Move, turn and fade; faded particles are removed
+        self.particles.update()
+        self.particles.draw(self.screen)
     
     def apply_affect(self, target):
         """Apply the card discard effect to the target"""
@@ -198,5 +166,5 @@ class ThanosSnap(SpellBase):
         for _ in range(deck_discard):
             if target.deck.cards_in_deck:
                 # Remove a random card from deck
-                card_index = random.randint(0, len(target.deck.cards_in_deck) - 1)
+                card_index = self.rng.randint(0, len(target.deck.cards_in_deck) - 1)
                 target.deck.cards_in_deck.pop(card_index)
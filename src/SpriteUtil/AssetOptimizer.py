@@ -0,0 +1,179 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+import pygame
+from SpriteUtil.AtlasPacker import AtlasPacker
+
+
+class AssetOptimizer:
+    """
+    Offline optimizer that shrinks oversized sheets to what the game draws.
+
+    The display table lists, for each optimized sheet, every frame the code
+    cuts from it and the size that frame is drawn at, read from the class
+    attributes of the code that draws it. Each frame is pre-scaled to its
+    display size when that shrinks both axes (frames drawn larger stay at
+    source resolution, so the runtime scale is unchanged), its transparent
+    border is trimmed, and the trimmed frames are shelf-packed into a small
+    sheet. The sheets are written under Assets/Optimized/ with a manifest
+    that OptimizedAssets reads at runtime. SpriteUtil prefers the optimized
+    sheet, pads each frame back to its full size, and falls back to the
+    original sheet for any frame not in the table.
+
+    Pre-scaling uses the same transform the game applies, so optimized
+    frames are pixel-identical to the original draw.
+
+    Run from src/ with:
+        python -m SpriteUtil.AssetOptimizer
+    """
+
+    OUTPUT_DIR = "Assets/Optimized"
+    MANIFEST_NAME = "manifest.json"
+    MANIFEST_VERSION = 1
+
+    def __init__(self, repo_root=None, padding=2):
+        if repo_root is None:
+            dir_path = os.path.dirname(os.path.realpath(__file__))
+            repo_root = os.path.dirname(os.path.dirname(dir_path))
+        self.repo_root = repo_root
+        self.padding = padding
+
+    @staticmethod
+    def display_table():
+        """Every optimized sheet with its frames and their largest draw size
+
+        Returns:
+            dict: sheet path -> {frame rect: (width, height)}
+        """
+        from Spells.Barrier import Barrier
+        from Effects.StatusOverlays import StatusOverlays
+        from Utils.HealthBar import HealthBar
+        from Spells.ThanosSnap import ThanosSnap
+        from TurnIndicator import TurnIndicator
+
+        uses = [
+            ("./Assets/Cards/Shield.png", Barrier.animation_frames, Barrier.SHIELD_SIZE),
+            (StatusOverlays.SHIELD_SPRITE_PATH, [StatusOverlays.SHIELD_FRAME], StatusOverlays.SHIELD_SIZE),
+            (HealthBar.SPRITE_HEALTH_BACKGROUND_PATH, [HealthBar.HEALTH_BAR_BACKGROUND_DIMENSION],
+             HealthBar.HEALTH_BAR_BACKGROUND_SIZE),
+            ("./Assets/Cards/thanos_snap_sheet.png", ThanosSnap.animation_frames, ThanosSnap.SNAP_SIZE),
+            ("./Assets/turn_indicator.png", TurnIndicator.animation_frames, TurnIndicator.INDICATOR_SIZE),
+        ]
+        table = {}
+        for sheet_path, frames, size in uses:
+            sheet = table.setdefault(os.path.normpath(sheet_path).replace(os.sep, '/'), {})
+            for frame in frames:
+                rect = tuple(int(value) for value in frame[:4])
+                previous = sheet.get(rect, (0, 0))
+                sheet[rect] = (max(previous[0], size[0]), max(previous[1], size[1]))
+        return table
+
+    @staticmethod
+    def cut_frame(sheet, rect):
+        """Cut a frame the way SpriteUtil does, padding rects that leave the sheet"""
+        rect = pygame.Rect(rect)
+        if sheet.get_rect().contains(rect):
+            return sheet.subsurface(rect)
+        image = pygame.Surface(rect.size, pygame.SRCALPHA)
+        image.blit(sheet, (0, 0), rect)
+        return image
+
+    def optimize_sheet(self, sheet_name, frames):
+        """Pre-scale, trim and pack the frames of one sheet
+
+        Returns:
+            tuple: (optimized surface, list of frame entries)
+        """
+        source_path = os.path.join(self.repo_root, sheet_name)
+        sheet = pygame.image.load(source_path).convert_alpha()
+
+        trimmed = {}
+        entries = []
+        for rect, display_size in sorted(frames.items()):
+            frame = self.cut_frame(sheet, rect)
+            if display_size[0] <= rect[2] and display_size[1] <= rect[3]:
+                frame = pygame.transform.scale(frame, display_size)
+            bounds = frame.get_bounding_rect(min_alpha=1)
+            if bounds.width == 0 or bounds.height == 0:
+                bounds = pygame.Rect(0, 0, 1, 1)
+            trimmed[rect] = frame.subsurface(bounds).copy()
+            entries.append({
+                'source_rect': list(rect),
+                'size': list(frame.get_size()),
+                'offset': [bounds.x, bounds.y]
+            })
+
+        packer = AtlasPacker(page_size=max(sheet.get_size()), padding=self.padding, repo_root=self.repo_root)
+        placements, page_sizes = packer.pack({rect: image.get_size() for rect, image in trimmed.items()})
+        if len(page_sizes) != 1:
+            raise ValueError(f"{sheet_name} frames do not fit on one sheet")
+
+        optimized = pygame.Surface(page_sizes[0], pygame.SRCALPHA, 32)
+        optimized.fill((0, 0, 0, 0))
+        for entry in entries:
+            rect = tuple(entry['source_rect'])
+            _, x, y = placements[rect]
+            optimized.blit(trimmed[rect], (x, y))
+            entry['rect'] = [x, y, trimmed[rect].get_width(), trimmed[rect].get_height()]
+        return optimized, entries
+
+    def build(self):
+        """Optimize every sheet in the display table and write the manifest
+
+        Returns:
+            dict: The manifest that was written
+        """
+        output_dir = os.path.join(self.repo_root, self.OUTPUT_DIR)
+        sheets = {}
+        for sheet_name, frames in sorted(self.display_table().items()):
+            source_path = os.path.join(self.repo_root, sheet_name)
+            optimized, entries = self.optimize_sheet(sheet_name, frames)
+
+            file_name = os.path.relpath(sheet_name, 'Assets').replace(os.sep, '/')
+            output_path = os.path.join(output_dir, file_name)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            pygame.image.save(optimized, output_path)
+
+            stat = os.stat(source_path)
+            with open(source_path, 'rb') as source_file:
+                digest = hashlib.sha1(source_file.read()).hexdigest()
+            sheets[sheet_name] = {
+                'file': file_name,
+                'source_size': stat.st_size,
+                'source_mtime_ns': stat.st_mtime_ns,
+                'source_sha1': digest,
+                'frames': entries
+            }
+
+        manifest = {
+            'version': self.MANIFEST_VERSION,
+            'sheets': sheets
+        }
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, self.MANIFEST_NAME), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shrink oversized sheets to the sizes the game draws them at")
+    parser.add_argument('--padding', type=int, default=2, help="Transparent pixels between frames")
+    args = parser.parse_args()
+
+    # A hidden window gives the display's real pixel format
+    pygame.display.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    start = time.perf_counter()
+    optimizer = AssetOptimizer(padding=args.padding)
+    manifest = optimizer.build()
+    elapsed = time.perf_counter() - start
+
+    for sheet_name, sheet in manifest['sheets'].items():
+        source = pygame.image.load(os.path.join(optimizer.repo_root, sheet_name))
+        optimized = pygame.image.load(os.path.join(optimizer.repo_root, optimizer.OUTPUT_DIR, sheet['file']))
+        print(f"{sheet_name}: {source.get_width()}x{source.get_height()} -> "
+              f"{optimized.get_width()}x{optimized.get_height()} ({len(sheet['frames'])} frames)")
+    print(f"Optimized {len(manifest['sheets'])} sheets ({elapsed:.2f}s)")
@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+import pygame
+from SpriteUtil.RawAssetCache import RawAssetCache
+from SpriteUtil.SurfaceFormat import SurfaceFormat
+
+
+class AtlasManifest:
+    """
+    Runtime side of the texture atlas built by AtlasPacker.
+
+    Reads Assets/Atlas/manifest.json once and resolves sheet paths to a
+    region of an atlas page. Pages are decoded on first use and shared by
+    every sheet packed on them, converted once to the display format with
+    SurfaceFormat like sheets loaded from their own files. Paths are matched relative to the
+    repository root, first exactly and then ignoring case, and a region is
+    only used while its source file still has the size and modification
+    time recorded at packing. Without a manifest every lookup misses and
+    sheets load from their own files.
+    """
+
+    MANIFEST_PATH = "Assets/Atlas/manifest.json"
+    SUPPORTED_VERSION = 1
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, manifest_path=None):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        self.repo_root = os.path.dirname(os.path.dirname(dir_path))
+        if manifest_path is None:
+            manifest_path = os.path.join(self.repo_root, self.MANIFEST_PATH)
+        self.manifest_path = manifest_path
+        self.pages = []
+        self.regions = {}
+        self._regions_by_lower = {}
+        self._page_surfaces = {}  # page index -> decoded surface
+        self.load()
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared manifest, loading it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def load(self):
+        """(Re)read the manifest, leaving it empty if it is missing or unsupported"""
+        self.pages = []
+        self.regions = {}
+        self._page_surfaces = {}
+        try:
+            with open(self.manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            manifest = None
+        if manifest and manifest.get('version') == self.SUPPORTED_VERSION:
+            self.pages = manifest['pages']
+            self.regions = manifest['regions']
+        self._regions_by_lower = {name.lower(): name for name in self.regions}
+
+    def is_loaded(self):
+        return bool(self.regions)
+
+    def lookup(self, sheet_path):
+        """Return (page index, rect) for an absolute sheet path, or None"""
+        if not self.regions:
+            return None
+        name = os.path.relpath(sheet_path, self.repo_root).replace(os.sep, '/')
+        region = self.regions.get(name)
+        if region is None:
+            name = self._regions_by_lower.get(name.lower())
+            if name is None:
+                return None
+            region = self.regions[name]
+        try:
+            stat = os.stat(os.path.join(self.repo_root, name))
+        except OSError:
+            return None
+        if stat.st_size != region['source_size'] or stat.st_mtime_ns != region['source_mtime_ns']:
+            return None
+        return region['page'], pygame.Rect(region['rect'])
+
+    def load_sheet(self, sheet_path):
+        """Return the sheet as a subsurface of its atlas page, or None if it is not packed"""
+        found = self.lookup(sheet_path)
+        if found is None:
+            return None
+        page_index, rect = found
+        page = self._page_surfaces.get(page_index)
+        if page is None:
+            page_path = os.path.join(os.path.dirname(self.manifest_path), self.pages[page_index]['file'])
+            try:
+                page = SurfaceFormat.get_instance().normalize(RawAssetCache.get_instance().load(page_path))
+            except (pygame.error, OSError):
+                return None
+            self._page_surfaces[page_index] = page
+        return page.subsurface(rect)
+
+    def release_pages(self):
+        """Drop the manifest's references to decoded pages
+
+        Pages stay alive while any sheet cut from them is still referenced.
+        """
+        self._page_surfaces.clear()
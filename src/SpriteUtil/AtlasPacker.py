@@ -0,0 +1,185 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+import pygame
+
+
+class AtlasPacker:
+    """
+    Offline packer that bin-packs the game's PNGs into a few atlas pages.
+
+    Every PNG under the source folders is placed on a page with a shelf
+    packer (tallest images first), identical files share one region, and
+    the pages are written next to a JSON manifest mapping each source path,
+    relative to the repository root, to its page and rect. SpriteUtil reads
+    the manifest through AtlasManifest and serves sheets as subsurfaces of
+    the pages, falling back to the loose file for anything not packed.
+
+    Decoding cost follows pixel count, not file count, so sheets with a
+    side longer than max_region stay loose: packing them would only make
+    every page that holds one expensive to decode. Rebuild the atlas after
+    changing an asset; regions whose source file changed size or
+    modification time are ignored at runtime.
+
+    Run from src/ with:
+        python -m SpriteUtil.AtlasPacker [--page-size N] [--max-region N] [--padding N] [roots ...]
+    """
+
+    DEFAULT_ROOTS = ("Assets/Cards", "Assets/Health")
+    OUTPUT_DIR = "Assets/Atlas"
+    MANIFEST_NAME = "manifest.json"
+    MANIFEST_VERSION = 1
+
+    def __init__(self, roots=DEFAULT_ROOTS, page_size=2048, max_region=1024, padding=2, repo_root=None):
+        if repo_root is None:
+            dir_path = os.path.dirname(os.path.realpath(__file__))
+            repo_root = os.path.dirname(os.path.dirname(dir_path))
+        self.repo_root = repo_root
+        self.roots = roots
+        self.page_size = page_size
+        self.max_region = min(max_region, page_size)
+        self.padding = padding
+
+    def collect(self):
+        """Return the relative paths of every PNG under the source folders
+
+        Symlinks are skipped so case-alias links do not pack an image twice.
+        """
+        sources = []
+        for root in self.roots:
+            for dir_path, dir_names, file_names in os.walk(os.path.join(self.repo_root, root)):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    path = os.path.join(dir_path, file_name)
+                    if file_name.lower().endswith('.png') and not os.path.islink(path):
+                        sources.append(os.path.relpath(path, self.repo_root).replace(os.sep, '/'))
+        return sources
+
+    def pack(self, sizes):
+        """Place rects on pages with a shelf packer
+
+        Args:
+            sizes: dict of name -> (width, height)
+
+        Returns:
+            tuple: (placements, page sizes) where placements maps each name to
+                   (page index, x, y) and page sizes are trimmed to their content
+        """
+        placements = {}
+        pages = []  # [used width, used height, shelf y, shelf height, cursor x]
+        order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+        for name in order:
+            width, height = sizes[name]
+            padded_width = width + self.padding
+            padded_height = height + self.padding
+
+            for index, page in enumerate(pages):
+                used_width, used_height, shelf_y, shelf_height, cursor_x = page
+                if cursor_x + width <= self.page_size and shelf_y + height <= self.page_size:
+                    x, y = cursor_x, shelf_y
+                elif shelf_y + shelf_height + height <= self.page_size:
+                    # Open a new shelf under the current one
+                    shelf_y += shelf_height
+                    shelf_height = 0
+                    x, y = 0, shelf_y
+                else:
+                    continue
+                placements[name] = (index, x, y)
+                page[:] = [max(used_width, x + width), max(used_height, y + height),
+                           shelf_y, max(shelf_height, padded_height), x + padded_width]
+                break
+            else:
+                placements[name] = (len(pages), 0, 0)
+                pages.append([width, height, 0, padded_height, padded_width])
+        return placements, [(page[0], page[1]) for page in pages]
+
+    def build(self):
+        """Pack every source PNG and write the atlas pages and manifest
+
+        Returns:
+            dict: The manifest that was written
+        """
+        sources = []
+
+        # Identical files share one region
+        images = {}   # content digest -> surface
+        aliases = {}  # source path -> content digest
+        for source in self.collect():
+            path = os.path.join(self.repo_root, source)
+            with open(path, 'rb') as image_file:
+                digest = hashlib.sha1(image_file.read()).hexdigest()
+            if digest not in images:
+                image = pygame.image.load(path)
+                if image.get_width() > self.max_region or image.get_height() > self.max_region:
+                    continue
+                images[digest] = image
+            sources.append(source)
+            aliases[source] = digest
+
+        sizes = {digest: image.get_size() for digest, image in images.items()}
+        placements, page_sizes = self.pack(sizes)
+
+        output_dir = os.path.join(self.repo_root, self.OUTPUT_DIR)
+        os.makedirs(output_dir, exist_ok=True)
+        for stale in os.listdir(output_dir):
+            if stale.startswith('atlas_') and stale.endswith('.png'):
+                os.remove(os.path.join(output_dir, stale))
+
+        pages = []
+        for index, size in enumerate(page_sizes):
+            page = pygame.Surface(size, pygame.SRCALPHA, 32)
+            page.fill((0, 0, 0, 0))
+            for digest, (page_index, x, y) in placements.items():
+                if page_index == index:
+                    page.blit(images[digest], (x, y))
+            file_name = f'atlas_{index}.png'
+            pygame.image.save(page, os.path.join(output_dir, file_name))
+            pages.append({'file': file_name, 'size': list(size)})
+
+        regions = {}
+        for source in sources:
+            digest = aliases[source]
+            page_index, x, y = placements[digest]
+            width, height = sizes[digest]
+            stat = os.stat(os.path.join(self.repo_root, source))
+            regions[source] = {
+                'page': page_index,
+                'rect': [x, y, width, height],
+                'source_size': stat.st_size,
+                'source_mtime_ns': stat.st_mtime_ns
+            }
+
+        manifest = {
+            'version': self.MANIFEST_VERSION,
+            'padding': self.padding,
+            'pages': pages,
+            'regions': regions
+        }
+        with open(os.path.join(output_dir, self.MANIFEST_NAME), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack the game's PNGs into atlas pages with a JSON manifest")
+    parser.add_argument('roots', nargs='*', default=list(AtlasPacker.DEFAULT_ROOTS),
+                        help="Folders to pack, relative to the repository root")
+    parser.add_argument('--page-size', type=int, default=2048, help="Maximum page width and height")
+    parser.add_argument('--max-region', type=int, default=1024,
+                        help="Images with a longer side stay loose files")
+    parser.add_argument('--padding', type=int, default=2, help="Transparent pixels between regions")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = AtlasPacker(args.roots, args.page_size, args.max_region, args.padding).build()
+    elapsed = time.perf_counter() - start
+
+    packed_area = sum(region['rect'][2] * region['rect'][3] for region in
+                      {tuple(region['rect']) + (region['page'],): region for region in manifest['regions'].values()}.values())
+    page_area = sum(page['size'][0] * page['size'][1] for page in manifest['pages'])
+    print(f"Packed {len(manifest['regions'])} images into {len(manifest['pages'])} pages "
+          f"({packed_area / page_area:.0%} occupancy, {elapsed:.2f}s)")
+    for page in manifest['pages']:
+        print(f"  {page['file']}: {page['size'][0]}x{page['size'][1]}")
@@ -0,0 +1,83 @@
+import hashlib
+import json
+import os
+import threading
+import pygame
+
+
+class OptimizedAssets:
+    """
+    Runtime side of the optimized sheets written by AssetOptimizer.
+
+    Reads Assets/Optimized/manifest.json once and tells SpriteUtil which
+    sheets have an optimized replacement and where each declared frame sits
+    in it. A replacement is only used while its source sheet is unchanged:
+    the source's mtime and size are checked first, and its SHA-1 when the
+    mtime differs. Without a manifest every lookup misses and sheets load
+    from their own files.
+    """
+
+    MANIFEST_PATH = "Assets/Optimized/manifest.json"
+    SUPPORTED_VERSION = 1
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, manifest_path=None):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        self.repo_root = os.path.dirname(os.path.dirname(dir_path))
+        if manifest_path is None:
+            manifest_path = os.path.join(self.repo_root, self.MANIFEST_PATH)
+        self.manifest_path = manifest_path
+        self.sheets = {}
+        self.load()
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared manifest, loading it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def load(self):
+        """(Re)read the manifest, leaving it empty if it is missing or unsupported"""
+        self.sheets = {}
+        try:
+            with open(self.manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            manifest = None
+        if manifest and manifest.get('version') == self.SUPPORTED_VERSION:
+            self.sheets = manifest['sheets']
+
+    def lookup(self, sheet_path):
+        """Return the optimized replacement of an absolute sheet path
+
+        Returns:
+            tuple: (optimized file path, {source rect: (rect, size, offset)}),
+                   or None when the sheet has no valid replacement
+        """
+        if not self.sheets:
+            return None
+        name = os.path.relpath(sheet_path, self.repo_root).replace(os.sep, '/')
+        sheet = self.sheets.get(name)
+        if sheet is None:
+            return None
+        try:
+            stat = os.stat(sheet_path)
+            if stat.st_size != sheet['source_size']:
+                return None
+            if stat.st_mtime_ns != sheet['source_mtime_ns']:
+                with open(sheet_path, 'rb') as source_file:
+                    if hashlib.sha1(source_file.read()).hexdigest() != sheet['source_sha1']:
+                        return None
+        except OSError:
+            return None
+        frames = {
+            tuple(frame['source_rect']): (pygame.Rect(frame['rect']), tuple(frame['size']), tuple(frame['offset']))
+            for frame in sheet['frames']
+        }
+        optimized_path = os.path.join(os.path.dirname(self.manifest_path), sheet['file'])
+        return optimized_path, frames
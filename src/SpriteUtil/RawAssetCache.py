@@ -0,0 +1,210 @@
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import pygame
+
+
+class RawAssetCache:
+    """
+    On-disk cache of decoded sprite sheets, loaded by memory mapping.
+
+    Each sheet is stored once as raw 32-bit pixels behind a 64-byte header
+    (magic, channel order, size, and the source's mtime, byte size and SHA-1).
+    Loading maps the file copy-on-write and wraps it with
+    pygame.image.frombuffer, so a warm start neither inflates the PNG nor
+    copies the pixels. Pixels are stored in the channel order convert_alpha()
+    produces for the display, which lets the mapped surface be used as is;
+    a cache written for another pixel format is converted once on load.
+
+    A cache file is trusted while the source's mtime and size match the
+    header. When they differ the source is hashed, and a matching hash only
+    refreshes the header, while a different one rebuilds the file. Files are
+    built on first load, or for every asset with:
+        python -m SpriteUtil.RawAssetCache [roots ...]
+
+    Set DND_RAW_ASSET_CACHE=0 to load every sheet straight from its PNG.
+    """
+
+    ENV_VAR = 'DND_RAW_ASSET_CACHE'
+    CACHE_DIR = "Assets/.rawcache"
+    MAGIC = b'DNDRAW1\0'
+    HEADER = struct.Struct('<8s4sIIQQ20s')
+    HEADER_SIZE = 64
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, cache_dir=None, enabled=None):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        self.repo_root = os.path.dirname(os.path.dirname(dir_path))
+        self.cache_dir = cache_dir if cache_dir is not None else os.path.join(self.repo_root, self.CACHE_DIR)
+        if enabled is None:
+            enabled = os.environ.get(self.ENV_VAR, '1') != '0'
+        self.enabled = enabled
+        self._layout = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.refreshed = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def native_layout(self):
+        """Channel order, as a pygame byte string format, of convert_alpha() surfaces"""
+        if self._layout is None:
+            masks = pygame.Surface((1, 1), pygame.SRCALPHA, 32).convert_alpha().get_masks()
+            shifts = [mask.bit_length() - 8 for mask in masks]
+            if sorted(shifts) != [0, 8, 16, 24]:
+                self._layout = 'RGBA'
+            else:
+                by_byte = sorted(zip(shifts, 'RGBA'))
+                if struct.pack('=I', 1)[0] != 1:
+                    by_byte.reverse()
+                self._layout = ''.join(channel for _, channel in by_byte)
+        return self._layout
+
+    def cache_path(self, source_path):
+        name = os.path.relpath(source_path, self.repo_root).replace(os.sep, '/')
+        return os.path.join(self.cache_dir, name.replace('/', '__') + '.raw')
+
+    @staticmethod
+    def source_digest(source_path):
+        with open(source_path, 'rb') as source_file:
+            return hashlib.sha1(source_file.read()).digest()
+
+    def load(self, source_path):
+        """Return the decoded sheet for an image file
+
+        Serves the raw cache when it is valid and (re)builds it otherwise.
+        The returned surface is in the display's pixel format.
+        """
+        if not self.enabled:
+            return pygame.image.load(source_path).convert_alpha()
+        surface = self._map(source_path)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        return self.build(source_path)
+
+    def build(self, source_path):
+        """Decode an image and write its cache file
+
+        Returns:
+            pygame.Surface: The decoded sheet
+        """
+        surface = pygame.image.load(source_path).convert_alpha()
+        layout = self.native_layout()
+        stat = os.stat(source_path)
+        width, height = surface.get_size()
+        header = self.HEADER.pack(self.MAGIC, layout.encode('ascii'), width, height,
+                                  stat.st_mtime_ns, stat.st_size, self.source_digest(source_path))
+        cache_path = self.cache_path(source_path)
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(header.ljust(self.HEADER_SIZE, b'\0'))
+                cache_file.write(pygame.image.tobytes(surface, layout))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # The cache is an optimisation; a read-only checkout still runs
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return surface
+
+    def _map(self, source_path):
+        """Map a valid cache file as a surface, or return None"""
+        cache_path = self.cache_path(source_path)
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                header = cache_file.read(self.HEADER_SIZE)
+                if len(header) < self.HEADER_SIZE:
+                    return None
+                magic, layout, width, height, mtime_ns, size, digest = self.HEADER.unpack_from(header)
+                if magic != self.MAGIC:
+                    return None
+                if os.fstat(cache_file.fileno()).st_size != self.HEADER_SIZE + width * height * 4:
+                    return None
+                stat = os.stat(source_path)
+                if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                    if stat.st_size != size or self.source_digest(source_path) != digest:
+                        return None
+                    self._refresh_header(cache_path, header, stat.st_mtime_ns)
+                mapping = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError, struct.error):
+            return None
+
+        layout = layout.decode('ascii')
+        surface = pygame.image.frombuffer(memoryview(mapping)[self.HEADER_SIZE:], (width, height), layout)
+        if layout != self.native_layout():
+            surface = surface.convert_alpha()
+        return surface
+
+    def _refresh_header(self, cache_path, header, mtime_ns):
+        """Record a new source mtime after the content was found unchanged"""
+        magic, layout, width, height, _, size, digest = self.HEADER.unpack_from(header)
+        try:
+            with open(cache_path, 'r+b') as cache_file:
+                cache_file.write(self.HEADER.pack(magic, layout, width, height, mtime_ns, size, digest))
+            self.refreshed += 1
+        except OSError:
+            pass
+
+    def build_all(self, roots=("Assets",)):
+        """Build or refresh the cache for every PNG under the given folders
+
+        Returns:
+            int: Number of cache files written
+        """
+        built = 0
+        for root in roots:
+            for dir_path, dir_names, file_names in os.walk(os.path.join(self.repo_root, root)):
+                dir_names[:] = sorted(name for name in dir_names
+                                      if os.path.join(dir_path, name) != os.path.normpath(self.cache_dir))
+                for file_name in sorted(file_names):
+                    path = os.path.join(dir_path, file_name)
+                    if not file_name.lower().endswith('.png') or os.path.islink(path):
+                        continue
+                    if self._map(path) is None:
+                        self.build(path)
+                        built += 1
+        return built
+
+    def stats(self):
+        """Return the cache counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshed': self.refreshed,
+            'enabled': self.enabled
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-decode the game's PNGs into the raw asset cache")
+    parser.add_argument('roots', nargs='*', default=["Assets"],
+                        help="Folders to cache, relative to the repository root")
+    args = parser.parse_args()
+
+    # A hidden window gives the display's real pixel format
+    pygame.display.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    start = time.perf_counter()
+    cache = RawAssetCache(enabled=True)
+    built = cache.build_all(args.roots)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {built} cache files to {cache.cache_dir} ({elapsed:.2f}s)")
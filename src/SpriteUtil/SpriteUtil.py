@@ -1,17 +1,112 @@
 import pygame
 import os
+import weakref
+from SpriteUtil.TransformCache import TransformCache
+from SpriteUtil.AtlasManifest import AtlasManifest
+from SpriteUtil.RawAssetCache import RawAssetCache
+from SpriteUtil.OptimizedAssets import OptimizedAssets
+from SpriteUtil.SurfaceFormat import SurfaceFormat
 class SpriteUtil:
+    # Process-wide sheet cache shared by every SpriteUtil, keyed by absolute path.
+    # Sheets are decoded once; instances only hold a reference to the shared surface.
+    _sheet_cache = {}
+    _sheet_refcounts = {}
+    # Extracted frames keyed by (sheet path, rect), shared read-only by every caller
+    _frame_cache = {}
+    # Frame layouts of sheets replaced by an optimized sheet, and the original
+    # sheets loaded for frames the optimizer did not declare
+    _frame_layouts = {}
+    _source_sheets = {}
+    _cache_hits = 0
+    _cache_misses = 0
+
     def __init__(self, sprite_path):
         self.SPRITE_PATH = sprite_path
+        self.sheet_path = self.resolve_path(sprite_path)
         self.sprite_sheet = self.load_sprite_sheet()
+        # Drop the reference automatically when this instance is garbage collected
+        self._finalizer = weakref.finalize(self, SpriteUtil._release_path, self.sheet_path)
 
-    def load_sprite_sheet(self):
+    @staticmethod
+    def resolve_path(sprite_path):
+        """Return the absolute path of an asset given relative to the repository root"""
         dir_path = os.path.dirname(os.path.realpath(__file__))
 
         # go up one level
         parent1 = os.path.dirname(dir_path)
         parent2 = os.path.dirname(parent1)
-        return pygame.image.load(os.path.join(parent2, self.SPRITE_PATH)).convert_alpha()
+        return os.path.normpath(os.path.join(parent2, sprite_path))
+
+    def load_sprite_sheet(self):
+        path = self.resolve_path(self.SPRITE_PATH)
+        sheet = SpriteUtil._sheet_cache.get(path)
+        if sheet is None:
+            SpriteUtil._cache_misses += 1
+            optimized = OptimizedAssets.get_instance().lookup(path)
+            if optimized is not None:
+                optimized_path, frame_layout = optimized
+                sheet = SurfaceFormat.get_instance().normalize(RawAssetCache.get_instance().load(optimized_path))
+                SpriteUtil._frame_layouts[path] = frame_layout
+            else:
+                # Packed sheets are cut from a shared atlas page instead of their own file
+                sheet = AtlasManifest.get_instance().load_sheet(path)
+            if sheet is None:
+                sheet = SurfaceFormat.get_instance().normalize(RawAssetCache.get_instance().load(path))
+            SpriteUtil._sheet_cache[path] = sheet
+        else:
+            SpriteUtil._cache_hits += 1
+        SpriteUtil._sheet_refcounts[path] = SpriteUtil._sheet_refcounts.get(path, 0) + 1
+        return sheet
+
+    def release(self):
+        """Release this instance's reference to its sheet"""
+        self._finalizer()
+
+    @staticmethod
+    def _release_path(path):
+        if SpriteUtil._sheet_refcounts.get(path, 0) > 0:
+            SpriteUtil._sheet_refcounts[path] -= 1
+
+    @classmethod
+    def purge_unused(cls):
+        """Unload every cached sheet that no SpriteUtil references any more
+
+        Returns:
+            int: Number of sheets unloaded
+        """
+        unused = [path for path, count in cls._sheet_refcounts.items() if count <= 0]
+        for path in unused:
+            cls._sheet_cache.pop(path, None)
+            del cls._sheet_refcounts[path]
+        if unused:
+            unused = set(unused)
+            for key in [key for key in cls._frame_cache if key[0] in unused]:
+                del cls._frame_cache[key]
+            for path in unused:
+                cls._frame_layouts.pop(path, None)
+                cls._source_sheets.pop(path, None)
+            TransformCache.get_instance().forget_sheets(unused)
+            if not cls._sheet_cache:
+                AtlasManifest.get_instance().release_pages()
+        return len(unused)
+
+    @classmethod
+    def get_cache_stats(cls):
+        """Return sheet cache counters
+
+        Returns:
+            dict: hits, misses, number of resident sheets, live references and
+                  the bytes of pixel data resident in the cache
+        """
+        bytes_resident = sum(sheet.get_width() * sheet.get_height() * sheet.get_bytesize() for sheet in cls._sheet_cache.values())
+        return {
+            'hits': cls._cache_hits,
+            'misses': cls._cache_misses,
+            'sheets': len(cls._sheet_cache),
+            'references': sum(cls._sheet_refcounts.values()),
+            'frames': len(cls._frame_cache),
+            'bytes_resident': bytes_resident
+        }
 
     def draw_sprite_image_at(self, sprite_image, position = None):    
         if position is None:
@@ -19,6 +114,58 @@ class SpriteUtil:
         return sprite_image.get_rect(center=position)
 
     def get_sprite(self, sprite_rect):
+        """Return the frame at sprite_rect
+
+        Frames are cut once and cached per sheet and rect. Rects that lie
+        inside the sheet are served as subsurfaces that share the sheet's
+        pixels; rects that reach outside it are pre-cut onto a transparent
+        surface of the full rect size. The returned surface is shared, so
+        copy it before modifying it in place.
+        """
+        try:
+            key = (self.sheet_path, tuple(int(value) for value in sprite_rect[:4]))
+        except Exception as e:
+            return None
+        frame = SpriteUtil._frame_cache.get(key)
+        if frame is None:
+            frame = self._cut_frame(key[1])
+            if frame is not None:
+                SpriteUtil._frame_cache[key] = frame
+        return frame
+
+    def get_transformed(self, sprite_rect, size=None, angle=0, flip=(False, False)):
+        """Return the frame at sprite_rect scaled to size, flipped and rotated
+
+        Variants are computed once and shared through the TransformCache.
+        """
+        return TransformCache.get_instance().get(self, sprite_rect, size, angle, flip)
+
+    def _cut_frame(self, sprite_rect):
+        frame_layout = SpriteUtil._frame_layouts.get(self.sheet_path)
+        if frame_layout is not None:
+            return self._cut_optimized_frame(frame_layout, sprite_rect)
+        return self._cut_from(self.sprite_sheet, sprite_rect)
+
+    def _cut_optimized_frame(self, frame_layout, sprite_rect):
+        """Rebuild a frame from an optimized sheet at its pre-scaled size"""
+        entry = frame_layout.get(tuple(sprite_rect))
+        if entry is None:
+            # Not declared to the optimizer, cut it from the original sheet
+            source_sheet = SpriteUtil._source_sheets.get(self.sheet_path)
+            if source_sheet is None:
+                source_sheet = SurfaceFormat.get_instance().normalize(RawAssetCache.get_instance().load(self.sheet_path))
+                SpriteUtil._source_sheets[self.sheet_path] = source_sheet
+            return self._cut_from(source_sheet, sprite_rect)
+        rect, size, offset = entry
+        if offset == (0, 0) and rect.size == size:
+            return self.sprite_sheet.subsurface(rect)
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.blit(self.sprite_sheet, offset, rect)
+        # Frames are cached, so the padded copy is converted once like its sheet
+        return SurfaceFormat.get_instance().normalize(image)
+
+    @staticmethod
+    def _cut_from(sprite_sheet, sprite_rect):
         try:
             rect = pygame.Rect(
                 pygame.Rect(
@@ -26,8 +173,26 @@ class SpriteUtil:
                     sprite_rect[1], 
                     sprite_rect[2], 
                     sprite_rect[3]))    
+            if sprite_sheet.get_rect().contains(rect):
+                return sprite_sheet.subsurface(rect)
             image = pygame.Surface(rect.size, pygame.SRCALPHA)
-            image.blit(self.sprite_sheet, (0, 0), rect)        
+            image.blit(sprite_sheet, (0, 0), rect)        
             return image
         except Exception as e:
-            return None
\ No newline at end of file
+            return None
+
+    def pre_slice(self, coords):
+        """Cut every frame of a coordinate table ahead of rendering
+
+        Args:
+            coords: A single rect, a list of rects, or a dict of lists of rects
+                    such as a class-level animation table
+        """
+        if isinstance(coords, dict):
+            for frames in coords.values():
+                self.pre_slice(frames)
+        elif len(coords) == 4 and all(isinstance(value, (int, float)) for value in coords):
+            self.get_sprite(coords)
+        else:
+            for frame in coords:
+                self.pre_slice(frame)
\ No newline at end of file
@@ -0,0 +1,163 @@
+import os
+import threading
+import warnings
+import pygame
+
+
+class SurfaceFormat:
+    """
+    Converts loaded images to the display's pixel format.
+
+    Blitting a surface whose format differs from the screen converts every
+    pixel on every blit, and blending per-pixel alpha costs more than a
+    plain or colorkeyed copy. Once the display exists, normalize() inspects
+    the alpha channel of each loaded image and picks the cheapest format
+    that draws the same pixels:
+        opaque   - every pixel fully opaque, converted without alpha
+        colorkey - every pixel fully opaque or fully transparent, converted
+                   without alpha and keyed on a color the image does not
+                   use, with RLE acceleration
+        alpha    - partially transparent pixels, converted with
+                   per-pixel alpha
+    Surfaces already in the right format are returned as they are, so
+    memory-mapped sheets are not copied.
+
+    Set DND_SURFACE_CHECK=1 to warn about every non-native surface blitted
+    onto the screen in the main loop.
+    """
+
+    OPAQUE = 'opaque'
+    COLORKEY = 'colorkey'
+    ALPHA = 'alpha'
+
+    CHECK_ENV_VAR = 'DND_SURFACE_CHECK'
+    # Key colors tried in order; the first one the image does not use wins
+    COLORKEYS = ((255, 0, 255), (0, 255, 255), (1, 254, 1))
+    # Rows and columns skipped by the sparse pass over the alpha channel
+    SAMPLE_STRIDE = 8
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, check=None):
+        if check is None:
+            check = os.environ.get(self.CHECK_ENV_VAR, '0') == '1'
+        self.check_enabled = check
+
+        # Counters
+        self.normalized = {self.OPAQUE: 0, self.COLORKEY: 0, self.ALPHA: 0}
+        self.non_native_blits = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared normalizer, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def classify(cls, surface):
+        """Return OPAQUE, COLORKEY or ALPHA for the alpha channel of a surface"""
+        if not surface.get_flags() & pygame.SRCALPHA:
+            return cls.COLORKEY if surface.get_colorkey() is not None else cls.OPAQUE
+        if surface.get_bitsize() != 32:
+            surface = surface.convert_alpha()
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        try:
+            # Most alpha sheets show a partial value in the sparse pass already
+            sample = alpha[::cls.SAMPLE_STRIDE, ::cls.SAMPLE_STRIDE]
+            if cls._has_partial(sample) or cls._has_partial(alpha):
+                return cls.ALPHA
+            return cls.OPAQUE if alpha.min() == 255 else cls.COLORKEY
+        finally:
+            # Release the pixel array so the surface unlocks
+            del alpha
+
+    @staticmethod
+    def _has_partial(alpha):
+        # Subtracting one wraps 0 to 255 and 255 to 254, leaving 1..254 below 254
+        return bool(((alpha - 1) < 254).any())
+
+    @staticmethod
+    def is_native(surface, reference=None):
+        """Whether a surface blits onto the reference (the display) without conversion"""
+        if reference is None:
+            reference = pygame.display.get_surface()
+        if reference is None:
+            return True
+        return (surface.get_bytesize() == reference.get_bytesize()
+                and surface.get_masks()[:3] == reference.get_masks()[:3])
+
+    def normalize(self, surface, kind=None):
+        """Return a surface in the display's format that draws the same pixels
+
+        Args:
+            surface: Loaded image
+            kind: OPAQUE, COLORKEY or ALPHA, or None to inspect the alpha channel
+
+        Returns:
+            pygame.Surface: The surface itself when it is already native
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if kind is None:
+            kind = self.classify(surface)
+        if kind == self.COLORKEY and surface.get_flags() & pygame.SRCALPHA:
+            keyed = self._colorkeyed(surface)
+            if keyed is None:
+                kind = self.ALPHA
+            else:
+                surface = keyed
+        self.normalized[kind] += 1
+
+        has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        if kind == self.ALPHA:
+            return surface if has_alpha and self.is_native(surface) else surface.convert_alpha()
+        # Opaque and keyed surfaces (convert keeps the colorkey) drop per-pixel alpha
+        return surface if not has_alpha and self.is_native(surface) else surface.convert()
+
+    def _colorkeyed(self, surface):
+        """Copy a binary-alpha surface onto a key color, or None if every key is used"""
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        transparent = int((alpha == 0).sum())
+        del alpha
+        display = pygame.display.get_surface()
+        for key in self.COLORKEYS:
+            keyed = pygame.Surface(surface.get_size(), 0, display)
+            keyed.fill(key)
+            keyed.blit(surface, (0, 0))
+            # Opaque pixels that happen to be the key color would vanish
+            if self._count_color(keyed, key) == transparent:
+                keyed.set_colorkey(key, pygame.RLEACCEL)
+                return keyed
+        return None
+
+    @staticmethod
+    def _count_color(surface, color):
+        if surface.get_bytesize() != 4:
+            return pygame.mask.from_threshold(surface, color, (1, 1, 1, 255)).count()
+        pixels = pygame.surfarray.pixels2d(surface)
+        count = int((pixels == surface.map_rgb(color)).sum())
+        del pixels
+        return count
+
+    def check_blit(self, source, target):
+        """Warn when a non-native surface is blitted onto the target"""
+        if self.is_native(source, target):
+            return
+        self.non_native_blits += 1
+        warnings.warn(f"Blitting a non-native {source.get_width()}x{source.get_height()} "
+                      f"{source.get_bitsize()}-bit surface; normalize it with SurfaceFormat when it is loaded",
+                      stacklevel=3)
+
+    def stats(self):
+        """Return how many surfaces were normalized to each format"""
+        return {
+            'opaque': self.normalized[self.OPAQUE],
+            'colorkey': self.normalized[self.COLORKEY],
+            'alpha': self.normalized[self.ALPHA],
+            'non_native_blits': self.non_native_blits,
+            'check_enabled': self.check_enabled
+        }
@@ -0,0 +1,139 @@
+import threading
+from collections import OrderedDict
+import pygame
+
+
+class TransformCache:
+    """
+    Shared cache of scaled, flipped and rotated sprite frames.
+
+    Spells draw the same few frames at the same size and orientation on
+    every tick, so each variant is computed once from the frame cache and
+    stored under (sheet path, rect, size, angle, flip). The cache is bounded
+    by the bytes of pixel data it holds and evicts the least recently used
+    variant first.
+
+    Transforms are applied in a fixed order: scale, then flip, then rotate.
+    The returned surfaces are shared, so copy them before modifying them in
+    place.
+    """
+
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._variants = OrderedDict()  # variant key -> surface
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared transform cache, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, sprite, sprite_rect, size=None, angle=0, flip=(False, False)):
+        """Return a frame of a SpriteUtil's sheet scaled, flipped and rotated
+
+        Args:
+            sprite: SpriteUtil owning the sheet
+            sprite_rect: Frame rect on the sheet
+            size: Target (width, height), or None to keep the frame size
+            angle: Counter-clockwise rotation in degrees
+            flip: (flip_x, flip_y)
+
+        Returns:
+            pygame.Surface: The shared variant, or None if the frame is invalid
+        """
+        rect = tuple(int(value) for value in sprite_rect[:4])
+        size = None if size is None else (int(size[0]), int(size[1]))
+        angle = angle % 360
+        flip = (bool(flip[0]), bool(flip[1]))
+        if size is None and not angle and not any(flip):
+            return sprite.get_sprite(rect)
+
+        key = (sprite.sheet_path, rect, size, angle, flip)
+        with self._lock:
+            variant = self._variants.get(key)
+            if variant is not None:
+                self._variants.move_to_end(key)
+                self.hits += 1
+                return variant
+            self.misses += 1
+
+        frame = sprite.get_sprite(rect)
+        if frame is None:
+            return None
+        if size == frame.get_size():
+            size = None
+        variant = self.transform(frame, size, angle, flip)
+        self._store(key, variant)
+        return variant
+
+    @staticmethod
+    def transform(frame, size=None, angle=0, flip=(False, False)):
+        """Apply scale, flip and rotation to a frame, in that order"""
+        variant = frame
+        if size is not None:
+            variant = pygame.transform.scale(variant, size)
+        if flip[0] or flip[1]:
+            variant = pygame.transform.flip(variant, flip[0], flip[1])
+        if angle:
+            variant = pygame.transform.rotate(variant, angle)
+        return variant
+
+    def _store(self, key, variant):
+        size = self.surface_bytes(variant)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._variants.pop(key, None)
+            if previous is not None:
+                self._bytes -= self.surface_bytes(previous)
+            self._variants[key] = variant
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._variants.popitem(last=False)
+                self._bytes -= self.surface_bytes(evicted)
+                self.evictions += 1
+
+    def forget_sheets(self, sheet_paths):
+        """Drop every variant cut from the given sheets"""
+        sheet_paths = set(sheet_paths)
+        with self._lock:
+            for key in [key for key in self._variants if key[0] in sheet_paths]:
+                self._bytes -= self.surface_bytes(self._variants.pop(key))
+
+    def clear(self):
+        with self._lock:
+            self._variants.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return the cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'variants': len(self._variants),
+                'bytes_resident': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions
+            }
@@ -1,6 +1,7 @@
 import pygame
 import math
 from SpriteUtil.SpriteUtil import SpriteUtil
+from Utils.FontRegistry import FontRegistry
 
 class TurnIndicator:
     """Visual indicator for turn transitions"""
@@ -14,6 +15,8 @@ class TurnIndicator:
         (41, 64, 220, 196)
     ]
 
+    INDICATOR_SIZE = (50, 50)
+
 
     def __init__(self, screen):
         """Initialize the turn indicator
@@ -32,13 +35,13 @@ class TurnIndicator:
         self.max_alpha = 180  # Maximum transparency (0-255)
         
         # Text properties
-        self.font_large = pygame.font.SysFont('Arial', 48, bold=True)
-        self.font_small = pygame.font.SysFont('Arial', 24)
+        self.fonts = FontRegistry.get_instance()
         
         # Create surfaces
         self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.SPRITE_PATH = "./Assets/turn_indicator.png"
         self.sprite = SpriteUtil(self.SPRITE_PATH)
+        self.sprite.pre_slice(self.animation_frames)
         self.current_state = 0
         self.animation_tracker = 0
         self.total_turns = 0
@@ -105,8 +108,8 @@ class TurnIndicator:
         turn_text = f"{self.next_player.character_id}'s Turn"
         
         # Create text surfaces
-        turn_surface = self.font_large.render(turn_text, True, (255, 255, 255))
-        instruction_surface = self.font_small.render("Select a card to play", True, (200, 200, 200))
+        turn_surface = self.fonts.render(turn_text, 48, (255, 255, 255), bold=True)
+        instruction_surface = self.fonts.render("Select a card to play", 24, (200, 200, 200))
         
         # Calculate positions
         turn_pos = (self.width // 2 - turn_surface.get_width() // 2, 
@@ -128,10 +131,7 @@ class TurnIndicator:
             self.animation_tracker = 0
 
         animation_to_render = self.animation_frames[self.animation_tracker]
-        sprite_standing_image = self.sprite.get_sprite(animation_to_render)
-
-        
-        scaled_sprite_image = pygame.transform.scale(sprite_standing_image, (50, 50))
+        scaled_sprite_image = self.sprite.get_transformed(animation_to_render, self.INDICATOR_SIZE)
         sprite_standing_image_position = self.sprite.draw_sprite_image_at(
             scaled_sprite_image, 
             turn_indicator_position)  
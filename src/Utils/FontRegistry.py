@@ -0,0 +1,103 @@
+import threading
+from collections import OrderedDict
+import pygame
+
+
+class FontRegistry:
+    """
+    Shared fonts and rendered text for the HUD.
+
+    pygame.font.SysFont scans the system fonts on every call, and the HUD
+    used to call it every frame. The registry opens each (face, size, bold)
+    font once, and keeps the last MAX_TEXT_SURFACES rendered strings in an
+    LRU keyed by (font, text, color), so strings like "Turn 3", the deck
+    counts and the health numbers are only rendered again when they change.
+
+    The returned text surfaces are shared, so copy them before modifying
+    them in place (set_alpha included).
+    """
+
+    DEFAULT_FACE = 'Arial'
+    MAX_TEXT_SURFACES = 256
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_text_surfaces=MAX_TEXT_SURFACES):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self.max_text_surfaces = max_text_surfaces
+        self._fonts = {}  # (face, size, bold) -> pygame.font.Font
+        self._texts = OrderedDict()  # (face, size, bold, text, color) -> surface
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared font registry, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get_font(self, size, bold=False, face=DEFAULT_FACE):
+        """Return the system font for a face, size and weight, opening it on first use"""
+        key = (face, size, bool(bold))
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                font = pygame.font.SysFont(face, size, bold=bold)
+                self._fonts[key] = font
+            return font
+
+    def render(self, text, size, color, bold=False, face=DEFAULT_FACE):
+        """Return antialiased text, rendering it only the first time it is asked for
+
+        Args:
+            text: String to render
+            size: Font size
+            color: Text color
+            bold: Use the bold weight
+            face: System font name
+
+        Returns:
+            pygame.Surface: The shared text surface
+        """
+        key = (face, size, bool(bold), str(text), tuple(color))
+        with self._lock:
+            surface = self._texts.get(key)
+            if surface is not None:
+                self._texts.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+
+        surface = self.get_font(size, bold, face).render(key[3], True, color)
+        with self._lock:
+            self._texts[key] = surface
+            while len(self._texts) > self.max_text_surfaces:
+                self._texts.popitem(last=False)
+                self.evictions += 1
+        return surface
+
+    def clear(self):
+        with self._lock:
+            self._texts.clear()
+
+    def stats(self):
+        """Return the registry counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'fonts': len(self._fonts),
+                'text_surfaces': len(self._texts),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions
+            }
@@ -1,6 +1,7 @@
 import pygame
 from pygame.sprite import Sprite
 from SpriteUtil.SpriteUtil import SpriteUtil
+from Utils.FontRegistry import FontRegistry
 from Effects.DamageIndicator import DamageIndicator
 
 class HealthBar(SpriteUtil):
@@ -12,10 +13,13 @@ class HealthBar(SpriteUtil):
         487
     ]
 
+    HEALTH_BAR_BACKGROUND_SIZE = (40, 40)
+
     SPRITE_HEALTH_BACKGROUND_PATH = "./Assets/Health/health.png"
 
     def __init__(self, health, max_health, screen):
         self.sprite_health_background = SpriteUtil(self.SPRITE_HEALTH_BACKGROUND_PATH) 
+        self.sprite_health_background.pre_slice(self.HEALTH_BAR_BACKGROUND_DIMENSION)
         self.screen = screen
         self.health = health
         self.max_health = max_health
@@ -67,11 +71,10 @@ class HealthBar(SpriteUtil):
     def animate_health_background(self, position_to_draw = None):
         if self.animated_health_background:
            return 
-        sprite_health = self.sprite_health_background.get_sprite(self.HEALTH_BAR_BACKGROUND_DIMENSION)
         if position_to_draw is None:
             position_to_draw = (0,0)
 
-        sprite_health = pygame.transform.scale(sprite_health, (40,40))
+        sprite_health = self.sprite_health_background.get_transformed(self.HEALTH_BAR_BACKGROUND_DIMENSION, self.HEALTH_BAR_BACKGROUND_SIZE)
         coords_to_draw = self.sprite_health_background.draw_sprite_image_at(sprite_health, position_to_draw)
         self.screen.blit(sprite_health, coords_to_draw) 
 
@@ -80,8 +83,7 @@ class HealthBar(SpriteUtil):
         if position_to_draw is None:
             position_to_draw = (0,0)
             
-        health_font = pygame.font.SysFont('Arial', 24)
-        health_text = health_font.render(f'{self.health}', True, (255, 0, 0))        
+        health_text = FontRegistry.get_instance().render(f'{self.health}', 24, (255, 0, 0))
         text_position = (position_to_draw[0] + 30, position_to_draw[1] - 15)        
         self.screen.blit(health_text, text_position)
 
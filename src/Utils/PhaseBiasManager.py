@@ -145,7 +145,7 @@ class PhaseBiasManager:
             # Highlight targetable cards
             for card in self.target_cards:
                 if hasattr(card, 'rect') and card.rect:
-                    pygame.draw.rect(self.screen, self.highlight_color, card.rect, 3)
+                    self.screen.mark_dirty(pygame.draw.rect(self.screen, self.highlight_color, card.rect, 3))
                     
         elif self.selected_state is None:
             # Show state selection dialog
@@ -166,8 +166,8 @@ class PhaseBiasManager:
         self.screen.blit(dialog_surface, (dialog_x, dialog_y))
         
         # Draw border
-        pygame.draw.rect(self.screen, self.border_color, 
-                        (dialog_x, dialog_y, dialog_width, dialog_height), 2)
+        self.screen.mark_dirty(pygame.draw.rect(self.screen, self.border_color,
+                                                (dialog_x, dialog_y, dialog_width, dialog_height), 2))
         
         # Draw title
         title_text = f"Choose favored state for {self.selected_target.name}"
@@ -185,8 +185,8 @@ class PhaseBiasManager:
             button_rect = pygame.Rect(dialog_x + 20, button_y, dialog_width - 40, button_height)
             
             # Draw button background
-            pygame.draw.rect(self.screen, (50, 50, 50), button_rect)
-            pygame.draw.rect(self.screen, self.border_color, button_rect, 2)
+            self.screen.mark_dirty(pygame.draw.rect(self.screen, (50, 50, 50), button_rect))
+            self.screen.mark_dirty(pygame.draw.rect(self.screen, self.border_color, button_rect, 2))
             
             # Draw button text
             button_text = f"State {state}: {description}"
@@ -217,7 +217,7 @@ class PhaseBiasManager:
         self.screen.blit(bg_surface, bg_rect)
         
         # Draw border
-        pygame.draw.rect(self.screen, self.error_color, bg_rect, 2)
+        self.screen.mark_dirty(pygame.draw.rect(self.screen, self.error_color, bg_rect, 2))
         
         # Draw text
         self.screen.blit(error_surface, error_rect)
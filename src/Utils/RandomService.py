@@ -0,0 +1,136 @@
+import os
+import random
+import threading
+import zlib
+import numpy as np
+
+
+class RandomService:
+    """
+    Central source of randomness for the game.
+
+    A single master seed drives independent named child streams, so the
+    deck, the collapses and the particle effects each consume their own
+    sequence and adding draws to one subsystem does not shift the others.
+    The master seed comes from the DND_SEED environment variable when set,
+    otherwise from fresh OS entropy; reseed() reseeds every stream in place.
+
+    Stream names used by the game:
+        'game'       - initiative and other turn-level choices
+        'deck'       - deck building
+        'collapse'   - phase-biased collapses
+        'particles'  - particle and spell effects
+
+    Circuit sampling runs on the reservoir refill thread and the collapse
+    workers, so it does not draw from a shared stream. batch_sequence()
+    derives the seed of every batch from the master seed, the circuit shape
+    and how many batches of that shape came before, so the n-th batch
+    sampled for a circuit is the same whichever thread runs it. The NumPy
+    engines and the stabilizer sampler seed each circuit this way
+    ('collapse.numpy', 'collapse.statevector', 'collapse.stabilizer'), and
+    Aer jobs take simulator_seed() over the circuits of the job ('aer').
+
+    With DND_SEED fixed, the deck, the particles and every circuit's
+    outcome sequence repeat exactly. Not covered: an Aer job samples its
+    circuits from one seed, so a refill batching several circuits replays
+    only when the same circuits run low together; two collapses of the same
+    circuit in flight at once take their batches in the order they start;
+    and the 'collapse' stream is shared by the collapse workers.
+    """
+
+    ENV_VAR = 'DND_SEED'
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, seed=None):
+        self._python_streams = {}  # name -> random.Random
+        self._numpy_streams = {}   # name -> numpy Generator
+        self._batches = {}         # (name, circuit digest) -> batches handed out
+        self._lock = threading.Lock()
+        self.seed = None
+        self.reseed(seed)
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared service, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def reseed(self, seed=None):
+        """Set the master seed and reseed every existing stream in place
+
+        Args:
+            seed: Integer master seed. Defaults to DND_SEED, or fresh entropy
+                  when the variable is not set.
+        """
+        if seed is None:
+            env_seed = os.environ.get(self.ENV_VAR)
+            seed = int(env_seed) if env_seed else int(np.random.SeedSequence().entropy % (2 ** 63))
+        with self._lock:
+            self.seed = seed
+            self._batches.clear()
+            for name, stream in self._python_streams.items():
+                stream.seed(self._python_seed(name))
+            for name, generator in self._numpy_streams.items():
+                generator.bit_generator.state = np.random.PCG64(self._seed_sequence(name)).state
+
+    def _seed_sequence(self, name):
+        """Child seed sequence for a stream name"""
+        return np.random.SeedSequence([self.seed, zlib.crc32(name.encode('utf-8'))])
+
+    def _python_seed(self, name):
+        state = self._seed_sequence(name).generate_state(2, dtype=np.uint64)
+        return (int(state[0]) << 64) | int(state[1])
+
+    def stream(self, name):
+        """Return the random.Random stream for a subsystem"""
+        with self._lock:
+            stream = self._python_streams.get(name)
+            if stream is None:
+                stream = random.Random(self._python_seed(name))
+                self._python_streams[name] = stream
+        return stream
+
+    def numpy_stream(self, name):
+        """Return the NumPy Generator stream for a subsystem"""
+        with self._lock:
+            generator = self._numpy_streams.get(name)
+            if generator is None:
+                generator = np.random.Generator(np.random.PCG64(self._seed_sequence(name)))
+                self._numpy_streams[name] = generator
+        return generator
+
+    @staticmethod
+    def _key_digest(key):
+        return zlib.crc32(repr(key).encode('utf-8'))
+
+    def batch_sequence(self, name, keys):
+        """Seed sequence for the next batch sampled for the given circuit keys
+
+        Each (name, key) counts its own batches, so the seed does not depend
+        on the thread asking or on what else was sampled meanwhile.
+
+        Args:
+            name: Subsystem name
+            keys: Circuit keys (QuantumBackend.circuit_key) sampled in the batch
+        """
+        with self._lock:
+            entropy = [self.seed, zlib.crc32(name.encode('utf-8'))]
+            for key in keys:
+                digest = self._key_digest(key)
+                batch = self._batches.get((name, digest), 0)
+                self._batches[(name, digest)] = batch + 1
+                entropy.extend((digest, batch))
+        return np.random.SeedSequence(entropy)
+
+    def batch_generator(self, name, key):
+        """Return a NumPy Generator for the next batch sampled for one circuit key"""
+        return np.random.Generator(np.random.PCG64(self.batch_sequence(name, [key])))
+
+    def simulator_seed(self, keys):
+        """Return the seed to pass to the next AerSimulator job over the given circuit keys"""
+        return int(self.batch_sequence('aer', keys).generate_state(1, dtype=np.uint32)[0] >> 1)
@@ -0,0 +1,252 @@
+import os
+from contextlib import contextmanager
+import numpy as np
+import pygame
+from SpriteUtil.SurfaceFormat import SurfaceFormat
+
+
+class RenderPipeline:
+    """
+    Dirty-rectangle presentation of the game screen.
+
+    Everything in the game draws immediate-mode onto the screen it was
+    given, so rather than turning every object into a sprite the pipeline
+    hands out a TrackingSurface back buffer that records the rect of every
+    blit, fill and marked draw, tagged with the layer being drawn. Each
+    frame:
+        begin_frame - restores the background under last frame's rects
+        layer(name) - tags what the game draws next
+        present     - copies the changed regions to the display and pushes
+                      only them with pygame.display.update(rects)
+
+    Candidate regions are the merged rects of this frame and the previous
+    one, so things that moved away are cleared too. Most of the HUD is
+    redrawn with the same pixels every frame, so each candidate is narrowed
+    down to the TILE_SIZE tiles that differ from what the display already
+    shows, and only those are pushed. When more than
+    FULL_UPDATE_FRACTION of the screen changed (turn overlay, game over)
+    the whole frame is pushed in one go instead. Set DND_DIRTY_RECTS=0 to
+    push the whole frame every time.
+    """
+
+    LAYERS = ('background', 'weather', 'characters', 'cards', 'indicators', 'overlays')
+    FULL_UPDATE_FRACTION = 0.5
+    TILE_SIZE = 32
+
+    def __init__(self, display, background=None):
+        self.display = display
+        self.surface = TrackingSurface(display)
+        self.screen_rect = display.get_rect()
+        self.screen_pixels = self.screen_rect.width * self.screen_rect.height
+        self.enabled = os.environ.get('DND_DIRTY_RECTS', '1') != '0'
+        self.background = None
+        self._previous = []
+        self._full_redraw = True
+        if background is not None:
+            self.set_background(background)
+
+        # Counters
+        self.frames = 0
+        self.full_updates = 0
+        self.redrawn_pixels = 0
+        self.last_drawn_fraction = 1.0
+        self.last_redrawn_fraction = 1.0
+        self.last_layer_fractions = {}
+
+    def set_background(self, background):
+        """Use a screen-sized image as the background layer"""
+        self.background = background.convert()
+        self.invalidate()
+
+    def invalidate(self):
+        """Redraw and push the whole screen on the next frame"""
+        self._full_redraw = True
+
+    def begin_frame(self):
+        """Restore the background wherever the previous frame drew"""
+        self.surface.take_dirty()
+        self.surface.current_layer = 'background'
+        if self._full_redraw or not self.enabled:
+            self._blit_background(self.screen_rect)
+        else:
+            for rect in self._previous:
+                self._blit_background(rect)
+
+    @contextmanager
+    def layer(self, name):
+        """Tag everything drawn inside the block with a layer"""
+        if name not in self.LAYERS:
+            raise ValueError(f"Unknown layer {name!r}")
+        previous = self.surface.current_layer
+        self.surface.current_layer = name
+        try:
+            yield self.surface
+        finally:
+            self.surface.current_layer = previous
+
+    def present(self):
+        """Push the regions that changed this frame to the display"""
+        dirty = self.surface.take_dirty()
+        drawn = self.merge_rects([rect for _, rect in dirty])
+
+        layer_pixels = {}
+        for name, rect in dirty:
+            layer_pixels[name] = layer_pixels.get(name, 0) + rect.width * rect.height
+        self.last_layer_fractions = {name: min(1.0, pixels / self.screen_pixels)
+                                     for name, pixels in layer_pixels.items()}
+
+        if self._full_redraw or not self.enabled:
+            changed = [self.screen_rect]
+        else:
+            changed = self._differing(self.merge_rects(self._previous + drawn))
+        changed_pixels = min(self.screen_pixels, sum(rect.width * rect.height for rect in changed))
+        self.last_drawn_fraction = min(1.0, sum(rect.width * rect.height for rect in drawn) / self.screen_pixels)
+
+        if changed_pixels > self.FULL_UPDATE_FRACTION * self.screen_pixels:
+            self.display.blit(self.surface, (0, 0))
+            pygame.display.flip()
+            changed_pixels = self.screen_pixels
+            self.full_updates += 1
+        elif changed:
+            for rect in changed:
+                self.display.blit(self.surface, rect, rect)
+            pygame.display.update(changed)
+
+        self._previous = drawn
+        self._full_redraw = False
+        self.frames += 1
+        self.redrawn_pixels += changed_pixels
+        self.last_redrawn_fraction = changed_pixels / self.screen_pixels
+
+    def _differing(self, rects):
+        """Narrow rects down to the TILE_SIZE tiles that differ from the display"""
+        if self.surface.get_bytesize() != 4 or self.display.get_bytesize() != 4:
+            return rects
+        drawn = pygame.surfarray.pixels2d(self.surface)
+        shown = pygame.surfarray.pixels2d(self.display)
+        try:
+            differing = []
+            for rect in rects:
+                mask = (drawn[rect.left:rect.right, rect.top:rect.bottom]
+                        != shown[rect.left:rect.right, rect.top:rect.bottom])
+                if not mask.any():
+                    continue
+                if rect.width <= self.TILE_SIZE and rect.height <= self.TILE_SIZE:
+                    differing.append(rect)
+                    continue
+                differing.extend(self._tile_runs(rect, mask))
+            return differing
+        finally:
+            # Release the pixel arrays so both surfaces unlock
+            del drawn, shown
+
+    def _tile_runs(self, rect, mask):
+        """Cover the changed pixels of a rect with runs of whole tiles along each row"""
+        tile = self.TILE_SIZE
+        columns = -(-rect.width // tile)
+        rows = -(-rect.height // tile)
+        padded = np.zeros((columns * tile, rows * tile), dtype=bool)
+        padded[:rect.width, :rect.height] = mask
+        tiles = padded.reshape(columns, tile, rows, tile).any(axis=(1, 3))
+
+        runs = []
+        for row in range(rows):
+            column = 0
+            while column < columns:
+                if not tiles[column, row]:
+                    column += 1
+                    continue
+                start = column
+                while column < columns and tiles[column, row]:
+                    column += 1
+                run = pygame.Rect(rect.left + start * tile, rect.top + row * tile,
+                                  (column - start) * tile, tile)
+                runs.append(run.clip(rect))
+        return runs
+
+    def _blit_background(self, rect):
+        if self.background is None:
+            pygame.Surface.fill(self.surface, (0, 0, 0), rect)
+        else:
+            pygame.Surface.blit(self.surface, self.background, rect, rect)
+
+    @staticmethod
+    def merge_rects(rects):
+        """Union overlapping rects wherever the union covers no more than both
+
+        Rects that only clip each other's corner stay separate, so a dialog
+        touching the hand does not turn into one box around both.
+        """
+        merged = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            merging = True
+            while merging:
+                merging = False
+                for index in rect.collidelistall(merged):
+                    other = merged[index]
+                    union = rect.union(other)
+                    if union.width * union.height <= rect.width * rect.height + other.width * other.height:
+                        del merged[index]
+                        rect = union
+                        merging = True
+                        break
+            merged.append(rect)
+        return merged
+
+    def stats(self):
+        """Return the share of the screen pushed to the display"""
+        return {
+            'frames': self.frames,
+            'full_updates': self.full_updates,
+            'last_drawn_fraction': self.last_drawn_fraction,
+            'last_redrawn_fraction': self.last_redrawn_fraction,
+            'mean_redrawn_fraction': (self.redrawn_pixels / (self.frames * self.screen_pixels)
+                                      if self.frames else 0.0),
+            'layer_fractions': dict(self.last_layer_fractions),
+            'enabled': self.enabled
+        }
+
+
+class TrackingSurface(pygame.Surface):
+    """
+    Back buffer in the display's format that records what is drawn on it.
+
+    blit, blits and fill record the rect they touched under current_layer.
+    With DND_SURFACE_CHECK=1, blit also warns about non-native sources.
+    pygame.draw functions cannot be intercepted, so code drawing shapes
+    straight onto the screen passes the rect they return to mark_dirty.
+    """
+
+    def __init__(self, display):
+        super().__init__(display.get_size(), 0, display)
+        self.current_layer = 'background'
+        self._dirty = []  # (layer, rect) drawn this frame
+        self._surface_format = SurfaceFormat.get_instance()
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if self._surface_format.check_enabled:
+            self._surface_format.check_blit(source, self)
+        rect = super().blit(source, dest, area, special_flags)
+        return self.mark_dirty(rect)
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = super().blits(blit_sequence, True)
+        for rect in rects:
+            self.mark_dirty(rect)
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        filled = super().fill(color, rect, special_flags)
+        return self.mark_dirty(filled)
+
+    def mark_dirty(self, rect):
+        """Record a region drawn on this frame, returning it unchanged"""
+        if rect.width > 0 and rect.height > 0:
+            self._dirty.append((self.current_layer, rect))
+        return rect
+
+    def take_dirty(self):
+        """Return the regions drawn since the last call and forget them"""
+        dirty, self._dirty = self._dirty, []
+        return dirty
@@ -0,0 +1,139 @@
+import os
+import threading
+import pygame
+
+
+class SoundBank:
+    """
+    Shared store of decoded sounds with pooled mixer channels.
+
+    Spells and weathers are built once per card, so the same file used to be
+    decoded once per card. The bank decodes each file once and hands out
+    SharedSound objects that keep their own volume and play the shared
+    Sound on a free mixer channel. When every channel is busy, the sound
+    started longest ago is replaced. Looping weather ambience streams
+    through WeatherAmbience instead, so no channels are held back.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._sounds = {}  # absolute path -> pygame.mixer.Sound
+        self._lock = threading.Lock()
+        self._started = {}  # channel index -> play order
+        self._plays = 0
+
+        # Counters
+        self.requests = 0
+        self.decodes = 0
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared sound bank, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def load(self, path):
+        """Return a SharedSound for a sound file, decoding it on first use
+
+        Args:
+            path: Path of the sound file
+
+        Returns:
+            SharedSound: A handle with its own volume over the shared Sound
+        """
+        key = os.path.normcase(os.path.realpath(path))
+        with self._lock:
+            self.requests += 1
+            sound = self._sounds.get(key)
+            if sound is None:
+                sound = pygame.mixer.Sound(path)
+                self._sounds[key] = sound
+                self.decodes += 1
+        return SharedSound(self, sound)
+
+    def find_channel(self):
+        """Return the channel the next sound should play on"""
+        indices = range(pygame.mixer.get_num_channels())
+        for index in indices:
+            if not pygame.mixer.Channel(index).get_busy():
+                break
+        else:
+            # Every channel is busy, replace the one started longest ago
+            index = min(indices, key=lambda index: self._started.get(index, 0))
+        self._plays += 1
+        self._started[index] = self._plays
+        return pygame.mixer.Channel(index)
+
+    def pcm_bytes(self):
+        """Bytes of decoded PCM held by the bank"""
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return 0
+        frequency, sample_format, channels = mixer
+        bytes_per_frame = abs(sample_format) // 8 * channels
+        with self._lock:
+            return sum(int(round(sound.get_length() * frequency)) * bytes_per_frame
+                       for sound in self._sounds.values())
+
+    def stats(self):
+        """Return the bank counters and the decoded PCM memory"""
+        return {
+            'sounds': len(self._sounds),
+            'requests': self.requests,
+            'decodes': self.decodes,
+            'pcm_bytes': self.pcm_bytes()
+        }
+
+
+class SharedSound:
+    """A handle to a shared Sound with its own volume"""
+
+    def __init__(self, bank, sound):
+        self.bank = bank
+        self.sound = sound
+        self.volume = 1.0
+        self._channels = []
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for channel in self._playing_channels():
+            channel.set_volume(volume)
+
+    def get_volume(self):
+        return self.volume
+
+    def get_length(self):
+        return self.sound.get_length()
+
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        """Play on a free mixer channel
+
+        Returns:
+            pygame.mixer.Channel: The channel the sound plays on
+        """
+        channel = self.bank.find_channel()
+        channel.play(self.sound, loops, maxtime, fade_ms)
+        channel.set_volume(self.volume)
+        self._channels = self._playing_channels() + [channel]
+        return channel
+
+    def stop(self):
+        for channel in self._playing_channels():
+            channel.stop()
+        self._channels = []
+
+    def fadeout(self, time_ms):
+        for channel in self._playing_channels():
+            channel.fadeout(time_ms)
+
+    def get_num_channels(self):
+        return len(self._playing_channels())
+
+    def _playing_channels(self):
+        return [channel for channel in self._channels
+                if channel.get_busy() and channel.get_sound() is self.sound]
@@ -0,0 +1,119 @@
+import os
+import threading
+import pygame
+
+
+class WeatherAmbience:
+    """
+    Streams the weather ambience from disk through pygame.mixer.music.
+
+    The weather tracks run for minutes, so decoding them into Sounds kept
+    megabytes of PCM resident for every weather ever created. The music
+    stream decodes only a small buffer at a time. Weathers hold
+    AmbienceTrack handles that only store a path, so creating a weather
+    spell does not touch the file at all.
+
+    pygame has a single music stream, so two tracks cannot play at once.
+    A weather change fades the outgoing track out over FADE_MS and then
+    fades the incoming one in. The hand-over happens in update(), which the
+    WeatherManager calls every frame.
+    """
+
+    FADE_MS = 600
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.current = None  # AmbienceTrack on the music stream
+        self.pending = None  # (AmbienceTrack, loops) waiting for the fade-out to finish
+        self.fading_out = False
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared ambience player, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def track(self, path):
+        """Return a streamed track handle for a sound file"""
+        return AmbienceTrack(self, os.path.realpath(path))
+
+    def play(self, track, loops=0):
+        """Stream a track, fading out whatever is playing first"""
+        if not pygame.mixer.get_init():
+            return
+        if track is self.current and not self.fading_out and pygame.mixer.music.get_busy():
+            return
+        if self.current is not None and pygame.mixer.music.get_busy():
+            if not self.fading_out:
+                pygame.mixer.music.fadeout(self.FADE_MS)
+                self.fading_out = True
+            self.pending = (track, loops)
+            return
+        self._start(track, loops)
+
+    def stop(self, track):
+        """Fade a track out if it is playing or waiting to play"""
+        if self.pending is not None and self.pending[0] is track:
+            self.pending = None
+        if track is self.current and not self.fading_out and pygame.mixer.get_init():
+            pygame.mixer.music.fadeout(self.FADE_MS)
+            self.fading_out = True
+
+    def set_volume(self, track, volume):
+        if track is self.current and pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(volume)
+
+    def is_playing(self, track):
+        return (track is self.current and not self.fading_out
+                and pygame.mixer.get_init() and pygame.mixer.music.get_busy())
+
+    def update(self):
+        """Start the pending track once the previous one has faded out"""
+        if not self.fading_out or not pygame.mixer.get_init() or pygame.mixer.music.get_busy():
+            return
+        self.fading_out = False
+        self.current = None
+        if self.pending is not None:
+            track, loops = self.pending
+            self.pending = None
+            self._start(track, loops)
+
+    def _start(self, track, loops):
+        try:
+            pygame.mixer.music.load(track.path)
+        except pygame.error:
+            return
+        pygame.mixer.music.set_volume(track.volume)
+        pygame.mixer.music.play(loops, fade_ms=self.FADE_MS)
+        self.current = track
+        self.fading_out = False
+
+
+class AmbienceTrack:
+    """A streamed track with the play, stop and set_volume calls of a Sound"""
+
+    def __init__(self, ambience, path):
+        self.ambience = ambience
+        self.path = path
+        self.volume = 1.0
+
+    def play(self, loops=0):
+        self.ambience.play(self, loops)
+
+    def stop(self):
+        self.ambience.stop(self)
+
+    def set_volume(self, volume):
+        self.volume = volume
+        self.ambience.set_volume(self, volume)
+
+    def get_volume(self):
+        return self.volume
+
+    def get_busy(self):
+        return self.ambience.is_playing(self)
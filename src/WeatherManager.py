@@ -3,6 +3,7 @@ from Spells.ElementalWeather.Rain import Rain
 from Spells.ElementalWeather.WindTornado import WindTornado
 from Spells.ElementalWeather.Heatwave import HeatWave
 from Spells.ElementalWeather.Earthquake import Earthquake 
+from Utils.WeatherAmbience import WeatherAmbience
 
 class WeatherManager:
 
@@ -37,6 +38,8 @@ class WeatherManager:
         self.weather_spell.start()
 
     def animate_weather(self):
+        # Hand the music stream over to the next weather once the last one faded out
+        WeatherAmbience.get_instance().update()
         if (self.weather_spell != None):
             if self.is_weather_over():
                 self.stop_weather()